@@ -0,0 +1,53 @@
+import os
+from utils.registry import LazyRegistry
+
+# Adapters are imported when a file with their extension is first read, so pyarrow's
+# Parquet and IPC readers are only loaded for Arrow and Parquet inputs.
+_ARROW_ADAPTER = "adapters.arrow_adapter:ArrowAdapter"
+_ARROW_EXTENSIONS = (".parquet", ".pq", ".arrow", ".feather", ".ipc")
+
+GROUND_TRUTH_ADAPTERS = LazyRegistry("file format", {".json": "adapters.json_adapter:JSONAdapter",
+                                                     **dict.fromkeys(_ARROW_EXTENSIONS, _ARROW_ADAPTER)})
+MODEL_OUTPUT_ADAPTERS = LazyRegistry("file format", {".json": "adapters.streaming_json_adapter:StreamingJSONAdapter",
+                                                     **dict.fromkeys(_ARROW_EXTENSIONS, _ARROW_ADAPTER)})
+
+SUPPORTED_EXTENSIONS = tuple(GROUND_TRUTH_ADAPTERS.names())
+
+
+def _get_adapter(file_path: str, adapters: LazyRegistry):
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in adapters:
+        raise ValueError(f"Unsupported file format: {file_path}")
+    return adapters.create(extension, file_path)
+
+
+def get_ground_truth_adapter(file_path: str):
+    """
+    Creates the adapter matching the extension of a ground truth file.
+
+    Args:
+        file_path (str): Path to the ground truth file.
+
+    Returns:
+        BaseAdapter: An adapter implementing `to_row_store` and `get_total_cost`.
+
+    Raises:
+        ValueError: If the extension is not supported.
+    """
+    return _get_adapter(file_path, GROUND_TRUTH_ADAPTERS)
+
+
+def get_model_output_adapter(file_path: str):
+    """
+    Creates the adapter matching the extension of a model output file.
+
+    Args:
+        file_path (str): Path to the model output file.
+
+    Returns:
+        BaseAdapter: An adapter implementing `to_model_output_store`.
+
+    Raises:
+        ValueError: If the extension is not supported.
+    """
+    return _get_adapter(file_path, MODEL_OUTPUT_ADAPTERS)
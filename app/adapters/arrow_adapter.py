@@ -0,0 +1,199 @@
+import os
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from adapters.base_adapter import BaseAdapter
+from adapters.row_store import RowStore, NUMERIC_COLUMNS, CATEGORICAL_COLUMNS
+from adapters.validation import ROW_SCHEMA, PREDICTION_SCHEMA, ValidationReport, kept_segments
+
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+IPC_EXTENSIONS = (".arrow", ".feather", ".ipc")
+
+# Schema metadata key holding the total cost of a ground truth table.
+TOTAL_COST_METADATA_KEY = b"totalCostUsd"
+
+
+def _is_kind(data_type: pa.DataType, kind: str) -> bool:
+    """Whether an Arrow type holds values of a schema kind ("number" or "string")."""
+    if pa.types.is_dictionary(data_type):
+        data_type = data_type.value_type
+    if pa.types.is_null(data_type):
+        return True
+    if kind == "number":
+        return pa.types.is_integer(data_type) or pa.types.is_floating(data_type)
+    return pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+
+
+class ArrowAdapter(BaseAdapter):
+    """
+    Adapter for Arrow IPC (.arrow/.feather/.ipc) and Parquet files.
+
+    Files are memory-mapped and columns are read directly from the Arrow buffers, so
+    float64 columns without nulls are exposed to NumPy without copies.
+
+    Expected layout: one row per line item with the standard columns ('sectionName',
+    'qty', 'rateUsd', 'rowTotalCostUsd', 'label', 'uom', 'category'). Ground truth
+    tables may store 'totalCostUsd' in the schema metadata. Model output tables also
+    have 'prediction_id', 'valid_file_name' and 'time_to_estimate_sec' columns; rows of
+    the same prediction must be contiguous.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initializes the ArrowAdapter with the file path.
+
+        Args:
+            file_path (str): Path to the Arrow IPC or Parquet file.
+        """
+        self.file_path = file_path
+        self.table = self._load_table()
+        self.validation_report = None
+
+    def _load_table(self) -> pa.Table:
+        """
+        Memory-maps the file and reads it as an Arrow table.
+
+        Returns:
+            pa.Table: The table backed by the memory-mapped file.
+        """
+        if not os.path.exists(self.file_path):
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+
+        extension = os.path.splitext(self.file_path)[1].lower()
+        if extension in PARQUET_EXTENSIONS:
+            return pq.read_table(self.file_path, memory_map=True)
+        if extension in IPC_EXTENSIONS:
+            return ipc.open_file(pa.memory_map(self.file_path, "r")).read_all()
+        raise ValueError(f"Unsupported Arrow file extension: {self.file_path}")
+
+    def get_total_cost(self):
+        """
+        Returns the 'totalCostUsd' stored in the schema metadata, if any.
+
+        Returns:
+            float or None: The total cost of the ground truth.
+        """
+        metadata = self.table.schema.metadata or {}
+        if TOTAL_COST_METADATA_KEY not in metadata:
+            return None
+        return float(metadata[TOTAL_COST_METADATA_KEY])
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Converts the Arrow table into a Pandas DataFrame.
+
+        Returns:
+            pd.DataFrame: One row per line item.
+        """
+        return self.table.to_pandas()
+
+    def _numeric_column(self, name: str) -> np.ndarray:
+        """Returns a numeric column as float64 (NaN for nulls), zero-copy when possible."""
+        if name not in self.table.column_names:
+            return np.full(self.table.num_rows, np.nan)
+        column = self.table.column(name)
+        if column.type != pa.float64():
+            column = pc.cast(column, pa.float64())
+        if column.num_chunks == 1:
+            return column.chunk(0).to_numpy(zero_copy_only=False)
+        return column.to_numpy()
+
+    def _categorical_column(self, name: str) -> tuple:
+        """Dictionary-encodes a column into int64 codes (-1 for nulls) and its categories."""
+        if name not in self.table.column_names:
+            return np.full(self.table.num_rows, -1, dtype=np.int64), np.array([], dtype=object)
+        encoded = self.table.column(name).combine_chunks().dictionary_encode()
+        codes = pc.fill_null(encoded.indices, -1).to_numpy(zero_copy_only=False).astype(np.int64)
+        categories = np.asarray(encoded.dictionary.to_pylist(), dtype=object)
+        return codes, categories
+
+    def _build_store(self, offsets: np.ndarray, names: list, times: np.ndarray) -> RowStore:
+        numeric = {column: self._numeric_column(column) for column in NUMERIC_COLUMNS}
+        codes, categories = {}, {}
+        for column in CATEGORICAL_COLUMNS:
+            codes[column], categories[column] = self._categorical_column(column)
+        return RowStore(numeric, codes, categories, offsets, names, times)
+
+    def _validate(self, offsets: np.ndarray, report: ValidationReport):
+        """
+        Checks the columns against the model output schema using their Arrow types and
+        null counts; per-row masks are only computed for required columns with nulls or
+        floating point values.
+        """
+        n_rows = self.table.num_rows
+        row_predictions = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+        every_row = np.ones(n_rows, dtype=bool)
+        for column, (kind, required) in {**ROW_SCHEMA, **PREDICTION_SCHEMA}.items():
+            if column not in self.table.column_names:
+                if required:
+                    report.add_mask("missing_column", column, every_row, row_predictions,
+                                    f"'{column}' column is missing")
+                continue
+            data = self.table.column(column)
+            if not _is_kind(data.type, kind):
+                report.add_mask("type", column, every_row, row_predictions,
+                                f"'{column}' must be a {kind}, found {data.type}")
+                continue
+            if required and data.null_count:
+                report.add_mask("null", column, data.is_null().to_numpy(), row_predictions,
+                                f"'{column}' is null or missing")
+            if required and pa.types.is_floating(data.type):
+                non_finite = pc.invert(pc.fill_null(pc.is_finite(data), True)).to_numpy()
+                report.add_mask("non_finite", column, non_finite, row_predictions, f"'{column}' must be finite")
+
+    def to_row_store(self) -> RowStore:
+        """
+        Converts a ground truth table into a RowStore straight from the Arrow columns.
+
+        Returns:
+            RowStore: The ground truth rows as a single segment.
+        """
+        offsets = np.array([0, self.table.num_rows], dtype=np.int64)
+        return self._build_store(offsets, [None], np.array([np.nan]))
+
+    def to_model_output_store(self, validation: str = "lenient") -> RowStore:
+        """
+        Converts a model output table into a RowStore with one segment per prediction.
+        Segment boundaries are the positions where 'prediction_id' changes.
+
+        The columns are checked against the model output schema before any value is
+        converted (see `adapters.validation`); the report of the check is kept in
+        `validation_report`.
+
+        Args:
+            validation (str): "lenient" to drop the predictions not matching the schema,
+                or "strict" to reject the file when any prediction does not match it.
+
+        Returns:
+            RowStore: The rows of every valid prediction. Segment names hold the
+                      'valid_file_name' and segment times the 'time_to_estimate_sec'.
+
+        Raises:
+            ValueError: If a required model output column is missing.
+            SchemaValidationError: If the predictions are rejected by the validation.
+        """
+        required_columns = ["prediction_id", "valid_file_name", "time_to_estimate_sec"]
+        missing_columns = [column for column in required_columns if column not in self.table.column_names]
+        if missing_columns:
+            raise ValueError(f"Invalid model output file: columns {missing_columns} not found in {self.file_path}")
+
+        prediction_ids = self.table.column("prediction_id").to_numpy()
+        if len(prediction_ids):
+            starts = np.flatnonzero(np.r_[True, prediction_ids[1:] != prediction_ids[:-1]])
+        else:
+            starts = np.array([], dtype=np.int64)
+        offsets = np.append(starts, self.table.num_rows).astype(np.int64)
+
+        self.validation_report = ValidationReport(self.file_path, validation)
+        self.validation_report.n_predictions = len(starts)
+        self.validation_report.n_rows = self.table.num_rows
+        self._validate(offsets, self.validation_report)
+        segments = kept_segments(self.validation_report, range(len(starts)))
+
+        names = self.table.column("valid_file_name").take(pa.array(starts)).to_pylist()
+        times = self._numeric_column("time_to_estimate_sec")[starts]
+        store = self._build_store(offsets, names, times)
+        return store if segments is None else store.take_segments(segments)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 import pandas as pd
+from adapters.row_store import RowStore
 
 class BaseAdapter(ABC):
     """Abstract base class for adapters that transform data into a standardized format."""
@@ -13,3 +14,24 @@ class BaseAdapter(ABC):
             pd.DataFrame: The transformed dataset.
         """
         pass
+
+    def to_row_store(self) -> RowStore:
+        """
+        Converts the input data into a columnar RowStore.
+
+        Adapters that can build the store without an intermediate DataFrame should
+        override this method.
+
+        Returns:
+            RowStore: The transformed dataset as a single segment.
+        """
+        return RowStore.from_dataframe(self.to_dataframe())
+
+    def get_total_cost(self):
+        """
+        Returns the total cost declared by the input data, if any.
+
+        Returns:
+            float or None: The declared total cost, or None when the data has none.
+        """
+        return None
@@ -2,6 +2,8 @@ import os
 import json
 import pandas as pd
 from adapters.base_adapter import BaseAdapter
+from adapters.row_store import RowStore
+from adapters.validation import build_model_output_store
 
 class JSONAdapter(BaseAdapter):
     """
@@ -9,15 +11,18 @@ class JSONAdapter(BaseAdapter):
     or extract model outputs when the JSON represents model output data.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, data: dict = None):
         """
         Initializes the JSONAdapter with the file path.
 
         Args:
             file_path (str): Path to the JSON file.
+            data (dict, optional): Already parsed JSON data (e.g. received over HTTP). When
+                given, the file is not read and `file_path` only names the data in messages.
         """
         self.file_path = file_path
-        self.data = self._load_json()
+        self.data = self._load_json() if data is None else data
+        self.validation_report = None
 
     def _load_json(self) -> dict:
         """
@@ -51,6 +56,27 @@ class JSONAdapter(BaseAdapter):
             raise ValueError(f"Invalid JSON format: 'rows' key missing in {self.file_path}")
         return pd.DataFrame(self.data["rows"])
 
+    def get_total_cost(self):
+        """
+        Returns the 'totalCostUsd' of a ground truth file, if present.
+
+        Returns:
+            float or None: The declared total cost.
+        """
+        return self.data.get("totalCostUsd")
+
+    def to_row_store(self) -> RowStore:
+        """
+        Converts the 'rows' of a ground truth file into a RowStore without building
+        a DataFrame.
+
+        Returns:
+            RowStore: The ground truth rows as a single segment.
+        """
+        if "rows" not in self.data:
+            raise ValueError(f"Invalid JSON format: 'rows' key missing in {self.file_path}")
+        return RowStore.from_rows(self.data["rows"])
+
     def to_model_outputs(self) -> list:
         """
         Converts a model output JSON file into a list of outputs. The expected model output JSON
@@ -91,3 +117,31 @@ class JSONAdapter(BaseAdapter):
                 "time_to_estimate_sec": pred["time_to_estimate_sec"]
             })
         return outputs
+
+    def to_model_output_store(self, validation: str = "lenient") -> RowStore:
+        """
+        Converts a model output JSON file into a RowStore built in a single pass,
+        with one segment per prediction. The predictions are checked against the model
+        output schema first (see `adapters.validation`); the report of the check is kept
+        in `validation_report`.
+
+        Args:
+            validation (str): "lenient" to drop the predictions not matching the schema,
+                or "strict" to reject the file when any prediction does not match it.
+
+        Returns:
+            RowStore: The rows of every valid prediction. Segment names hold the
+                      'valid_file_name' and segment times the 'time_to_estimate_sec'.
+
+        Raises:
+            ValueError: If the file has no 'estimate_preds' list.
+            SchemaValidationError: If the predictions are rejected by the validation.
+        """
+        if "estimate_preds" not in self.data:
+            raise ValueError(f"Invalid model output file: 'estimate_preds' key not found in {self.file_path}")
+        if not isinstance(self.data["estimate_preds"], list):
+            raise ValueError(f"Invalid model output file: 'estimate_preds' is not a list in {self.file_path}")
+
+        store, self.validation_report = build_model_output_store(self.data["estimate_preds"], self.file_path,
+                                                                 validation)
+        return store
@@ -0,0 +1,276 @@
+import numpy as np
+import pandas as pd
+
+NUMERIC_COLUMNS = ("qty", "rateUsd", "rowTotalCostUsd")
+CATEGORICAL_COLUMNS = ("sectionName", "category", "uom", "label")
+
+
+class RowStore:
+    """
+    Compact columnar representation of line-item rows.
+
+    Rows are grouped in consecutive segments (one per ground truth file or one per
+    model prediction). Numeric columns are stored as float64 arrays, categorical
+    columns as integer codes into a list of categories (-1 for missing values), and
+    `offsets` marks where each segment starts and ends.
+
+    Attributes:
+        numeric (dict): Maps each numeric column to a float64 array.
+        codes (dict): Maps each categorical column to an int64 array of codes.
+        categories (dict): Maps each categorical column to the array of its distinct values.
+        offsets (np.ndarray): Array of length n_segments + 1; segment i spans rows
+            offsets[i]:offsets[i + 1].
+        names (list): Name of each segment ('valid_file_name' or ground truth name).
+        times (np.ndarray): 'time_to_estimate_sec' of each segment (NaN when unknown).
+    """
+
+    def __init__(self, numeric: dict, codes: dict, categories: dict, offsets: np.ndarray,
+                 names: list, times: np.ndarray):
+        self.numeric = numeric
+        self.codes = codes
+        self.categories = categories
+        self.offsets = offsets
+        self.names = names
+        self.times = times
+
+    @property
+    def n_rows(self) -> int:
+        """Total number of rows in the store."""
+        return int(self.offsets[-1])
+
+    @property
+    def n_segments(self) -> int:
+        """Number of segments in the store."""
+        return len(self.offsets) - 1
+
+    @classmethod
+    def from_rows(cls, rows: list, name: str = None, time: float = np.nan) -> "RowStore":
+        """
+        Builds a single-segment store from a list of row dictionaries.
+
+        Args:
+            rows (list): Row dictionaries, as found under the 'rows' key.
+            name (str, optional): Name of the segment.
+            time (float, optional): Time taken to generate the rows.
+
+        Returns:
+            RowStore: The columnar rows.
+        """
+        builder = RowStoreBuilder()
+        builder.add_segment(rows, name, time)
+        return builder.build()
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, name: str = None, time: float = np.nan) -> "RowStore":
+        """
+        Builds a single-segment store from a DataFrame of rows.
+
+        Args:
+            df (pd.DataFrame): Rows with the standard line-item columns.
+            name (str, optional): Name of the segment.
+            time (float, optional): Time taken to generate the rows.
+
+        Returns:
+            RowStore: The columnar rows.
+        """
+        n_rows = len(df)
+        numeric = {
+            column: (pd.to_numeric(df[column]).to_numpy(dtype=np.float64, na_value=np.nan)
+                     if column in df.columns else np.full(n_rows, np.nan))
+            for column in NUMERIC_COLUMNS
+        }
+        codes, categories = {}, {}
+        for column in CATEGORICAL_COLUMNS:
+            values = df[column].to_numpy(dtype=object) if column in df.columns else np.full(n_rows, None, dtype=object)
+            codes[column], categories[column] = _factorize(values)
+        return cls(numeric, codes, categories, np.array([0, n_rows], dtype=np.int64),
+                   [name], np.array([time], dtype=np.float64))
+
+    @classmethod
+    def concat(cls, stores: list) -> "RowStore":
+        """
+        Concatenates several stores, merging the categories of each categorical column.
+
+        Args:
+            stores (list): RowStore instances.
+
+        Returns:
+            RowStore: A store holding every segment of the input stores, in order.
+        """
+        if not stores:
+            return RowStoreBuilder().build()
+        numeric = {column: np.concatenate([store.numeric[column] for store in stores])
+                   for column in NUMERIC_COLUMNS}
+        codes, categories = {}, {}
+        for column in CATEGORICAL_COLUMNS:
+            merged = {}
+            remapped = []
+            for store in stores:
+                lookup = np.array([merged.setdefault(value, len(merged)) for value in store.categories[column]] + [-1],
+                                  dtype=np.int64)
+                # Code -1 indexes the trailing -1, so missing values stay missing.
+                remapped.append(lookup[store.codes[column]])
+            codes[column] = np.concatenate(remapped)
+            categories[column] = np.array(list(merged), dtype=object)
+        lengths = np.concatenate([np.diff(store.offsets) for store in stores])
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        names = [name for store in stores for name in store.names]
+        times = np.concatenate([store.times for store in stores])
+        return cls(numeric, codes, categories, offsets, names, times)
+
+    def take_segments(self, indices) -> "RowStore":
+        """
+        Selects segments by position, in the given order (repetitions allowed).
+        Categories are shared with this store.
+
+        Args:
+            indices (array-like): Positions of the segments to select.
+
+        Returns:
+            RowStore: A store with the selected segments.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self.offsets[indices]
+        lengths = self.offsets[indices + 1] - starts
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        row_index = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        return RowStore(
+            {column: values[row_index] for column, values in self.numeric.items()},
+            {column: codes[row_index] for column, codes in self.codes.items()},
+            self.categories,
+            offsets,
+            [self.names[i] for i in indices],
+            self.times[indices],
+        )
+
+    def segment_ids(self) -> np.ndarray:
+        """Returns, for each row, the position of the segment it belongs to."""
+        return np.repeat(np.arange(self.n_segments), np.diff(self.offsets))
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Returns the values of a column, decoding categorical columns.
+
+        Args:
+            name (str): Column name.
+
+        Returns:
+            np.ndarray: The column values (None for missing categorical values).
+        """
+        if name in self.numeric:
+            return self.numeric[name]
+        categories = np.append(self.categories[name], None)
+        return categories[self.codes[name]]
+
+    def section_totals(self, value_column: str = "rowTotalCostUsd") -> pd.Series:
+        """
+        Sums a numeric column per 'sectionName' in a single vectorized pass.
+
+        Equivalent to `df.groupby("sectionName")[value_column].sum()`: rows without a
+        section are dropped, missing values count as zero and the index is sorted.
+
+        Args:
+            value_column (str): Numeric column to sum.
+
+        Returns:
+            pd.Series: Totals indexed by section name.
+        """
+        codes = self.codes["sectionName"]
+        present = codes >= 0
+        codes = codes[present]
+        values = np.nan_to_num(self.numeric[value_column][present], nan=0.0)
+        n_categories = len(self.categories["sectionName"])
+        totals = np.bincount(codes, weights=values, minlength=n_categories)
+        counts = np.bincount(codes, minlength=n_categories)
+        seen = counts > 0
+        return pd.Series(totals[seen], index=self.categories["sectionName"][seen],
+                         name=value_column).sort_index()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Converts the store back into a DataFrame of rows.
+
+        Returns:
+            pd.DataFrame: One row per line item with the standard columns.
+        """
+        data = {column: self.column(column) for column in CATEGORICAL_COLUMNS}
+        data.update(self.numeric)
+        return pd.DataFrame(data)
+
+
+class RowStoreBuilder:
+    """Accumulates row dictionaries segment by segment and builds a RowStore in one pass."""
+
+    def __init__(self):
+        self._values = {column: [] for column in NUMERIC_COLUMNS + CATEGORICAL_COLUMNS}
+        self._lengths = []
+        self._names = []
+        self._times = []
+
+    def add_segment(self, rows: list, name: str = None, time: float = np.nan):
+        """
+        Appends a segment of rows.
+
+        Args:
+            rows (list): Row dictionaries.
+            name (str, optional): Name of the segment.
+            time (float, optional): Time taken to generate the rows.
+        """
+        for column, values in self._values.items():
+            values.extend([row.get(column) for row in rows])
+        self._lengths.append(len(rows))
+        self._names.append(name)
+        self._times.append(time)
+
+    @property
+    def values(self) -> dict:
+        """Maps each column to the raw values of every accumulated row (None when absent)."""
+        return self._values
+
+    @property
+    def lengths(self) -> list:
+        """Number of rows of each segment."""
+        return self._lengths
+
+    @property
+    def names(self) -> list:
+        """Name of each segment."""
+        return self._names
+
+    @property
+    def times(self) -> list:
+        """Raw time of each segment, as given to `add_segment`."""
+        return self._times
+
+    def build(self, segments=None) -> RowStore:
+        """
+        Builds the RowStore from the accumulated segments.
+
+        Args:
+            segments (array-like, optional): Positions of the segments to keep, in increasing
+                order. Defaults to every segment. Rows of the other segments are dropped before
+                their values are converted.
+
+        Returns:
+            RowStore: The columnar rows.
+        """
+        values, lengths, names, times = self._values, self._lengths, self._names, self._times
+        if segments is not None:
+            segments = np.asarray(segments, dtype=np.int64)
+            keep = np.repeat(np.isin(np.arange(len(lengths)), segments), lengths)
+            values = {column: np.asarray(column_values, dtype=object)[keep] for column, column_values in values.items()}
+            lengths = np.asarray(lengths, dtype=np.int64)[segments]
+            names = [names[i] for i in segments]
+            times = [times[i] for i in segments]
+        numeric = {column: np.array(values[column], dtype=np.float64) for column in NUMERIC_COLUMNS}
+        codes, categories = {}, {}
+        for column in CATEGORICAL_COLUMNS:
+            codes[column], categories[column] = _factorize(values[column])
+        offsets = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)]).astype(np.int64)
+        return RowStore(numeric, codes, categories, offsets, list(names), np.array(times, dtype=np.float64))
+
+
+def _factorize(values) -> tuple:
+    """Encodes values as int64 codes (-1 for missing) and the array of distinct values."""
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    return codes.astype(np.int64), np.asarray(uniques, dtype=object)
@@ -0,0 +1,187 @@
+import os
+import json
+import pandas as pd
+from adapters.base_adapter import BaseAdapter
+from adapters.row_store import RowStore
+from adapters.validation import build_model_output_store
+
+# Characters that can follow a complete JSON number.
+NUMBER_DELIMITERS = ",]} \t\n\r"
+
+
+class _JSONStreamReader:
+    """
+    Incremental reader over a JSON text file.
+
+    Keeps only a sliding window of the file in memory and decodes one JSON value at a
+    time with `json.JSONDecoder.raw_decode`, reading more of the file whenever a value
+    does not fit in the current window.
+    """
+
+    def __init__(self, file, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _read_more(self, size: int) -> bool:
+        """Appends up to `size` characters to the window, discarding consumed text."""
+        if self.eof:
+            return False
+        chunk = self.file.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Returns the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\n\r":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read_more(self.chunk_size):
+                return ""
+
+    def expect(self, char: str):
+        """Consumes the next non-whitespace character, which must be `char`."""
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def decode(self):
+        """Decodes and consumes the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # The value is incomplete: grow the window geometrically so a large value
+                # is re-scanned only O(log(size)) times.
+                if not self._read_more(max(self.chunk_size, len(self.buffer) - self.pos)):
+                    raise
+                continue
+            # A number is only complete when a delimiter follows it: one cut at the end of the
+            # window (possibly right after its '.' or 'e') may continue in the next chunk.
+            if (isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and (end == len(self.buffer) or self.buffer[end] not in NUMBER_DELIMITERS)
+                    and self._read_more(self.chunk_size)):
+                continue
+            self.pos = end
+            return value
+
+
+class StreamingJSONAdapter(BaseAdapter):
+    """
+    Adapter that reads a JSON object incrementally and streams the elements of the array
+    under one of its keys ('estimate_preds' for model outputs, 'rows' for ground truth
+    files) one at a time, without materializing the whole document. Used for very large
+    model output files.
+    """
+
+    def __init__(self, file_path: str, chunk_size: int = 1 << 16):
+        """
+        Initializes the StreamingJSONAdapter with the file path.
+
+        Args:
+            file_path (str): Path to the JSON file.
+            chunk_size (int): Number of characters read from the file at a time.
+        """
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.validation_report = None
+        if not os.path.exists(self.file_path):
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+
+    def iter_array(self, key: str):
+        """
+        Yields the elements of the array stored under a top-level key, one at a time.
+
+        Other top-level values are decoded and discarded as they are found.
+
+        Args:
+            key (str): Top-level key holding the array.
+
+        Yields:
+            object: Each decoded element of the array.
+
+        Raises:
+            ValueError: If the key is not present in the top-level object.
+            json.JSONDecodeError: If the file is not valid JSON.
+        """
+        with open(self.file_path, "r", encoding="utf-8") as file:
+            reader = _JSONStreamReader(file, self.chunk_size)
+            reader.expect("{")
+            while True:
+                char = reader.peek()
+                if char == "}" or char == "":
+                    raise ValueError(f"Invalid JSON format: '{key}' key missing in {self.file_path}")
+                if char == ",":
+                    reader.pos += 1
+                    continue
+                name = reader.decode()
+                reader.expect(":")
+                if name != key:
+                    reader.decode()
+                    continue
+                reader.expect("[")
+                while True:
+                    char = reader.peek()
+                    if char == "]":
+                        return
+                    if char == ",":
+                        reader.pos += 1
+                        continue
+                    yield reader.decode()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Converts the 'rows' array of a ground truth file into a Pandas DataFrame,
+        reading the rows incrementally.
+
+        Returns:
+            pd.DataFrame: A DataFrame built from the 'rows' key.
+        """
+        return pd.DataFrame(list(self.iter_array("rows")))
+
+    def to_row_store(self) -> RowStore:
+        """
+        Converts the 'rows' array of a ground truth file into a RowStore, reading the
+        rows incrementally.
+
+        Returns:
+            RowStore: The ground truth rows as a single segment.
+        """
+        return RowStore.from_rows(list(self.iter_array("rows")))
+
+    def to_model_output_store(self, validation: str = "lenient") -> RowStore:
+        """
+        Streams the predictions of a model output file into a RowStore built in a
+        single pass, with one segment per prediction. No DataFrame is created and
+        each raw prediction is released once its rows are appended.
+
+        The predictions are checked against the model output schema before the store
+        is built (see `adapters.validation`); the report of the check is kept in
+        `validation_report`.
+
+        Args:
+            validation (str): "lenient" to drop the predictions not matching the schema,
+                or "strict" to reject the file when any prediction does not match it.
+
+        Returns:
+            RowStore: The rows of every valid prediction. Segment names hold the
+                      'valid_file_name' and segment times the 'time_to_estimate_sec'.
+
+        Raises:
+            ValueError: If the file has no 'estimate_preds' key.
+            SchemaValidationError: If the predictions are rejected by the validation.
+        """
+        store, self.validation_report = build_model_output_store(self.iter_array("estimate_preds"), self.file_path,
+                                                                 validation)
+        return store
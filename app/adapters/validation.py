@@ -0,0 +1,311 @@
+import numpy as np
+from adapters.row_store import RowStoreBuilder
+
+# Schema validation of model outputs. Each column is checked across all the rows of a
+# file at once, before any value is converted: the set of Python types found in a column
+# is computed first, and per-row masks are only built for the columns holding values of
+# an unexpected type.
+
+REQUIRED_PREDICTION_KEYS = ("valid_file_name", "rows", "time_to_estimate_sec")
+
+# Expected kind of each column, and whether every row (or prediction) must have a value.
+ROW_SCHEMA = {
+    "sectionName": ("string", True),
+    "rowTotalCostUsd": ("number", True),
+    "qty": ("number", False),
+    "rateUsd": ("number", False),
+    "label": ("string", False),
+    "uom": ("string", False),
+    "category": ("string", False),
+}
+PREDICTION_SCHEMA = {
+    "valid_file_name": ("string", True),
+    "time_to_estimate_sec": ("number", True),
+}
+
+# Python types accepted for each kind (bool is not a number, even though it is an int).
+KIND_TYPES = {"number": frozenset((int, float)), "string": frozenset((str,))}
+
+# Number of prediction positions listed as examples of each problem.
+MAX_EXAMPLES = 5
+
+_NONE_TYPE = type(None)
+
+
+class SchemaValidationError(ValueError):
+    """A model output rejected by the schema validation, with the report of its problems."""
+
+    def __init__(self, report: "ValidationReport"):
+        super().__init__(report.summary())
+        self.report = report
+
+    def __reduce__(self):
+        # Keeps the report when the error is sent back by a worker process.
+        return type(self), (self.report,)
+
+
+class ValidationReport:
+    """
+    Problems found by the schema validation of one model output file.
+
+    Problems are grouped by check and column. Each problem counts the affected values
+    (rows, or predictions for prediction-level checks) and keeps the positions of the
+    affected predictions in the file.
+
+    Attributes:
+        source (str): Name of the validated file.
+        mode (str): Validation mode ("lenient" or "strict").
+        n_predictions (int): Number of predictions in the file.
+        n_rows (int): Number of rows of the predictions that could be read.
+        problems (dict): Maps (check, column) to the problem's 'count', 'predictions'
+            (set of positions) and 'message'.
+    """
+
+    def __init__(self, source: str, mode: str = "lenient"):
+        self.source = source
+        self.mode = mode
+        self.n_predictions = 0
+        self.n_rows = 0
+        self.problems = {}
+
+    @property
+    def valid(self) -> bool:
+        """Whether no problem was found."""
+        return not self.problems
+
+    @property
+    def invalid_predictions(self) -> set:
+        """Positions of the predictions with at least one problem."""
+        return set().union(*(problem["predictions"] for problem in self.problems.values()))
+
+    def add(self, check: str, column: str, predictions, count: int, message: str):
+        """
+        Records a problem, merging it with previous problems of the same check and column.
+
+        Args:
+            check (str): Name of the check ('not_an_object', 'missing_key', 'missing_column',
+                'null', 'type' or 'non_finite').
+            column (str): Column or key checked (None for the prediction itself).
+            predictions (iterable): Positions of the affected predictions.
+            count (int): Number of affected values.
+            message (str): Description of the problem.
+        """
+        problem = self.problems.setdefault((check, column), {"count": 0, "predictions": set(), "message": message})
+        problem["count"] += int(count)
+        problem["predictions"].update(int(position) for position in predictions)
+
+    def add_mask(self, check: str, column: str, mask: np.ndarray, value_predictions: np.ndarray, message: str):
+        """
+        Records a problem affecting the values selected by a boolean mask, if any.
+
+        Args:
+            check (str): Name of the check (see `add`).
+            column (str): Column checked.
+            mask (np.ndarray): Boolean mask over the values of the column.
+            value_predictions (np.ndarray): Position of the prediction of each value.
+            message (str): Description of the problem.
+        """
+        count = int(np.count_nonzero(mask))
+        if count:
+            self.add(check, column, np.unique(value_predictions[mask]), count, message)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the report as a JSON-serializable dictionary.
+
+        Returns:
+            dict: 'file', 'mode', 'valid', 'predictions', 'rows', 'invalid_predictions' and
+                  'errors', with one entry per problem: 'check', 'column', 'count',
+                  'predictions' (number of affected predictions), 'examples' (positions of
+                  the first ones) and 'message'.
+        """
+        errors = [{"check": check, "column": column, "count": problem["count"],
+                   "predictions": len(problem["predictions"]),
+                   "examples": sorted(problem["predictions"])[:MAX_EXAMPLES], "message": problem["message"]}
+                  for (check, column), problem in self.problems.items()]
+        return {"file": self.source, "mode": self.mode, "valid": self.valid, "predictions": self.n_predictions,
+                "rows": self.n_rows, "invalid_predictions": len(self.invalid_predictions), "errors": errors}
+
+    def summary(self) -> str:
+        """Describes the problems in one line, e.g. for log messages."""
+        if self.valid:
+            return f"'{self.source}' matches the model output schema."
+        details = "; ".join(f"{error['message']} ({error['count']} value(s), predictions {error['examples']}"
+                            f"{'...' if error['predictions'] > MAX_EXAMPLES else ''})"
+                            for error in self.to_dict()["errors"])
+        return (f"'{self.source}' has {len(self.invalid_predictions)} of {self.n_predictions} predictions "
+                f"not matching the model output schema: {details}")
+
+
+def check_column(report: ValidationReport, column: str, values: list, kind: str, required: bool,
+                 value_predictions: np.ndarray):
+    """
+    Checks the Python values of a column, across all the rows of a file at once.
+
+    Values must be of the column's kind or None; None is a problem for required columns,
+    and so are non-finite numbers (NaN or infinity).
+
+    Args:
+        report (ValidationReport): Report receiving the problems.
+        column (str): Column name.
+        values (list): Value of each row (None when missing).
+        kind (str): "number" or "string".
+        required (bool): Whether every row must have a value.
+        value_predictions (np.ndarray): Position of the prediction of each value.
+    """
+    types = set(map(type, values))
+    allowed = KIND_TYPES[kind]
+    unexpected = types - allowed - {_NONE_TYPE}
+    valid = None
+    if unexpected or (required and _NONE_TYPE in types):
+        row_types = np.fromiter(map(type, values), dtype=object, count=len(values))
+        null = row_types == _NONE_TYPE
+        valid = np.zeros(len(values), dtype=bool)
+        for value_type in types & allowed:
+            valid |= row_types == value_type
+        if required:
+            report.add_mask("null", column, null, value_predictions, f"'{column}' is null or missing")
+        if unexpected:
+            found = ", ".join(sorted(value_type.__name__ for value_type in unexpected))
+            report.add_mask("type", column, ~(valid | null), value_predictions,
+                            f"'{column}' must be a {kind}, found {found}")
+    if required and kind == "number" and float in types:
+        numbers = np.asarray(values, dtype=object)[valid] if valid is not None else values
+        non_finite = ~np.isfinite(np.array(numbers, dtype=np.float64))
+        if valid is not None:
+            non_finite = _expand(non_finite, valid)
+        report.add_mask("non_finite", column, non_finite, value_predictions, f"'{column}' must be finite")
+
+
+def _expand(mask: np.ndarray, selection: np.ndarray) -> np.ndarray:
+    """Maps a mask over the selected values back onto all the values."""
+    expanded = np.zeros(len(selection), dtype=bool)
+    expanded[selection] = mask
+    return expanded
+
+
+def check_prediction(report: ValidationReport, prediction, position: int) -> bool:
+    """
+    Checks the structure of a single prediction: an object with every required key and
+    a list of row objects under 'rows'. The values of the keys are checked per file by
+    `validate_builder`.
+
+    Args:
+        report (ValidationReport): Report receiving the problems.
+        prediction (object): Decoded prediction.
+        position (int): Position of the prediction in the file.
+
+    Returns:
+        bool: Whether the rows of the prediction can be read.
+    """
+    if type(prediction) is not dict:
+        report.add("not_an_object", None, [position], 1, "predictions must be objects")
+        return False
+    missing_keys = [key for key in REQUIRED_PREDICTION_KEYS if key not in prediction]
+    for key in missing_keys:
+        report.add("missing_key", key, [position], 1, f"predictions must have '{key}'")
+    if missing_keys:
+        return False
+    rows = prediction["rows"]
+    if type(rows) is not list:
+        report.add("type", "rows", [position], 1, "'rows' must be a list")
+        return False
+    if rows and set(map(type, rows)) != {dict}:
+        count = sum(type(row) is not dict for row in rows)
+        report.add("not_an_object", "rows", [position], count, "rows must be objects")
+        return False
+    return True
+
+
+def collect_predictions(predictions, report: ValidationReport) -> tuple:
+    """
+    Appends the predictions with a valid structure to a RowStoreBuilder, one segment each.
+
+    Args:
+        predictions (iterable): Decoded predictions, possibly streamed.
+        report (ValidationReport): Report receiving the structural problems.
+
+    Returns:
+        tuple: (builder, positions) with the RowStoreBuilder and the position in the file
+               of the prediction of each segment.
+    """
+    builder = RowStoreBuilder()
+    positions = []
+    for position, prediction in enumerate(predictions):
+        report.n_predictions += 1
+        if check_prediction(report, prediction, position):
+            builder.add_segment(prediction["rows"], prediction["valid_file_name"], prediction["time_to_estimate_sec"])
+            positions.append(position)
+    return builder, positions
+
+
+def validate_builder(builder: RowStoreBuilder, positions: list, report: ValidationReport):
+    """
+    Checks the columns accumulated by a RowStoreBuilder against ROW_SCHEMA and the
+    prediction values against PREDICTION_SCHEMA, each over the whole file at once.
+
+    Args:
+        builder (RowStoreBuilder): Builder holding the raw values of every prediction.
+        positions (list): Position in the file of the prediction of each segment.
+        report (ValidationReport): Report receiving the problems.
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    row_predictions = np.repeat(positions, builder.lengths)
+    report.n_rows += len(row_predictions)
+    for column, (kind, required) in ROW_SCHEMA.items():
+        check_column(report, column, builder.values[column], kind, required, row_predictions)
+    prediction_values = {"valid_file_name": builder.names, "time_to_estimate_sec": builder.times}
+    for column, (kind, required) in PREDICTION_SCHEMA.items():
+        check_column(report, column, prediction_values[column], kind, required, positions)
+
+
+def kept_segments(report: ValidationReport, positions) -> list:
+    """
+    Applies the validation mode to a report.
+
+    Args:
+        report (ValidationReport): Report of the file.
+        positions (array-like): Position in the file of the prediction of each segment.
+
+    Returns:
+        list: The segments to keep, or None to keep every segment (no problem found).
+
+    Raises:
+        SchemaValidationError: In strict mode when any problem was found, and in lenient
+            mode when no valid prediction is left.
+    """
+    if report.valid:
+        return None
+    if report.mode == "strict":
+        raise SchemaValidationError(report)
+    invalid = report.invalid_predictions
+    segments = [segment for segment, position in enumerate(positions) if int(position) not in invalid]
+    if not segments:
+        raise SchemaValidationError(report)
+    return segments
+
+
+def build_model_output_store(predictions, source: str, mode: str = "lenient") -> tuple:
+    """
+    Validates the predictions of a model output file and builds their RowStore.
+
+    The structure of each prediction is checked as it is read, then every column is
+    checked across the whole file before any value is converted. In lenient mode the
+    predictions with a problem are dropped; in strict mode the file is rejected.
+
+    Args:
+        predictions (iterable): Decoded predictions ('estimate_preds' elements).
+        source (str): Name of the file, used in the report.
+        mode (str): "lenient" or "strict".
+
+    Returns:
+        tuple: (store, report) with the RowStore of the valid predictions (one segment
+               each) and the ValidationReport of the file.
+
+    Raises:
+        SchemaValidationError: If the file is rejected (see `kept_segments`).
+    """
+    report = ValidationReport(source, mode)
+    builder, positions = collect_predictions(predictions, report)
+    validate_builder(builder, positions, report)
+    return builder.build(kept_segments(report, positions)), report
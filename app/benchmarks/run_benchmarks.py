@@ -0,0 +1,288 @@
+import os
+import json
+import time
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import contextlib
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from adapters.json_adapter import JSONAdapter
+from adapters.streaming_json_adapter import StreamingJSONAdapter
+from adapters.validation import ValidationReport, collect_predictions, validate_builder
+from evaluators.mae_evaluator import MAE
+from evaluators.mre_evaluator import MRE
+from evaluators.mape_evaluator import MAPE
+from evaluators.asymmetric_evaluator import AsymmetricLoss
+from evaluators.evaluator_pipeline import EvaluationPipeline
+from observers.evaluation_notifier import EvaluationNotifier
+from observers.console_logger import ConsoleLogger
+from observers.file_logger import FileLogger
+from observers.events import make_events
+from reports.report_generator import ReportGenerator
+from utils.load import load_all_ground_truths, load_ground_truth_store
+from utils.eval import evaluate_sections
+from utils.bootstrap import resample_counts, unit_section_totals, bootstrap_scores
+from utils.matching import line_item_report
+from benchmarks.synthetic import generate_corpus
+
+# Bump when stages are added, removed or change meaning, so results are only compared like for like.
+BENCHMARK_FORMAT_VERSION = 4
+REPORT_FORMATS = ("csv", "json", "parquet", "arrow", "sqlite")
+BOOTSTRAP_SAMPLES = 10000
+
+
+def make_evaluators() -> dict:
+    """Returns one instance of every built-in evaluator."""
+    return {"MAE": MAE(), "MAPE": MAPE(), "MRE": MRE(), "ASYMMETRIC": AsymmetricLoss()}
+
+
+def time_stage(function, repeat: int) -> tuple:
+    """
+    Calls a function `repeat` times and measures each call.
+
+    Args:
+        function (callable): Stage to time, called without arguments.
+        repeat (int): Number of calls.
+
+    Returns:
+        tuple: (timings, result) with the wall time of every call, in seconds, and the
+               value returned by the last call.
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+
+def summarize(timings: list, rows: int = None) -> dict:
+    """
+    Summarizes the timings of a stage.
+
+    Args:
+        timings (list): Wall time of every call, in seconds.
+        rows (int, optional): Number of rows processed by one call.
+
+    Returns:
+        dict: Median, minimum and maximum time, every timing and, when rows are given,
+              the throughput in rows per second (based on the median).
+    """
+    median = statistics.median(timings)
+    summary = {"median_sec": median, "min_sec": min(timings), "max_sec": max(timings), "runs_sec": timings}
+    if rows is not None:
+        summary["rows"] = rows
+        summary["rows_per_sec"] = rows / median if median > 0 else None
+    return summary
+
+
+def git_commit() -> str:
+    """Returns the current git commit hash, or None outside a git checkout."""
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def _gather_segments(gt_store, gt_segments: dict, pred_store) -> tuple:
+    """Aligns the prediction segments with their ground truth segments, as the pipeline does."""
+    matched = [index for index, name in enumerate(pred_store.names) if name in gt_segments]
+    pred_store = pred_store.take_segments(matched)
+    return gt_store.take_segments([gt_segments[name] for name in pred_store.names]), pred_store
+
+
+def run_benchmarks(data_dir: str, repeat: int = 3) -> dict:
+    """
+    Times each stage of the evaluation pipeline on a corpus.
+
+    Stages: ground truth loading (per file and as a single store, with and without a
+    snapshot), model output parsing (streaming RowStore and legacy DataFrame paths),
+    segment gathering, evaluation per metric, bootstrap resampling of all metrics
+    (`BOOTSTRAP_SAMPLES` resamples of the examples), line-item matching, report writing
+    per format, observer
+    notification and the end-to-end pipeline run.
+
+    Args:
+        data_dir (str): Directory holding the 'ground_truth' and 'model_outputs' folders.
+        repeat (int): Number of timed calls per stage.
+
+    Returns:
+        dict: Stage name mapped to its summary (see `summarize`).
+    """
+    ground_truth_dir = os.path.join(data_dir, "ground_truth")
+    model_outputs_dir = os.path.join(data_dir, "model_outputs")
+    model_paths = [os.path.join(model_outputs_dir, name) for name in sorted(os.listdir(model_outputs_dir))]
+    work_dir = tempfile.mkdtemp(prefix="benchmark_")
+    evaluators = make_evaluators()
+    stages = {}
+
+    try:
+        timings, (gt_store, _) = time_stage(lambda: load_ground_truth_store(ground_truth_dir), repeat)
+        stages["load_ground_truth_store"] = summarize(timings, gt_store.n_rows)
+        timings, _ = time_stage(lambda: load_all_ground_truths(ground_truth_dir), repeat)
+        stages["load_all_ground_truths"] = summarize(timings, gt_store.n_rows)
+
+        snapshot_dir = os.path.join(work_dir, "snapshot")
+        load_ground_truth_store(ground_truth_dir, snapshot_dir)
+        timings, _ = time_stage(lambda: load_ground_truth_store(ground_truth_dir, snapshot_dir), repeat)
+        stages["load_ground_truth_snapshot"] = summarize(timings, gt_store.n_rows)
+
+        timings, pred_stores = time_stage(
+            lambda: [StreamingJSONAdapter(path).to_model_output_store() for path in model_paths], repeat)
+        model_rows = sum(store.n_rows for store in pred_stores)
+        stages["parse_model_outputs"] = summarize(timings, model_rows)
+
+        collected = []
+        for path in model_paths:
+            with open(path, "r", encoding="utf-8") as file:
+                collected.append(collect_predictions(json.load(file)["estimate_preds"], ValidationReport(path)))
+        timings, _ = time_stage(lambda: [validate_builder(builder, positions, ValidationReport(path))
+                                         for path, (builder, positions) in zip(model_paths, collected)], repeat)
+        stages["validate_model_outputs"] = summarize(timings, model_rows)
+
+        timings, _ = time_stage(lambda: [JSONAdapter(path).to_model_outputs() for path in model_paths], repeat)
+        stages["parse_model_outputs_dataframe"] = summarize(timings, model_rows)
+
+        gt_segments = {name: index for index, name in enumerate(gt_store.names)}
+        timings, aligned = time_stage(
+            lambda: [_gather_segments(gt_store, gt_segments, store) for store in pred_stores], repeat)
+        stages["gather_segments"] = summarize(timings, model_rows)
+
+        for metric_name, evaluator in evaluators.items():
+            timings, _ = time_stage(
+                lambda: [evaluate_sections({metric_name: evaluator}, gt, pred) for gt, pred in aligned], repeat)
+            stages[f"evaluate[{metric_name}]"] = summarize(timings, model_rows)
+
+        example_names = gt_store.names
+        counts = resample_counts(len(example_names), BOOTSTRAP_SAMPLES)
+        timings, _ = time_stage(
+            lambda: [bootstrap_scores(evaluators, counts, *unit_section_totals(gt, pred, example_names))
+                     for gt, pred in aligned], repeat)
+        stages["bootstrap"] = summarize(timings, model_rows)
+
+        timings, _ = time_stage(lambda: [line_item_report(gt, pred, "model") for gt, pred in aligned], repeat)
+        stages["match_line_items"] = summarize(timings, model_rows)
+
+        global_results, section_results = [], []
+        for model_path, (gt, pred) in zip(model_paths, aligned):
+            global_scores, section_scores = evaluate_sections(evaluators, gt, pred)
+            model_file = os.path.basename(model_path)
+            global_results += [{"model_file": model_file, "metric": metric, "score": score}
+                               for metric, score in global_scores.items()]
+            section_results += [{"model_file": model_file, "sectionName": section, "metric": metric, "score": score}
+                                for metric, scores in section_scores.items() for section, score in scores.items()]
+        section_df = pd.DataFrame(section_results)
+
+        for report_format in REPORT_FORMATS:
+            output_path = os.path.join(work_dir, f"report_by_section.{report_format}")
+            timings, _ = time_stage(lambda: ReportGenerator(report_format).generate(section_df, output_path), repeat)
+            stages[f"write_report[{report_format}]"] = summarize(timings, len(section_df))
+
+        events = make_events(global_results, section_results)
+        log_file = os.path.join(work_dir, "logs", "evaluation.log")
+        notifier = EvaluationNotifier()
+        notifier.add_observer(ConsoleLogger())
+        notifier.add_observer(FileLogger(log_file, buffered=True))
+        timings, _ = time_stage(lambda: (notifier.notify_batch(events), notifier.flush()), repeat)
+        notifier.close()
+        stages["notify_observers"] = summarize(timings, len(events))
+
+        config = {
+            "ground_truth_dir": ground_truth_dir,
+            "model_outputs_dir": model_outputs_dir,
+            "evaluation": {"format": "json", "output_path": os.path.join(work_dir, "pipeline_report")},
+        }
+
+        def run_pipeline():
+            EvaluationPipeline(config, evaluators, notifier=EvaluationNotifier()).run()
+
+        timings, _ = time_stage(run_pipeline, repeat)
+        stages["pipeline_run"] = summarize(timings, model_rows)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return stages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the evaluation pipeline on a synthetic corpus.")
+    parser.add_argument("--examples", type=int, default=50, help="Number of ground truth examples (N).")
+    parser.add_argument("--models", type=int, default=8, help="Number of model output files (M).")
+    parser.add_argument("--predictions", type=int, default=3, help="Predictions per example and model (K).")
+    parser.add_argument("--sections", type=int, default=12, help="Number of distinct sections (S).")
+    parser.add_argument("--rows-per-section", type=int, default=4, help="Average line items per section.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed calls per stage.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic data generator.")
+    parser.add_argument("--data-dir", default=None,
+                        help="Use an existing corpus (with 'ground_truth' and 'model_outputs') instead of generating one.")
+    parser.add_argument("--output", default="benchmarks/results/benchmark.json", help="Path of the JSON results file.")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    params = {
+        "examples": args.examples,
+        "models": args.models,
+        "predictions_per_example": args.predictions,
+        "sections": args.sections,
+        "rows_per_section": args.rows_per_section,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "data_dir": args.data_dir,
+    }
+
+    generated_dir = None
+    data_dir = args.data_dir
+    if data_dir is None:
+        generated_dir = data_dir = tempfile.mkdtemp(prefix="benchmark_data_")
+        corpus = generate_corpus(data_dir, args.examples, args.models, args.predictions, args.sections,
+                                 args.rows_per_section, args.seed)
+        params["ground_truth_rows"] = corpus["ground_truth_rows"]
+        params["model_output_rows"] = corpus["model_output_rows"]
+
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            stages = run_benchmarks(data_dir, args.repeat)
+    finally:
+        if generated_dir is not None:
+            shutil.rmtree(generated_dir, ignore_errors=True)
+
+    results = {
+        "format_version": BENCHMARK_FORMAT_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+        },
+        "params": params,
+        "stages": stages,
+    }
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+
+    width = max(len(name) for name in stages)
+    for name, summary in stages.items():
+        print(f"[BENCH] {name:<{width}}  {summary['median_sec'] * 1000:10.2f} ms")
+    print(f"[BENCH] Results written to {args.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+import os
+import json
+import numpy as np
+
+BASE_SECTIONS = ["Demolition", "Framing", "Concrete", "Electrical", "Plumbing", "Drywall",
+                 "Painting", "Tile", "Trim", "Roofing", "Flooring", "General Conditions"]
+UOMS = ["EA", "SF", "LF", "HR", "LS"]
+CATEGORIES = ["labor", "material", "equipment", "other"]
+
+
+def section_names(n_sections: int) -> list:
+    """
+    Returns `n_sections` distinct section names, starting with the usual trade names.
+
+    Args:
+        n_sections (int): Number of sections.
+
+    Returns:
+        list: Section names.
+    """
+    names = BASE_SECTIONS[:n_sections]
+    names += [f"Section {i:03d}" for i in range(len(names), n_sections)]
+    return names
+
+
+def _ground_truth_rows(rng: np.random.Generator, sections: list, rows_per_section: int) -> list:
+    """Generates the line items of one ground truth estimate."""
+    rows = []
+    for section in sections:
+        for item in range(rng.integers(1, 2 * rows_per_section)):
+            qty = float(rng.integers(1, 200))
+            rate = round(float(rng.lognormal(3.0, 1.0)), 2)
+            rows.append({
+                "sectionName": section,
+                "qty": qty,
+                "rateUsd": rate,
+                "rowTotalCostUsd": round(qty * rate, 2),
+                "label": f"{section} item {item}",
+                "uom": UOMS[rng.integers(len(UOMS))],
+                "category": CATEGORIES[rng.integers(len(CATEGORIES))],
+            })
+    return rows
+
+
+def _predicted_rows(rng: np.random.Generator, gt_rows: list, all_sections: list, noise: float) -> list:
+    """Perturbs ground truth rows into a prediction: noisy costs, dropped and invented items."""
+    rows = []
+    for row in gt_rows:
+        if rng.random() < 0.1:
+            continue
+        qty = max(1.0, round(row["qty"] * float(rng.lognormal(0.0, noise))))
+        rate = round(row["rateUsd"] * float(rng.lognormal(0.0, noise)), 2)
+        rows.append(dict(row, qty=qty, rateUsd=rate, rowTotalCostUsd=round(qty * rate, 2), metadata=None))
+    for item in range(rng.integers(0, 3)):
+        section = all_sections[rng.integers(len(all_sections))]
+        qty = float(rng.integers(1, 50))
+        rate = round(float(rng.lognormal(3.0, 1.0)), 2)
+        rows.append({
+            "label": f"Extra {section} item {item}",
+            "qty": qty,
+            "uom": UOMS[rng.integers(len(UOMS))],
+            "rateUsd": rate,
+            "rowTotalCostUsd": round(qty * rate, 2),
+            "category": CATEGORIES[rng.integers(len(CATEGORIES))],
+            "sectionName": section,
+            "metadata": None,
+        })
+    return rows
+
+
+def generate_corpus(output_dir: str, n_examples: int = 10, n_models: int = 4, predictions_per_example: int = 2,
+                    n_sections: int = 6, rows_per_section: int = 4, seed: int = 0) -> dict:
+    """
+    Writes a synthetic corpus in the layout of `data/ground_truth` and `data/model_outputs`.
+
+    Each ground truth example uses a random subset of the sections (at least half of
+    them). Each model output file holds `predictions_per_example` predictions for every
+    example, perturbed from the ground truth with a model-specific noise level.
+
+    Args:
+        output_dir (str): Directory receiving the 'ground_truth' and 'model_outputs' folders.
+        n_examples (int): Number of ground truth examples (N).
+        n_models (int): Number of model output files (M).
+        predictions_per_example (int): Predictions per example in each model file (K).
+        n_sections (int): Number of distinct sections (S).
+        rows_per_section (int): Average number of line items per section.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        dict: Paths of the generated folders and the number of rows written.
+    """
+    rng = np.random.default_rng(seed)
+    ground_truth_dir = os.path.join(output_dir, "ground_truth")
+    model_outputs_dir = os.path.join(output_dir, "model_outputs")
+    os.makedirs(ground_truth_dir, exist_ok=True)
+    os.makedirs(model_outputs_dir, exist_ok=True)
+
+    sections = section_names(n_sections)
+    ground_truths = {}
+    gt_row_count = 0
+    for example in range(1, n_examples + 1):
+        n_used = rng.integers(max(1, n_sections // 2), n_sections + 1)
+        used_sections = [sections[i] for i in np.sort(rng.choice(n_sections, size=n_used, replace=False))]
+        rows = _ground_truth_rows(rng, used_sections, rows_per_section)
+        name = f"example_{example:02d}"
+        ground_truths[name] = rows
+        gt_row_count += len(rows)
+        with open(os.path.join(ground_truth_dir, f"{name}.json"), "w", encoding="utf-8") as file:
+            json.dump({
+                "test_n": example,
+                "input": f"Synthetic project {example}",
+                "rows": rows,
+                "totalCostUsd": round(sum(row["rowTotalCostUsd"] for row in rows), 2),
+            }, file)
+
+    model_row_count = 0
+    for model in range(1, n_models + 1):
+        noise = 0.05 * model
+        predictions = []
+        for name, gt_rows in ground_truths.items():
+            for _ in range(predictions_per_example):
+                rows = _predicted_rows(rng, gt_rows, sections, noise)
+                model_row_count += len(rows)
+                predictions.append({
+                    "valid_file_name": name,
+                    "rows": rows,
+                    "time_to_estimate_sec": float(rng.lognormal(3.0, 0.5)),
+                })
+        with open(os.path.join(model_outputs_dir, f"model_{model:02d}.json"), "w", encoding="utf-8") as file:
+            json.dump({"estimate_preds": predictions}, file)
+
+    return {
+        "ground_truth_dir": ground_truth_dir,
+        "model_outputs_dir": model_outputs_dir,
+        "ground_truth_rows": gt_row_count,
+        "model_output_rows": model_row_count,
+    }
@@ -4,6 +4,8 @@ from evaluators.base_evaluator import BaseEvaluator
 class AsymmetricLoss(BaseEvaluator):
     """Asymmetric loss function evaluator to penalize underestimation more than overestimation."""
 
+    supports_aligned_arrays = True
+
     def __init__(self, alpha=2.0):
         """
         Initialize the asymmetric loss evaluator.
@@ -27,8 +29,46 @@ class AsymmetricLoss(BaseEvaluator):
         """
         ground_truth = np.array(ground_truth)
         predictions = np.array(predictions)
+        return self.evaluate_aligned(ground_truth, predictions)
+
+    def evaluate_aligned(self, ground_truth: np.ndarray, predictions: np.ndarray):
+        """
+        Compute the asymmetric loss on pre-aligned arrays, without copying them.
+
+        Args:
+            ground_truth (np.ndarray): Actual values.
+            predictions (np.ndarray): Predicted values, aligned with `ground_truth`.
+
+        Returns:
+            float: Asymmetric loss score (lower is better).
+        """
+        return np.mean(self.evaluate_elementwise(ground_truth, predictions))
+
+    def evaluate_elementwise(self, ground_truth: np.ndarray, predictions: np.ndarray) -> np.ndarray:
+        """
+        Compute the asymmetric loss of each element, in a single vectorized call.
 
+        Args:
+            ground_truth (np.ndarray): Actual values.
+            predictions (np.ndarray): Predicted values, aligned with `ground_truth`.
+
+        Returns:
+            np.ndarray: Score of each element.
+        """
         error = predictions - ground_truth
-        loss = np.where(error < 0, self.alpha * np.abs(error), np.abs(error))
+        return np.where(error < 0, self.alpha * np.abs(error), np.abs(error))
+
+    def evaluate_grouped(self, ground_truth: np.ndarray, predictions: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Compute the score of each group (row) of pre-aligned matrices in a single
+        vectorized call, averaging the element scores flagged in `mask`.
+
+        Args:
+            ground_truth (np.ndarray): Actual values, shape (n_groups, n_elements).
+            predictions (np.ndarray): Predicted values, same shape as `ground_truth`.
+            mask (np.ndarray): Boolean matrix of the elements belonging to each group.
 
-        return np.mean(loss)
+        Returns:
+            np.ndarray: Score of each group, NaN for groups without elements.
+        """
+        return self.masked_row_mean(self.evaluate_elementwise(ground_truth, predictions), mask)
@@ -4,6 +4,12 @@ import numpy as np
 class BaseEvaluator(ABC):
     """Abstract base class for evaluation metrics."""
 
+    # Evaluators that set this flag declare that `evaluate_aligned` and `evaluate_elementwise`
+    # accept float64 arrays already aligned by section, shared read-only with the other
+    # metrics. `utils.eval.evaluate_sections` passes the shared arrays to them, and gives
+    # every other evaluator its own writable copies through `evaluate`.
+    supports_aligned_arrays = False
+
     @abstractmethod
     def evaluate(self, ground_truth, predictions):
         """
@@ -17,3 +23,79 @@ class BaseEvaluator(ABC):
             float: Computed metric score.
         """
         pass
+
+    def evaluate_aligned(self, ground_truth: np.ndarray, predictions: np.ndarray):
+        """
+        Compute the evaluation metric on pre-aligned float64 arrays.
+
+        The default implementation calls `evaluate` on copies of the arrays, so
+        evaluators that do not declare `supports_aligned_arrays` cannot modify the
+        arrays shared with the other metrics.
+
+        Args:
+            ground_truth (np.ndarray): Actual values, one per section.
+            predictions (np.ndarray): Predicted values, aligned with `ground_truth`.
+
+        Returns:
+            float: Computed metric score.
+        """
+        return self.evaluate(ground_truth.copy(), predictions.copy())
+
+    def evaluate_elementwise(self, ground_truth: np.ndarray, predictions: np.ndarray) -> np.ndarray:
+        """
+        Compute one score per element (e.g. per section) of pre-aligned arrays.
+
+        The default implementation scores each element separately with
+        `evaluate_aligned`; evaluators should override it with a vectorized version.
+
+        Args:
+            ground_truth (np.ndarray): Actual values.
+            predictions (np.ndarray): Predicted values, aligned with `ground_truth`.
+
+        Returns:
+            np.ndarray: Score of each element, same shape as the inputs.
+        """
+        return np.array([self.evaluate_aligned(ground_truth[i:i + 1], predictions[i:i + 1])
+                         for i in range(len(ground_truth))], dtype=np.float64)
+
+    def evaluate_grouped(self, ground_truth: np.ndarray, predictions: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Compute one score per group (row) of pre-aligned matrices, e.g. one per
+        (example, run) pair with one column per section.
+
+        Only the elements flagged in `mask` belong to a group. The default implementation
+        calls `evaluate_aligned` on each row; evaluators should override it with a
+        vectorized version.
+
+        Args:
+            ground_truth (np.ndarray): Actual values, shape (n_groups, n_elements).
+            predictions (np.ndarray): Predicted values, same shape as `ground_truth`.
+            mask (np.ndarray): Boolean matrix of the elements belonging to each group.
+
+        Returns:
+            np.ndarray: Score of each group, NaN for groups without elements.
+        """
+        return np.array([self.evaluate_aligned(ground_truth[i][mask[i]], predictions[i][mask[i]])
+                         if mask[i].any() else np.nan
+                         for i in range(len(ground_truth))], dtype=np.float64)
+
+    @staticmethod
+    def masked_row_mean(values: np.ndarray, mask: np.ndarray, ignore_nan: bool = False) -> np.ndarray:
+        """
+        Averages each row of a matrix over the elements flagged in `mask`.
+
+        Args:
+            values (np.ndarray): Matrix of element scores.
+            mask (np.ndarray): Boolean matrix of the elements to average.
+            ignore_nan (bool): Whether NaN scores are skipped (as `np.nanmean`) instead of
+                propagated (as `np.mean`).
+
+        Returns:
+            np.ndarray: Mean of each row, NaN for rows without elements.
+        """
+        if ignore_nan:
+            mask = mask & ~np.isnan(values)
+        totals = np.where(mask, values, 0.0).sum(axis=1)
+        counts = mask.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return totals / counts
@@ -0,0 +1,141 @@
+import time
+import logging
+import threading
+
+from adapters.adapter_factory import SUPPORTED_EXTENSIONS
+from evaluators.evaluator_pipeline import EvaluationPipeline
+from utils.watch import DirectoryPoller
+from utils.profiling import max_profile_records
+
+
+class EvaluationWatcher:
+    """
+    Long-running watch mode of the evaluation pipeline.
+
+    The pipeline, with its ground truth store, evaluators and worker pool, stays resident.
+    The model outputs directory is polled; new or changed model files are evaluated as
+    soon as they have settled (see `DirectoryPoller`) and removed files are dropped, then
+    the reports are updated (see `EvaluationPipeline.update_reports`): file reports are
+    rewritten from the resident results of every file, and appending reports (SQLite)
+    only replace the rows of the changed files in the run of the watch session. A change
+    of the ground truth reloads it (restarting the worker pool) and re-evaluates every
+    model file. When profiling is enabled, only the
+    most recent stage records are kept (`profile.max_records`).
+    """
+
+    def __init__(self, pipeline: EvaluationPipeline, poll_interval_sec: float = 1.0, debounce_sec: float = 2.0):
+        """
+        Initializes the watcher.
+
+        Args:
+            pipeline (EvaluationPipeline): Pipeline used to evaluate the model files.
+            poll_interval_sec (float): Time between two scans of the watched directories.
+            debounce_sec (float): Time a file must stay unchanged before it is evaluated.
+        """
+        self.pipeline = pipeline
+        self.pipeline.profiler.limit(max_profile_records(pipeline.config))
+        self.pipeline.keep_workers = True
+        self.poll_interval_sec = poll_interval_sec
+        self.model_poller = DirectoryPoller(pipeline.model_outputs_dir, SUPPORTED_EXTENSIONS, debounce_sec)
+        self.ground_truth_poller = DirectoryPoller(pipeline.ground_truth_dir, SUPPORTED_EXTENSIONS, debounce_sec)
+
+    @classmethod
+    def from_config(cls, pipeline: EvaluationPipeline, config: dict) -> "EvaluationWatcher":
+        """
+        Creates a watcher from the `watch` section of the configuration.
+
+        Args:
+            pipeline (EvaluationPipeline): Pipeline used to evaluate the model files.
+            config (dict): Configuration dictionary.
+
+        Returns:
+            EvaluationWatcher: The watcher.
+        """
+        watch_config = config.get("watch") or {}
+        return cls(pipeline, float(watch_config.get("poll_interval_sec", 1.0)),
+                   float(watch_config.get("debounce_sec", 2.0)))
+
+    def start(self):
+        """Evaluates every model file once, writes the reports and starts tracking changes."""
+        self.model_poller.prime()
+        self.ground_truth_poller.prime()
+        self.pipeline.results = {}
+        self.pipeline.evaluate_files(self.model_poller.files)
+        self.pipeline.update_reports()
+
+    def poll_once(self) -> bool:
+        """
+        Scans the watched directories once and updates the reports if anything changed.
+
+        If the update fails (e.g. a file is removed while it is read or the reports cannot
+        be written), the pollers are restored so the next poll retries it.
+
+        Returns:
+            bool: Whether the reports were updated.
+        """
+        states = (self.ground_truth_poller.state(), self.model_poller.state())
+        try:
+            return self._update()
+        except Exception:
+            self.ground_truth_poller.restore(states[0])
+            self.model_poller.restore(states[1])
+            raise
+
+    def _update(self) -> bool:
+        gt_changed, gt_removed = self.ground_truth_poller.poll()
+        changed, removed = self.model_poller.poll()
+        if gt_changed or gt_removed:
+            logging.info("Ground truth changed: reloading it and re-evaluating every model file.")
+            self.pipeline.load_ground_truth()
+            self.model_poller.prime()
+            self.pipeline.results = {}
+            changed, removed = self.model_poller.files, None
+        if not changed and not removed:
+            return False
+
+        if removed:
+            logging.info(f"Model files removed: {', '.join(removed)}")
+            self.pipeline.remove_files(removed)
+        if changed:
+            logging.info(f"Evaluating new or changed model files: {', '.join(changed)}")
+            self.pipeline.evaluate_files(changed)
+        # After a ground truth change (`removed` is None), every report row is replaced.
+        self.pipeline.update_reports(None if removed is None else list(changed) + list(removed))
+        return True
+
+    def close(self):
+        """Shuts down the resident worker pool of the pipeline."""
+        self.pipeline.close_workers()
+
+    def watch(self, stop_event: threading.Event = None):
+        """
+        Runs the watch loop until `stop_event` is set or the process is interrupted.
+
+        Args:
+            stop_event (threading.Event, optional): Event stopping the loop when set.
+        """
+        stop_event = stop_event or threading.Event()
+        try:
+            self.start()
+        except Exception:
+            logging.exception("Initial evaluation failed; retrying on the next poll.")
+            # Forgetting every file makes the next polls reload the ground truth and
+            # re-evaluate every model file.
+            self.ground_truth_poller.restore(({}, {}))
+            self.model_poller.restore(({}, {}))
+        logging.info(f"Watching '{self.pipeline.model_outputs_dir}' for new model outputs "
+                     f"(every {self.poll_interval_sec}s).")
+        try:
+            while not stop_event.wait(self.poll_interval_sec):
+                started = time.perf_counter()
+                try:
+                    updated = self.poll_once()
+                except Exception:
+                    logging.exception("Watch update failed; retrying on the next poll.")
+                    continue
+                if updated:
+                    logging.info(f"Reports updated in {time.perf_counter() - started:.2f}s.")
+        except KeyboardInterrupt:
+            logging.info("Watch mode stopped.")
+        finally:
+            self.close()
@@ -1,15 +1,54 @@
 import os
+import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
 import pandas as pd
 
-from adapters.json_adapter import JSONAdapter
-from utils.load import load_all_ground_truths
-from utils.eval import evaluate_by_section, evaluate_by_section_per_section
+from adapters.adapter_factory import get_model_output_adapter, SUPPORTED_EXTENSIONS
+from utils.load import load_ground_truth_store
+from utils.eval import evaluate_sections, evaluate_segments, run_indices
+from utils.cache import ResultCache, hash_file, hash_directory, hash_evaluators
+from utils.profiling import create_profiler
+from utils.latency import model_latency, add_latency_columns
+from utils.bootstrap import (bootstrap_settings, resample_counts, unit_section_totals, bootstrap_scores,
+                             confidence_interval, significance_matrix)
+from utils.matching import line_item_settings, line_item_report
+from utils.config import validation_mode
 from reports.report_generator import ReportGenerator
 
 from observers.evaluation_notifier import EvaluationNotifier
-from observers.console_logger import ConsoleLogger
-from observers.file_logger import FileLogger
+from observers.notifier_factory import create_notifier
+from observers.events import make_events
+
+# Pipeline instance owned by each worker process when running with `workers > 1`.
+_worker_pipeline = None
+
+
+def _init_worker(config, evaluators, use_cache):
+    """
+    Initializes a worker process of the evaluation pool.
+
+    The ground truth map is loaded once per worker and reused for every model
+    file the worker receives. Workers get a notifier without observers, since
+    notifications are replayed by the parent process in file order.
+    """
+    global _worker_pipeline
+    _worker_pipeline = EvaluationPipeline(config, evaluators, notifier=EvaluationNotifier(), use_cache=use_cache)
+
+
+def _evaluate_in_worker(model_file):
+    """
+    Evaluates a single model file inside a worker process.
+
+    Returns the results together with the stage records measured by the worker, which
+    the parent process merges into its own profile.
+    """
+    results = _worker_pipeline.evaluate_model_file(model_file)
+    return results, _worker_pipeline.profiler.drain()
+
 
 class EvaluationPipeline:
     """
@@ -17,152 +56,527 @@ class EvaluationPipeline:
 
     This class loads ground truth and model output data, computes both global 
     and per-section evaluation metrics, notifies observers about global metric 
-    evaluations, and then exports the results to CSV or JSON reports.
+    evaluations, and then exports the results to CSV, JSON, Parquet or Arrow reports.
     """
-    def __init__(self, config, evaluators, report_format: str = None, notifier: EvaluationNotifier = None):
+    def __init__(self, config, evaluators, report_format: str = None, notifier: EvaluationNotifier = None,
+                 use_cache: bool = True, profiler=None):
         """
         Initializes the evaluation pipeline.
 
         Args:
             config (dict): Configuration dictionary.
             evaluators (dict): Dictionary of evaluator instances.
-            report_format (str, optional): Report format ("csv" or "json").
+            report_format (str, optional): Report format ("csv", "json", "parquet", "arrow" or "sqlite").
                 If not provided, the pipeline will use the value from the config.
             notifier (EvaluationNotifier, optional): Notifier for logging evaluation events.
                 If not provided, a default notifier is created.
+            use_cache (bool, optional): Whether to reuse cached results of unchanged model files
+                when a `cache` section is configured. Defaults to True.
+            profiler (StageProfiler, optional): Profiler measuring the stages of the run.
+                If not provided, one is created from the `profile` section of the config
+                (a no-op profiler when profiling is disabled).
         """
         self.config = config
         self.ground_truth_dir = config.get("ground_truth_dir", "data/ground_truth")
         self.model_outputs_dir = config.get("model_outputs_dir", "data/model_outputs")
+        self.workers = max(1, int(config.get("workers", 1) or 1))
         self.evaluators = evaluators
-        self.gt_map = load_all_ground_truths(self.ground_truth_dir)
-        if not self.gt_map:
-            logging.error("No valid ground truth files found. Exiting.")
-            raise ValueError("Ground truths not found.")
-        self._log_ground_truths()
+        self.bootstrap = bootstrap_settings(config)
+        self.line_items = line_item_settings(config)
+        self.validation = validation_mode(config)
+        self.profiler = profiler if profiler is not None else create_profiler(config)
+
+        self.use_cache = use_cache
+        self.result_cache = None
+        cache_config = config.get("cache")
+        if use_cache and cache_config:
+            self.result_cache = ResultCache(cache_config.get("dir", "cache"),
+                                            cache_config.get("max_size_mb", 256))
+
+        # Whether the worker pool is kept alive between evaluations (see `close_workers`).
+        self.keep_workers = False
+        self._executor = None
+        self.load_ground_truth()
+
+        # Results of the evaluated model files, kept between runs of a long-running pipeline.
+        self.results = {}
 
         self.report_format = (report_format or 
                               config.get("evaluation", {}).get("format", "csv")).lower()
+        # Report generator of `update_reports`, kept so that appending reports update one run.
+        self._report_generator = None
 
 
         if notifier is None:
-            self.notifier = EvaluationNotifier()
-       
-            self.notifier.add_observer(ConsoleLogger())
-        
-            log_file = config.get("log_file")
-            if log_file:
-                self.notifier.add_observer(FileLogger(log_file))
+            self.notifier = create_notifier(config)
         else:
             self.notifier = notifier
 
+    def load_ground_truth(self):
+        """
+        Loads (or reloads) the ground truth store and the ground truth hash of the result cache.
+
+        A resident worker pool is shut down, since its workers hold the previous ground truth.
+
+        Raises:
+            ValueError: If no valid ground truth file is found.
+        """
+        self.close_workers()
+        with self.profiler.stage("load_ground_truth") as stage:
+            self.gt_store, self.gt_totals = load_ground_truth_store(self.ground_truth_dir,
+                                                                    self.config.get("ground_truth_snapshot_dir"))
+            stage["rows"] = self.gt_store.n_rows
+        if not self.gt_totals:
+            logging.error("No valid ground truth files found. Exiting.")
+            raise ValueError("Ground truths not found.")
+        self._log_ground_truths()
+        self.gt_segments = {name: index for index, name in enumerate(self.gt_store.names)}
+        self._bootstrap_counts = None
+
+        if self.result_cache is not None:
+            with self.profiler.stage("hash_ground_truth"):
+                self._cache_hashes = (hash_directory(self.ground_truth_dir, SUPPORTED_EXTENSIONS),
+                                      hash_evaluators(self.evaluators, {"bootstrap": self.bootstrap,
+                                                                        "line_items": self.line_items,
+                                                                        "validation": self.validation}))
+
     def _log_ground_truths(self):
         """Logs information about the loaded ground truth files."""
         logging.info(f"Loading ground truth from directory: {self.ground_truth_dir}")
-        for gt_name, data in self.gt_map.items():
-            logging.info(f"  {gt_name}: Total Cost = {data['total']}")
+        for gt_name, total in self.gt_totals.items():
+            logging.info(f"  {gt_name}: Total Cost = {total}")
 
     def process_model_file(self, model_file):
         """
         Processes a single model output file.
 
         This method:
-          - Reads and validates the model JSON file.
-          - Aggregates ground truth and prediction DataFrames.
-          - Computes global and per-section metrics.
+          - Reads and validates the predictions of the model output file, with the adapter
+            matching its extension (streamed JSON, Arrow IPC/Feather or Parquet).
+          - Aggregates ground truth and prediction rows into columnar RowStores.
+          - Computes global and per-section metrics from a single section alignment.
+          - Scores each (example, run) pair separately and adds the mean and standard
+            deviation of these scores to the global results.
+          - Computes latency statistics of the predictions' `time_to_estimate_sec`.
+          - When a `bootstrap` section is configured, resamples the examples (or the
+            (example, run) pairs) and adds the confidence interval of each global score.
+          - When a `line_items` section is configured, matches predicted line items to
+            ground truth line items and summarizes qty/rate/total errors and missing and
+            hallucinated items.
           - Notifies observers for each global metric result.
 
         Args:
             model_file (str): The model output filename.
 
         Returns:
-            tuple: A tuple containing two lists: (global_results, section_results)
-                   or None if processing fails.
+            tuple: (global_results, section_results, latency_results, run_results,
+                   bootstrap_results, line_item_results) or None if processing fails.
+                   `bootstrap_results` maps each metric to its resampled scores (empty when
+                   bootstrap is disabled) and `line_item_results` lists the line-item matching
+                   summaries (empty when line-item matching is disabled).
         """
+        results = self.evaluate_model_file(model_file)
+        if results is not None:
+            self._notify_results(results[0], results[1])
+        return results
+
+    def evaluate_model_file(self, model_file):
+        """
+        Computes the global and per-section metrics of a single model output file
+        without notifying observers.
+
+        When the result cache is enabled, results are looked up by the content hash of
+        the file, the ground truth set and the evaluator configuration, and only
+        computed on a cache miss.
+
+        Args:
+            model_file (str): The model output filename.
+
+        Returns:
+            tuple: (global_results, section_results, latency_results, run_results,
+                   bootstrap_results, line_item_results) or None if processing fails.
+                   `bootstrap_results` maps each metric to its resampled scores (empty when
+                   bootstrap is disabled) and `line_item_results` lists the line-item matching
+                   summaries (empty when line-item matching is disabled).
+        """
+        if self.result_cache is None:
+            return self._compute_model_file(model_file)
+
+        model_output_path = os.path.join(self.model_outputs_dir, model_file)
+        try:
+            with self.profiler.stage("cache_lookup", model_file=model_file):
+                key = self.result_cache.make_key(hash_file(model_output_path), *self._cache_hashes)
+                results = self.result_cache.get(key, model_file)
+        except OSError:
+            return self._compute_model_file(model_file)
+
+        if results is not None:
+            logging.info(f"Using cached results for '{model_file}'.")
+            return results
+
+        results = self._compute_model_file(model_file)
+        if results is not None:
+            self.result_cache.put(key, *results)
+        return results
+
+    def _compute_model_file(self, model_file):
+        """Reads and scores a single model output file (see `evaluate_model_file`)."""
         model_output_path = os.path.join(self.model_outputs_dir, model_file)
         logging.info(f"Processing model output: {model_output_path}")
 
         try:
-            model_adapter = JSONAdapter(model_output_path)
+            with self.profiler.stage("parse_model_output", model_file=model_file) as stage:
+                adapter = get_model_output_adapter(model_output_path)
+                pred_store = adapter.to_model_output_store(self.validation)
+                stage["rows"] = pred_store.n_rows
+            if not adapter.validation_report.valid:
+                logging.warning(f"Dropped invalid predictions: {adapter.validation_report.summary()}")
+        except json.JSONDecodeError as e:
+            logging.error(f"Error loading {model_output_path}: {e}")
+            return None
+        except ValueError as e:
+            logging.warning(f"File '{model_file}' is not a valid model output: {e}")
+            return None
         except Exception as e:
             logging.error(f"Error loading {model_output_path}: {e}")
             return None
 
-        if "estimate_preds" not in model_adapter.data:
-            logging.warning(f"File '{model_file}' is not a valid model output (missing 'estimate_preds').")
-            return None
+        return self.score_model_output(pred_store, model_file)
 
-        predictions = model_adapter.to_model_outputs()
-        gt_dfs, pred_dfs = [], []
-        for prediction in predictions:
-            valid_file = prediction.get('valid_file_name')
-            if valid_file not in self.gt_map:
-                logging.warning(f"Ground truth for '{valid_file}' not found.")
-                continue
-            gt_dfs.append(self.gt_map[valid_file]['df'])
-            pred_dfs.append(prediction['df'])
-
-        if not gt_dfs or not pred_dfs:
-            logging.warning(f"Insufficient data for evaluation in '{model_file}'.")
-            return None
+    def score_model_output(self, pred_store, model_file):
+        """
+        Scores the predictions of a model against the resident ground truth store.
+
+        Used for model output files (see `evaluate_model_file`) and for predictions
+        received in memory, e.g. by the scoring service.
+
+        Args:
+            pred_store (RowStore): Predictions, one segment per prediction, named by
+                'valid_file_name'.
+            model_file (str): Name identifying the model in the results.
+
+        Returns:
+            tuple: (global_results, section_results, latency_results, run_results,
+                   bootstrap_results, line_item_results), or None if no prediction has
+                   a ground truth.
+        """
+        with self.profiler.stage("latency", model_file=model_file) as stage:
+            latency_results = model_latency(pred_store, model_file)
+            stage["rows"] = pred_store.n_segments
+
+        with self.profiler.stage("match_segments", model_file=model_file) as stage:
+            matched = []
+            for index, valid_file in enumerate(pred_store.names):
+                if valid_file not in self.gt_segments:
+                    logging.warning(f"Ground truth for '{valid_file}' not found.")
+                    continue
+                matched.append(index)
 
-        aggregated_gt_df = pd.concat(gt_dfs, ignore_index=True)
-        aggregated_pred_df = pd.concat(pred_dfs, ignore_index=True)
+            if not matched:
+                logging.warning(f"Insufficient data for evaluation in '{model_file}'.")
+                return None
+
+            if len(matched) < pred_store.n_segments:
+                pred_store = pred_store.take_segments(matched)
+            gt_store = self.gt_store.take_segments([self.gt_segments[name] for name in pred_store.names])
+            stage["rows"] = pred_store.n_rows + gt_store.n_rows
 
         global_results = []
         section_results = []
 
-        for metric_name, evaluator in self.evaluators.items():
-            score = evaluate_by_section(evaluator, aggregated_gt_df, aggregated_pred_df)
-            global_results.append({
+        with self.profiler.stage("evaluate", model_file=model_file) as stage:
+            global_scores, section_scores = evaluate_sections(self.evaluators, gt_store, pred_store)
+            run_scores = evaluate_segments(self.evaluators, gt_store, pred_store)
+            stage["rows"] = pred_store.n_rows
+
+        bootstrap_results = {}
+        if self.bootstrap is not None:
+            with self.profiler.stage("bootstrap", model_file=model_file) as stage:
+                bootstrap_results = self._bootstrap_model(gt_store, pred_store)
+                stage["rows"] = self.bootstrap["samples"]
+
+        for metric_name, score in global_scores.items():
+            scores = run_scores[metric_name]
+            n_scored = np.count_nonzero(~np.isnan(scores))
+            result = {
                 'model_file': model_file,
                 'metric': metric_name,
-                'score': score
-            })
-            self.notifier.notify(model_file, metric_name, score)
+                'score': score,
+                'score_run_mean': float(np.nanmean(scores)) if n_scored else np.nan,
+                'score_run_std': float(np.nanstd(scores, ddof=1)) if n_scored > 1 else np.nan
+            }
+            if metric_name in bootstrap_results:
+                result['score_ci_low'], result['score_ci_high'] = confidence_interval(
+                    bootstrap_results[metric_name], self.bootstrap["confidence"])
+            global_results.append(result)
 
-        for metric_name, evaluator in self.evaluators.items():
-            section_scores = evaluate_by_section_per_section(evaluator, aggregated_gt_df, aggregated_pred_df)
-            for section, score in section_scores.items():
+        for metric_name, scores in section_scores.items():
+            for section, score in scores.items():
                 section_results.append({
                     'model_file': model_file,
                     'sectionName': section,
                     'metric': metric_name,
                     'score': score
                 })
-                self.notifier.notify(model_file, f"{metric_name} [{section}]", score)
 
-        return global_results, section_results
+        line_item_results = []
+        if self.line_items is not None:
+            with self.profiler.stage("match_line_items", model_file=model_file) as stage:
+                line_item_results = line_item_report(gt_store, pred_store, model_file,
+                                                     self.line_items["min_similarity"])
+                stage["rows"] = pred_store.n_rows + gt_store.n_rows
+
+        runs = run_indices(pred_store.names)
+        run_results = [
+            {
+                'model_file': model_file,
+                'valid_file_name': valid_file,
+                'run': int(run),
+                'metric': metric_name,
+                'score': float(score)
+            }
+            for metric_name, scores in run_scores.items()
+            for valid_file, run, score in zip(pred_store.names, runs, scores)
+        ]
+
+        return global_results, section_results, latency_results, run_results, bootstrap_results, line_item_results
+
+    def _bootstrap_model(self, gt_store, pred_store):
+        """
+        Computes the bootstrap samples of every global score of a model file.
+
+        With the 'example' unit, the resamples are drawn over all ground truth examples
+        with the configured seed, so every model file (in any worker) gets the same
+        resamples and the samples of different models are paired. With the 'run' unit,
+        the (example, run) pairs of the file are resampled.
+
+        Args:
+            gt_store (RowStore): Ground truth rows, segment-aligned with `pred_store`.
+            pred_store (RowStore): Predictions of the model file.
+
+        Returns:
+            dict: Maps each metric to an array with its resampled scores.
+        """
+        samples, seed = self.bootstrap["samples"], self.bootstrap["seed"]
+        if self.bootstrap["unit"] == "run":
+            units = unit_section_totals(gt_store, pred_store)
+            counts = resample_counts(pred_store.n_segments, samples, seed)
+        else:
+            units = unit_section_totals(gt_store, pred_store, self.gt_store.names)
+            if self._bootstrap_counts is None:
+                self._bootstrap_counts = resample_counts(self.gt_store.n_segments, samples, seed)
+            counts = self._bootstrap_counts
+        return bootstrap_scores(self.evaluators, counts, *units)
+
+    def _notify_results(self, global_results, section_results):
+        """
+        Notifies observers about the results of one model file as a single batch,
+        global metrics first and then per-section metrics.
+
+        Args:
+            global_results (list): Global results as returned by `evaluate_model_file`.
+            section_results (list): Section results as returned by `evaluate_model_file`.
+        """
+        with self.profiler.stage("notify") as stage:
+            events = make_events(global_results, section_results)
+            self.notifier.notify_batch(events)
+            stage["rows"] = len(events)
+
+    def _iter_results(self, model_files):
+        """
+        Yields the results of each model file in the given order.
+
+        With `workers > 1` the files are evaluated by a process pool and observers are
+        notified here, in file order, as results are collected. The pool is shut down
+        afterwards, unless `keep_workers` is set.
+
+        Args:
+            model_files (list): Model output filenames.
+
+        Yields:
+            tuple or None: The results of each file, as returned by `process_model_file`.
+        """
+        if self.workers == 1 or len(model_files) < 2:
+            for model_file in model_files:
+                yield self.process_model_file(model_file)
+            return
+
+        workers = self.workers if self.keep_workers else min(self.workers, len(model_files))
+        logging.info(f"Evaluating {len(model_files)} model files with {workers} workers.")
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=workers,
+                                                 initializer=_init_worker,
+                                                 initargs=(self.config, self.evaluators, self.use_cache))
+        try:
+            for results, records in self._executor.map(_evaluate_in_worker, model_files):
+                self.profiler.add_records(records)
+                if results is not None:
+                    self._notify_results(results[0], results[1])
+                yield results
+        except BrokenProcessPool:
+            self.close_workers()
+            raise
+        finally:
+            if not self.keep_workers:
+                self.close_workers()
+
+    def close_workers(self):
+        """Shuts down the worker pool, if any; the next evaluation starts a new one."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
 
     def run(self):
         """
         Runs the evaluation pipeline on all model output files and generates reports.
-        
-        Aggregates results from all files and then uses a report generator to export the results.
+
+        Files are evaluated in filename order, in parallel when `workers` is greater than 1,
+        then the reports are written (see `write_reports`).
+        """
+        self.results = {}
+        self.evaluate_files(sorted(os.listdir(self.model_outputs_dir)))
+        self.write_reports()
+
+    def evaluate_files(self, model_files):
+        """
+        Evaluates model files and keeps their results in `self.results`, replacing the
+        results of files evaluated before. Files that cannot be evaluated are dropped.
+        Buffered observers are flushed once every file has been evaluated.
+
+        Args:
+            model_files (list): Model output filenames.
+        """
+        try:
+            with self.profiler.stage("evaluate_model_files") as stage:
+                for model_file, results in zip(model_files, self._iter_results(model_files)):
+                    if results is None:
+                        self.results.pop(model_file, None)
+                    else:
+                        self.results[model_file] = results
+                stage["model_files"] = len(model_files)
+        finally:
+            with self.profiler.stage("flush_observers"):
+                self.notifier.flush()
+
+    def remove_files(self, model_files):
+        """
+        Drops the results of model files, e.g. after they were deleted.
+
+        Args:
+            model_files (list): Model output filenames.
+        """
+        for model_file in model_files:
+            self.results.pop(model_file, None)
+
+    def write_reports(self, atomic: bool = False):
+        """
+        Exports the results of every evaluated model file, in filename order.
+
+        Reports: global scores (with the mean and standard deviation of the per-run scores,
+        the model latency statistics and the latency/score Pareto flag), per-section scores,
+        per-example latency and per-(example, run) scores. When bootstrap is enabled, the
+        global scores get confidence intervals and the pairwise significance of the models
+        is written to `<output_path>_significance`. When line-item matching is enabled, its
+        summaries are written to `<output_path>_line_items`. When profiling is enabled, the
+        stage measurements are written to `<output_path>_profile.json`.
+
+        Args:
+            atomic (bool): Whether to replace each report atomically, so that readers never
+                see a partially written file.
+        """
+        report_generator = ReportGenerator(self.report_format)
+        self._export_reports(lambda report_df, output, _: report_generator.generate(report_df, output, atomic))
+
+    def update_reports(self, model_files=None):
+        """
+        Updates the reports of a long-running pipeline (watch mode) after model files were
+        evaluated again or removed.
+
+        Reports written to files are rewritten atomically from the results of every model
+        file. Reports appending to their output (SQLite) keep a single run for the life of
+        the pipeline: only the rows of `model_files` are replaced in the per-model reports,
+        while the global and significance reports, which compare the models, are replaced
+        whole.
+
+        Args:
+            model_files (list, optional): Model files evaluated again or removed since the
+                last update. Defaults to every model file.
+        """
+        if self._report_generator is None:
+            self._report_generator = ReportGenerator(self.report_format)
+        self._export_reports(lambda report_df, output, per_model: self._report_generator.update(
+            report_df, output, model_files if per_model else None))
+
+    def _export_reports(self, write):
+        """
+        Builds the reports from the results of every evaluated model file, in filename
+        order, and writes them (see `write_reports`).
+
+        Args:
+            write (callable): Called as `write(report_df, output_path, per_model)` for each
+                report; `per_model` tells whether each row belongs to a single model file.
         """
         all_global_results = []
         all_section_results = []
+        all_latency_results = []
+        all_run_results = []
+        all_bootstrap_results = {}
+        all_line_item_results = []
 
-        for model_file in os.listdir(self.model_outputs_dir):
-            results = self.process_model_file(model_file)
-            if results is None:
-                continue
-            global_results, section_results = results
+        for model_file in sorted(self.results):
+            (global_results, section_results, latency_results, run_results, bootstrap_results,
+             line_item_results) = self.results[model_file]
             all_global_results.extend(global_results)
             all_section_results.extend(section_results)
+            all_latency_results.extend(latency_results)
+            all_run_results.extend(run_results)
+            all_line_item_results.extend(line_item_results)
+            if bootstrap_results:
+                all_bootstrap_results[model_file] = bootstrap_results
 
-        global_df = pd.DataFrame(all_global_results)
+        latency_df = pd.DataFrame(all_latency_results)
+        global_df = add_latency_columns(pd.DataFrame(all_global_results), latency_df)
         section_df = pd.DataFrame(all_section_results)
+        run_df = pd.DataFrame(all_run_results)
 
         eval_config = self.config.get("evaluation", {})
         output_path = eval_config.get("output_path", "reports/evaluation_report")
         base_output = os.path.splitext(output_path)[0]
 
-        global_output = f"{base_output}_global.{self.report_format}"
-        section_output = f"{base_output}_by_section.{self.report_format}"
+        outputs = []
+        with self.profiler.stage("write_reports") as stage:
+            reports = [(global_df, "global", False), (section_df, "by_section", True),
+                       (latency_df, "latency", True), (run_df, "by_run", True)]
+            if self.bootstrap is not None:
+                reports.append((self._significance(all_bootstrap_results), "significance", False))
+            if self.line_items is not None:
+                reports.append((pd.DataFrame(all_line_item_results), "line_items", True))
+            for report_df, suffix, per_model in reports:
+                output = f"{base_output}_{suffix}.{self.report_format}"
+                write(report_df, output, per_model)
+                outputs.append(output)
+            stage["rows"] = sum(len(report_df) for report_df, _, _ in reports)
 
-        report_generator = ReportGenerator(self.report_format)
-        report_generator.generate(global_df, global_output)
-        report_generator.generate(section_df, section_output)
+        logging.info(f"Reports successfully exported: {', '.join(outputs)}")
 
-        logging.info(f"Reports successfully exported: {global_output} and {section_output}")
+        self.profiler.write(f"{base_output}_profile.json")
+
+    def _significance(self, bootstrap_results):
+        """
+        Builds the pairwise significance report from the bootstrap samples of all models.
+
+        Args:
+            bootstrap_results (dict): Maps each model file to its bootstrap samples per metric.
+
+        Returns:
+            pd.DataFrame: One row per metric and ordered pair of models, with 'p_better'
+                          and 'significantly_better' (see `significance_matrix`).
+        """
+        rows = []
+        for metric_name in self.evaluators:
+            samples = {model_file: results[metric_name] for model_file, results in bootstrap_results.items()
+                       if metric_name in results}
+            rows += [{'metric': metric_name, **row}
+                     for row in significance_matrix(samples, self.bootstrap["confidence"])]
+        return pd.DataFrame(rows, columns=['metric', 'model_file', 'other_model_file', 'p_better',
+                                           'significantly_better'])
@@ -4,6 +4,8 @@ from evaluators.base_evaluator import BaseEvaluator
 class MAE(BaseEvaluator):
     """Mean Absolute Error (MAE) evaluator."""
 
+    supports_aligned_arrays = True
+
     def evaluate(self, ground_truth, predictions):
         """
         Compute MAE.
@@ -17,4 +19,45 @@ class MAE(BaseEvaluator):
         """
         ground_truth = np.array(ground_truth)
         predictions = np.array(predictions)
-        return np.mean(np.abs(ground_truth - predictions))
+        return self.evaluate_aligned(ground_truth, predictions)
+
+    def evaluate_aligned(self, ground_truth: np.ndarray, predictions: np.ndarray):
+        """
+        Compute MAE on pre-aligned arrays, without copying them.
+
+        Args:
+            ground_truth (np.ndarray): Actual values.
+            predictions (np.ndarray): Predicted values, aligned with `ground_truth`.
+
+        Returns:
+            float: MAE score (lower is better).
+        """
+        return np.mean(self.evaluate_elementwise(ground_truth, predictions))
+
+    def evaluate_elementwise(self, ground_truth: np.ndarray, predictions: np.ndarray) -> np.ndarray:
+        """
+        Compute the absolute error of each element, in a single vectorized call.
+
+        Args:
+            ground_truth (np.ndarray): Actual values.
+            predictions (np.ndarray): Predicted values, aligned with `ground_truth`.
+
+        Returns:
+            np.ndarray: Score of each element.
+        """
+        return np.abs(ground_truth - predictions)
+
+    def evaluate_grouped(self, ground_truth: np.ndarray, predictions: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Compute the score of each group (row) of pre-aligned matrices in a single
+        vectorized call, averaging the element scores flagged in `mask`.
+
+        Args:
+            ground_truth (np.ndarray): Actual values, shape (n_groups, n_elements).
+            predictions (np.ndarray): Predicted values, same shape as `ground_truth`.
+            mask (np.ndarray): Boolean matrix of the elements belonging to each group.
+
+        Returns:
+            np.ndarray: Score of each group, NaN for groups without elements.
+        """
+        return self.masked_row_mean(self.evaluate_elementwise(ground_truth, predictions), mask)
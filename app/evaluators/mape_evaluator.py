@@ -4,6 +4,8 @@ from evaluators.base_evaluator import BaseEvaluator
 class MAPE(BaseEvaluator):
     """Mean Absolute Percentage Error (MAPE) evaluator."""
 
+    supports_aligned_arrays = True
+
     def evaluate(self, ground_truth, predictions):
         """
         Compute MAPE.
@@ -17,7 +19,49 @@ class MAPE(BaseEvaluator):
         """
         ground_truth = np.array(ground_truth)
         predictions = np.array(predictions)
+        return self.evaluate_aligned(ground_truth, predictions)
+
+    def evaluate_aligned(self, ground_truth: np.ndarray, predictions: np.ndarray):
+        """
+        Compute MAPE on pre-aligned arrays, without copying them.
+
+        Args:
+            ground_truth (np.ndarray): Actual values.
+            predictions (np.ndarray): Predicted values, aligned with `ground_truth`.
+
+        Returns:
+            float: MAPE score in percentage (lower is better).
+        """
+        return np.nanmean(self.evaluate_elementwise(ground_truth, predictions))
+
+    def evaluate_elementwise(self, ground_truth: np.ndarray, predictions: np.ndarray) -> np.ndarray:
+        """
+        Compute the absolute percentage error of each element, in a single vectorized call.
+        Elements whose ground truth is zero get NaN.
 
+        Args:
+            ground_truth (np.ndarray): Actual values.
+            predictions (np.ndarray): Predicted values, aligned with `ground_truth`.
+
+        Returns:
+            np.ndarray: Score of each element.
+        """
         ground_truth = np.where(ground_truth == 0, np.nan, ground_truth)
 
-        return np.nanmean(np.abs((ground_truth - predictions) / ground_truth)) * 100
+        return np.abs((ground_truth - predictions) / ground_truth) * 100
+
+    def evaluate_grouped(self, ground_truth: np.ndarray, predictions: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Compute the score of each group (row) of pre-aligned matrices in a single
+        vectorized call, averaging the element scores flagged in `mask`. NaN element
+        scores are skipped, as in `evaluate_aligned`.
+
+        Args:
+            ground_truth (np.ndarray): Actual values, shape (n_groups, n_elements).
+            predictions (np.ndarray): Predicted values, same shape as `ground_truth`.
+            mask (np.ndarray): Boolean matrix of the elements belonging to each group.
+
+        Returns:
+            np.ndarray: Score of each group, NaN for groups without elements.
+        """
+        return self.masked_row_mean(self.evaluate_elementwise(ground_truth, predictions), mask, ignore_nan=True)
@@ -0,0 +1,538 @@
+import json
+import math
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+import numpy as np
+
+from adapters.json_adapter import JSONAdapter
+from adapters.validation import SchemaValidationError
+from evaluators.evaluator_pipeline import EvaluationPipeline
+from observers.evaluation_notifier import EvaluationNotifier
+from utils.latency import LATENCY_QUANTILES
+from utils.profiling import max_profile_records
+
+# Pipeline instance owned by each worker process when the service runs with `workers > 1`.
+_worker_pipeline = None
+
+# Number of most recent requests summarized by the latency percentiles of `/metrics`.
+LATENCY_WINDOW = 1024
+
+DEFAULT_MODEL_FILE = "request"
+
+
+class ScoringError(ValueError):
+    """
+    A scoring request that cannot be served, with the HTTP status of the answer and
+    optional details added to its body (e.g. the schema validation report).
+    """
+
+    def __init__(self, message: str, status: int = HTTPStatus.BAD_REQUEST, details: dict = None):
+        super().__init__(message)
+        self.status = int(status)
+        self.details = details or {}
+
+    def __reduce__(self):
+        # Keeps the status and details when the error is sent back by a worker process.
+        return type(self), (str(self), self.status, self.details)
+
+
+def score_payload(pipeline: EvaluationPipeline, payload, model_file: str = DEFAULT_MODEL_FILE) -> dict:
+    """
+    Scores a model output payload against the ground truth store of a pipeline.
+
+    Args:
+        pipeline (EvaluationPipeline): Pipeline holding the ground truth and the evaluators.
+        payload (dict, bytes or str): Model output in the `estimate_preds` schema, parsed or
+            as JSON text.
+        model_file (str): Name identifying the model in the results.
+
+    Returns:
+        dict: 'model_file', 'global' (global scores, as in the global report), 'by_section'
+              (per-section scores), 'latency' (latency statistics), 'line_items' when
+              line-item matching is configured and 'validation' (the schema validation
+              report) when invalid predictions were dropped.
+
+    Raises:
+        ScoringError: If the payload is not a valid model output (400, with the
+            'validation' report when it does not match the schema) or none of its
+            predictions has a ground truth (422).
+    """
+    if isinstance(payload, (bytes, str)):
+        try:
+            payload = json.loads(payload)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ScoringError(f"Invalid JSON: {e}")
+    if not isinstance(payload, dict):
+        raise ScoringError("The payload must be a JSON object with an 'estimate_preds' list.")
+
+    adapter = JSONAdapter(model_file, data=payload)
+    try:
+        pred_store = adapter.to_model_output_store(pipeline.validation)
+    except SchemaValidationError as e:
+        raise ScoringError(f"Invalid model output: {e}", details={"validation": e.report.to_dict()})
+    except (ValueError, TypeError, AttributeError) as e:
+        raise ScoringError(f"Invalid model output: {e}")
+    if pred_store.n_segments == 0:
+        raise ScoringError("The payload has no valid prediction.")
+
+    results = pipeline.score_model_output(pred_store, model_file)
+    if results is None:
+        raise ScoringError("No prediction matches a ground truth example.", HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    global_results, section_results, latency_results, _, _, line_item_results = results
+    response = {"model_file": model_file, "global": global_results, "by_section": section_results,
+                "latency": latency_results}
+    if pipeline.line_items is not None:
+        response["line_items"] = line_item_results
+    if not adapter.validation_report.valid:
+        response["validation"] = adapter.validation_report.to_dict()
+    return response
+
+
+def _score_batch(pipeline: EvaluationPipeline, requests: list) -> list:
+    """
+    Scores a batch of (payload, model_file) requests.
+
+    Returns:
+        list: The response of each request, or the `ScoringError` it failed with.
+    """
+    results = []
+    for payload, model_file in requests:
+        try:
+            results.append(score_payload(pipeline, payload, model_file))
+        except ScoringError as e:
+            results.append(e)
+        except Exception as e:
+            logging.exception(f"Scoring of '{model_file}' failed.")
+            results.append(ScoringError(f"Scoring failed: {e}", HTTPStatus.INTERNAL_SERVER_ERROR))
+    return results
+
+
+def _init_worker(config, evaluators):
+    """
+    Initializes a worker process of the scoring pool.
+
+    The ground truth map is loaded once per worker and reused for every request.
+    """
+    global _worker_pipeline
+    _worker_pipeline = EvaluationPipeline(config, evaluators, notifier=EvaluationNotifier(), use_cache=False)
+    _worker_pipeline.profiler.limit(max_profile_records(config))
+
+
+def _worker_ready() -> bool:
+    """Tells whether a worker process finished its initialization."""
+    return _worker_pipeline is not None
+
+
+def _score_in_worker(requests):
+    """Scores a chunk of a batch inside a worker process (see `_score_batch`)."""
+    return _score_batch(_worker_pipeline, requests)
+
+
+def _json_ready(value):
+    """Converts results to JSON-compatible values: NaN and infinities become None."""
+    if isinstance(value, dict):
+        return {str(key): _json_ready(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_ready(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class ScoringService:
+    """
+    Scores model output payloads against a resident pipeline, in batches.
+
+    Requests are queued and a dispatcher thread groups them in batches of up to
+    `max_batch_size` requests, waiting at most `max_batch_wait_ms` after the first one.
+    With one worker, batches are scored by the resident pipeline in the dispatcher
+    thread. With more, each batch is split across a process pool whose workers hold
+    their own pipeline (ground truth loaded once per worker) and also parse the
+    payloads, so the CPU-bound work runs in parallel. Requests arriving while a batch
+    is scored form the next batch. When a worker process dies, the batch fails, the pool
+    is replaced and the service reports itself unavailable until a new worker is ready.
+    When profiling is enabled, the pipelines keep only
+    their most recent stage records (`profile.max_records`).
+    """
+
+    def __init__(self, pipeline: EvaluationPipeline, workers: int = 1, max_batch_size: int = 16,
+                 max_batch_wait_ms: float = 2.0, max_queue_size: int = 1000):
+        """
+        Initializes the service.
+
+        Args:
+            pipeline (EvaluationPipeline): Pipeline holding the ground truth and the evaluators.
+            workers (int): Number of scoring processes (1 scores in the dispatcher thread).
+            max_batch_size (int): Maximum number of requests scored as one batch.
+            max_batch_wait_ms (float): Time the dispatcher waits for more requests after
+                the first request of a batch.
+            max_queue_size (int): Maximum number of pending requests; more are rejected.
+        """
+        self.pipeline = pipeline
+        self.pipeline.profiler.limit(max_profile_records(pipeline.config))
+        self.workers = max(1, int(workers))
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_batch_wait_sec = max(0.0, float(max_batch_wait_ms)) / 1000
+        self._queue = queue.Queue(max(1, int(max_queue_size)))
+        self._executor = None
+        self._pool_ready = True
+        self._ready_probe = None
+        self._thread = None
+        self._started_at = None
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._counters = {"requests_total": 0, "requests_failed": 0, "requests_rejected": 0, "batches_total": 0}
+
+    @classmethod
+    def from_config(cls, pipeline: EvaluationPipeline, config: dict) -> "ScoringService":
+        """
+        Creates a service from the `service` section of the configuration.
+
+        Args:
+            pipeline (EvaluationPipeline): Pipeline holding the ground truth and the evaluators.
+            config (dict): Configuration dictionary.
+
+        Returns:
+            ScoringService: The service (not started).
+        """
+        service_config = config.get("service") or {}
+        return cls(pipeline,
+                   workers=service_config.get("workers", 1),
+                   max_batch_size=service_config.get("max_batch_size", 16),
+                   max_batch_wait_ms=service_config.get("max_batch_wait_ms", 2.0),
+                   max_queue_size=service_config.get("max_queue_size", 1000))
+
+    def start(self):
+        """Starts the worker pool, if any, and the dispatcher thread."""
+        if self.workers > 1:
+            self._executor = self._new_pool()
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._dispatch, name="scoring-dispatcher", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Scores the pending requests, then stops the dispatcher thread and the worker pool."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        """Creates the worker pool; each worker loads its own pipeline."""
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(self.pipeline.config, self.pipeline.evaluators))
+
+    def _replace_pool(self):
+        """
+        Replaces a broken worker pool. The service is unavailable until a worker of the
+        new pool has loaded its pipeline.
+        """
+        self._pool_ready = False
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._new_pool()
+        self._ready_probe = self._executor.submit(_worker_ready)
+        self._ready_probe.add_done_callback(self._on_ready_probe)
+
+    def _on_ready_probe(self, probe: Future):
+        """Marks the pool as ready once the probe of the current pool succeeds."""
+        if probe is self._ready_probe and not probe.cancelled() and probe.exception() is None:
+            self._pool_ready = probe.result()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, payload, model_file: str = DEFAULT_MODEL_FILE) -> Future:
+        """
+        Queues a payload for scoring.
+
+        Args:
+            payload (dict, bytes or str): Model output (see `score_payload`).
+            model_file (str): Name identifying the model in the results.
+
+        Returns:
+            Future: Resolves to the response of `score_payload`, or fails with its `ScoringError`.
+
+        Raises:
+            ScoringError: If the queue is full (503).
+        """
+        future = Future()
+        try:
+            self._queue.put_nowait((payload, model_file, future, time.perf_counter()))
+        except queue.Full:
+            with self._lock:
+                self._counters["requests_rejected"] += 1
+            raise ScoringError("Too many pending requests.", HTTPStatus.SERVICE_UNAVAILABLE)
+        return future
+
+    def score(self, payload, model_file: str = DEFAULT_MODEL_FILE, timeout: float = None) -> dict:
+        """
+        Scores a payload and waits for the response.
+
+        Args:
+            payload (dict, bytes or str): Model output (see `score_payload`).
+            model_file (str): Name identifying the model in the results.
+            timeout (float, optional): Maximum time to wait, in seconds.
+
+        Returns:
+            dict: The response of `score_payload`.
+
+        A request that times out while still queued is not scored; once its batch is
+        being scored, the work runs to completion and the response is discarded.
+
+        Raises:
+            ScoringError: If the request fails, is rejected or times out (504).
+        """
+        future = self.submit(payload, model_file)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()  # Only succeeds while the request is queued.
+            raise ScoringError("Scoring timed out.", HTTPStatus.GATEWAY_TIMEOUT)
+
+    def _dispatch(self):
+        """Collects the queued requests in batches and scores them, until `close` is called."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.perf_counter() + self.max_batch_wait_sec
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.perf_counter()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._score(batch)
+
+    def _score(self, batch: list):
+        """Scores a batch of queued requests and resolves their futures."""
+        batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        requests = [(payload, model_file) for payload, model_file, _, _ in batch]
+        try:
+            if self._executor is None:
+                results = _score_batch(self.pipeline, requests)
+            else:
+                chunk_size = -(-len(requests) // self.workers)
+                futures = [self._executor.submit(_score_in_worker, requests[start:start + chunk_size])
+                           for start in range(0, len(requests), chunk_size)]
+                results = [result for future in futures for result in future.result()]
+                self._pool_ready = True
+        except BrokenProcessPool as e:
+            logging.error(f"Scoring batch failed, restarting the worker pool: {e}")
+            self._replace_pool()
+            results = [ScoringError(f"Scoring failed: {e}", HTTPStatus.INTERNAL_SERVER_ERROR)] * len(batch)
+        except Exception as e:
+            logging.error(f"Scoring batch failed: {e}")
+            results = [ScoringError(f"Scoring failed: {e}", HTTPStatus.INTERNAL_SERVER_ERROR)] * len(batch)
+
+        finished = time.perf_counter()
+        with self._lock:
+            self._counters["batches_total"] += 1
+            self._counters["requests_total"] += len(batch)
+            self._counters["requests_failed"] += sum(isinstance(result, ScoringError) for result in results)
+            self._latencies.extend(finished - submitted for _, _, _, submitted in batch)
+        for (_, _, future, _), result in zip(batch, results):
+            if isinstance(result, ScoringError):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def health(self) -> dict:
+        """
+        Reports whether the service can score requests.
+
+        Returns:
+            dict: 'status' ('ok' or 'unavailable', e.g. while a broken worker pool is
+                  replaced), the number of ground truth examples and the evaluated metrics.
+        """
+        running = self._thread is not None and self._thread.is_alive() and self._pool_ready
+        return {"status": "ok" if running else "unavailable",
+                "ground_truth_examples": self.pipeline.gt_store.n_segments,
+                "metrics": list(self.pipeline.evaluators)}
+
+    def metrics(self) -> dict:
+        """
+        Reports the request counters, the mean batch size, the queue size and the
+        latency percentiles of the most recent requests (from queueing to response).
+
+        Returns:
+            dict: The service metrics.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            latencies = np.array(self._latencies, dtype=np.float64)
+        quantiles = (np.quantile(latencies, LATENCY_QUANTILES) if len(latencies)
+                     else np.full(len(LATENCY_QUANTILES), np.nan))
+        metrics = {
+            "uptime_sec": time.monotonic() - self._started_at if self._started_at is not None else 0.0,
+            "workers": self.workers,
+            "queue_size": self._queue.qsize(),
+            **counters,
+            "mean_batch_size": (counters["requests_total"] / counters["batches_total"]
+                                if counters["batches_total"] else np.nan),
+        }
+        for quantile, value in zip(LATENCY_QUANTILES, quantiles):
+            metrics[f"latency_p{round(quantile * 100)}_ms"] = float(value) * 1000
+        return metrics
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP endpoints of the scoring service:
+      - POST /score[?model_file=<name>]: scores the model output in the request body.
+      - GET /health: service status (503 when it cannot score requests).
+      - GET /metrics: request counters, batching and latency statistics.
+    Responses are JSON; errors are {"error": <message>}, with the 'validation' report
+    when the payload does not match the model output schema.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        service = self.server.service
+        if path == "/health":
+            health = service.health()
+            status = HTTPStatus.OK if health["status"] == "ok" else HTTPStatus.SERVICE_UNAVAILABLE
+            self._send_json(status, health)
+        elif path == "/metrics":
+            self._send_json(HTTPStatus.OK, service.metrics())
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint: {path}"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/score":
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown endpoint: {url.path}")
+            return
+        if self.headers["Content-Length"] is None:
+            self._send_error(HTTPStatus.LENGTH_REQUIRED, "A Content-Length header is required.")
+            return
+        try:
+            length = int(self.headers["Content-Length"])
+        except ValueError:
+            length = -1
+        if length < 0:
+            # A negative length would make `rfile.read` wait for the client to close the connection.
+            self._send_error(HTTPStatus.BAD_REQUEST, "The Content-Length header must be a non-negative integer.")
+            return
+        if length > self.server.max_body_bytes:
+            self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                             f"The payload exceeds {self.server.max_body_bytes} bytes.")
+            return
+
+        body = self.rfile.read(length)
+        model_file = parse_qs(url.query).get("model_file", [DEFAULT_MODEL_FILE])[0]
+        try:
+            response = self.server.service.score(body, model_file, self.server.request_timeout_sec)
+        except ScoringError as e:
+            self._send_json(e.status, {"error": str(e), **e.details})
+            return
+        self._send_json(HTTPStatus.OK, response)
+
+    def _send_error(self, status: int, message: str):
+        """Answers an error before the request body was read, then closes the connection."""
+        self.close_connection = True
+        self._send_json(status, {"error": message})
+
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(_json_ready(body), allow_nan=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logging.debug(f"{self.address_string()} - {format % args}")
+
+
+class ScoringServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering the requests of a `ScoringService`."""
+
+    daemon_threads = True
+    # Pending connections accepted by the socket while the handler threads start.
+    request_queue_size = 128
+
+    def __init__(self, service: ScoringService, host: str = "0.0.0.0", port: int = 8080,
+                 max_body_mb: float = 32, request_timeout_sec: float = 30.0):
+        """
+        Initializes the server and binds it to (host, port).
+
+        Args:
+            service (ScoringService): Service scoring the requests.
+            host (str): Address to listen on.
+            port (int): Port to listen on (0 picks a free port).
+            max_body_mb (float): Maximum size of a request body, in MB.
+            request_timeout_sec (float): Maximum time to wait for the scores of a request.
+        """
+        super().__init__((host, int(port)), ScoringRequestHandler)
+        self.service = service
+        self.max_body_bytes = int(float(max_body_mb) * 1024 * 1024)
+        self.request_timeout_sec = float(request_timeout_sec)
+
+    @classmethod
+    def from_config(cls, service: ScoringService, config: dict) -> "ScoringServer":
+        """
+        Creates a server from the `service` section of the configuration.
+
+        Args:
+            service (ScoringService): Service scoring the requests.
+            config (dict): Configuration dictionary.
+
+        Returns:
+            ScoringServer: The bound server.
+        """
+        service_config = config.get("service") or {}
+        return cls(service,
+                   host=service_config.get("host", "0.0.0.0"),
+                   port=service_config.get("port", 8080),
+                   max_body_mb=service_config.get("max_body_mb", 32),
+                   request_timeout_sec=service_config.get("request_timeout_sec", 30.0))
+
+
+def serve(pipeline: EvaluationPipeline, config: dict):
+    """
+    Runs the scoring service until the process is interrupted.
+
+    Args:
+        pipeline (EvaluationPipeline): Pipeline holding the ground truth and the evaluators.
+        config (dict): Configuration dictionary (see the `service` section).
+    """
+    with ScoringService.from_config(pipeline, config) as service:
+        with ScoringServer.from_config(service, config) as server:
+            host, port = server.server_address[:2]
+            logging.info(f"Scoring service listening on http://{host}:{port} "
+                         f"({service.workers} worker(s), batches of up to {service.max_batch_size}).")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                logging.info("Scoring service stopped.")
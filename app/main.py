@@ -1,53 +1,167 @@
 import os
-import yaml
+import sys
 import logging
+import argparse
 
-from evaluators.mae_evaluator import MAE
-from evaluators.mre_evaluator import MRE
-from evaluators.mape_evaluator import MAPE
-from evaluators.evaluator_pipeline import EvaluationPipeline
-from evaluators.asymmetric_evaluator import AsymmetricLoss
+from utils.config import DEFAULT_CONFIG_PATH, load_config, validate_config
+from utils.registry import EVALUATORS
 
-from observers.evaluation_notifier import EvaluationNotifier
-from observers.console_logger import ConsoleLogger
-from observers.file_logger import FileLogger
+# The evaluation modules (and pandas, numpy and pyarrow with them) are imported by the
+# commands that use them, so `validate-config` and `list-metrics` start without them.
 
-EVALUATOR_MAPPING = {
-    "MAE": MAE,
-    "MRE": MRE,
-    "MAPE": MAPE,
-    "ASYMMETRIC": AsymmetricLoss,
-}
+COMMANDS = ("evaluate", "validate-config", "list-metrics")
+DEFAULT_COMMAND = "evaluate"
 
-if __name__ == "__main__":
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-    CONFIG_PATH = os.getenv("CONFIG_PATH", "config.yaml")
-    if os.path.exists(CONFIG_PATH):
-        with open(CONFIG_PATH, "r") as f:
-            config = yaml.safe_load(f)
-        logging.info(f"Configuration loaded from: {CONFIG_PATH}")
-    else:
-        config = {}
-        logging.info("Configuration file not found. Using default values.")
+def create_evaluators(metric_names: list) -> dict:
+    """
+    Instantiates the evaluators of the configured metrics, importing only their modules.
 
-    metric_names = config.get("evaluation", {}).get("metrics", [])
+    Args:
+        metric_names (list): Metric names (case insensitive).
 
+    Returns:
+        dict: Maps each supported metric name (upper case) to its evaluator instance.
+    """
     evaluators = {}
     for metric in metric_names:
         metric_upper = metric.upper()
-        if metric_upper in EVALUATOR_MAPPING:
-            evaluators[metric_upper] = EVALUATOR_MAPPING[metric_upper]()
+        if metric_upper in EVALUATORS:
+            evaluators[metric_upper] = EVALUATORS.create(metric_upper)
         else:
             logging.warning(f"Unsupported metric specified in config: {metric}")
+    return evaluators
+
+
+def evaluate(args) -> int:
+    """Runs the evaluation pipeline once, in watch mode or as a scoring service."""
+    from evaluators.evaluator_pipeline import EvaluationPipeline
+    from observers.notifier_factory import create_notifier
 
+    config = load_config(args.config)
+    if args.profile:
+        config.setdefault("profile", {})["enabled"] = True
+
+    evaluators = create_evaluators(config.get("evaluation", {}).get("metrics", []))
     report_format = config.get("evaluation", {}).get("format", "csv")
 
-    notifier = EvaluationNotifier()
-    notifier.add_observer(ConsoleLogger())
-    log_file = config.get("log_file")
-    if log_file:
-        notifier.add_observer(FileLogger(log_file))
+    notifier = create_notifier(config)
+
+    with notifier:
+        # Created inside the block so the notifier is closed when the pipeline setup fails.
+        pipeline = EvaluationPipeline(config, evaluators, report_format=report_format, notifier=notifier,
+                                      use_cache=not args.no_cache)
+        if args.watch:
+            from evaluators.evaluation_watcher import EvaluationWatcher
+            EvaluationWatcher.from_config(pipeline, config).watch()
+        elif args.serve:
+            from evaluators.scoring_service import serve
+            serve(pipeline, config)
+        else:
+            pipeline.run()
+    return 0
+
+
+def validate(args) -> int:
+    """Checks the configuration file and prints the problems found."""
+    if not os.path.exists(args.config):
+        print(f"[CONFIG] Configuration file not found: {args.config}", file=sys.stderr)
+        return 1
+    try:
+        errors = validate_config(load_config(args.config))
+    except ValueError as e:
+        errors = [str(e)]
+    for error in errors:
+        print(f"[CONFIG] {error}", file=sys.stderr)
+    if errors:
+        print(f"[CONFIG] {args.config}: {len(errors)} problem(s) found.", file=sys.stderr)
+        return 1
+    print(f"[CONFIG] {args.config} is valid.")
+    return 0
+
+
+def list_metrics(args) -> int:
+    """Prints the registered metrics and the classes implementing them."""
+    width = max(len(name) for name in EVALUATORS.names())
+    for name in EVALUATORS.names():
+        print(f"{name:<{width}}  {EVALUATORS.path(name)}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the command line parser with its subcommands."""
+    parser = argparse.ArgumentParser(prog="main.py", description="Evaluate model outputs against the ground truth.")
+    parser.add_argument("--config", default=os.getenv("CONFIG_PATH", DEFAULT_CONFIG_PATH),
+                        help="Configuration file (default: $CONFIG_PATH or config.yaml).")
+    parser.add_argument("--profile-imports", action="store_true",
+                        help="Run the command with import timing and print the slowest imports.")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    evaluate_parser = commands.add_parser("evaluate", help="Evaluate the model outputs and write the reports "
+                                                           "(default command).")
+    evaluate_parser.add_argument("--no-cache", action="store_true",
+                                 help="Ignore cached results and re-evaluate every model file.")
+    evaluate_parser.add_argument("--profile", action="store_true",
+                                 help="Record per-stage timings and memory in a profile file next to the reports.")
+    mode = evaluate_parser.add_mutually_exclusive_group()
+    mode.add_argument("--watch", action="store_true",
+                      help="Keep running and re-evaluate model files as they are added or changed.")
+    mode.add_argument("--serve", action="store_true",
+                      help="Run an HTTP service scoring model outputs posted to /score.")
+    evaluate_parser.set_defaults(handler=evaluate)
+
+    validate_parser = commands.add_parser("validate-config", help="Check the configuration file.")
+    validate_parser.set_defaults(handler=validate)
 
-    pipeline = EvaluationPipeline(config, evaluators, report_format=report_format, notifier=notifier)
-    pipeline.run()
+    list_parser = commands.add_parser("list-metrics", help="List the available metrics.")
+    list_parser.set_defaults(handler=list_metrics)
+    return parser
+
+
+def with_default_command(argv: list) -> list:
+    """
+    Inserts the default command when none is given, so `main.py --watch` keeps working.
+
+    Args:
+        argv (list): Command line arguments, without the program name.
+
+    Returns:
+        list: The arguments, with 'evaluate' after the global options if no command is given.
+    """
+    if any(arg in COMMANDS for arg in argv) or any(arg in ("-h", "--help") for arg in argv):
+        return argv
+    global_args, command_args = [], []
+    iterator = iter(argv)
+    for arg in iterator:
+        if arg == "--profile-imports" or arg.startswith("--config="):
+            global_args.append(arg)
+        elif arg == "--config":
+            global_args += [arg, next(iterator, "")]
+        else:
+            command_args.append(arg)
+    return global_args + [DEFAULT_COMMAND] + command_args
+
+
+def main(argv: list = None) -> int:
+    """
+    Runs a command line.
+
+    Args:
+        argv (list, optional): Command line arguments, without the program name.
+            Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status.
+    """
+    argv = with_default_command(list(sys.argv[1:] if argv is None else argv))
+    args = build_parser().parse_args(argv)
+    if args.profile_imports:
+        from utils.import_profile import profile_imports
+        return profile_imports(os.path.abspath(__file__), [arg for arg in argv if arg != "--profile-imports"])
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+import queue
+import logging
+import threading
+import pandas as pd
+from observers.evaluation_notifier import EvaluationNotifier
+from utils.config import OVERFLOW_POLICIES
+
+
+class AsyncEvaluationNotifier(EvaluationNotifier):
+    """
+    Notifier that delivers events to its observers from a background thread.
+
+    `notify` and `notify_batch` only put the event on a bounded queue, so the cost of
+    the evaluation loop does not depend on the number or speed of the observers. When the queue is full,
+    the `block` policy waits for free space (no event is lost) and the `drop` policy
+    discards the new event and counts it in `dropped_events`.
+    """
+
+    _STOP = object()
+
+    def __init__(self, max_queue_size: int = 10000, overflow: str = "block"):
+        """
+        Initializes the asynchronous notifier.
+
+        Args:
+            max_queue_size (int): Maximum number of pending events.
+            overflow (str): What to do when the queue is full: 'block' or 'drop'.
+
+        Raises:
+            ValueError: If the overflow policy is not supported.
+        """
+        super().__init__()
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported overflow policy: {overflow}")
+        self.overflow = overflow
+        self.dropped_events = 0
+        self._queue = queue.Queue(maxsize=max(1, max_queue_size))
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_worker(self):
+        """Starts the delivery thread on the first event."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._drain, name="evaluation-notifier", daemon=True)
+                self._thread.start()
+
+    def _drain(self):
+        """Delivers queued events to the observers until the stop marker is received."""
+        while True:
+            event = self._queue.get()
+            try:
+                if event is self._STOP:
+                    return
+                deliver, args = event
+                deliver(*args)
+            except Exception as e:
+                logging.error(f"Observer failed to handle event: {e}")
+            finally:
+                self._queue.task_done()
+
+    def notify(self, model_name: str, metric_name: str, score: float):
+        """
+        Queues an evaluation event for delivery to all observers.
+
+        Args:
+            model_name (str): Name of the evaluated model.
+            metric_name (str): Name of the evaluation metric.
+            score (float): Computed score for the model.
+        """
+        self._enqueue((super().notify, (model_name, metric_name, score)), 1)
+
+    def notify_batch(self, events: pd.DataFrame):
+        """
+        Queues a batch of evaluation events for delivery to all observers.
+
+        Args:
+            events (pd.DataFrame): Batch of evaluation events.
+        """
+        self._enqueue((super().notify_batch, (events,)), len(events))
+
+    def _enqueue(self, event: tuple, n_events: int):
+        """Puts an event on the queue, applying the overflow policy."""
+        self._ensure_worker()
+        if self.overflow == "block":
+            self._queue.put(event)
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped_events += n_events
+
+    def flush(self):
+        """Waits until every queued event has been delivered, then flushes the observers."""
+        if self._thread is not None:
+            self._queue.join()
+        super().flush()
+
+    def close(self):
+        """Delivers the pending events, stops the delivery thread and closes the observers."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(self._STOP)
+            thread.join()
+        if self.dropped_events:
+            logging.warning(f"Notifier queue was full: {self.dropped_events} events were dropped.")
+        super().close()
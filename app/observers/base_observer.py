@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+import pandas as pd
+from observers.events import event_metric_names
 
 class BaseObserver(ABC):
     """Abstract base class for observers that listen to model evaluation events."""
@@ -14,3 +16,34 @@ class BaseObserver(ABC):
             score (float): Computed score for the model.
         """
         pass
+
+    def update_batch(self, events: pd.DataFrame):
+        """
+        Handles a batch of evaluation events.
+
+        The default implementation calls `update` once per event, with the section
+        appended to the metric name as 'METRIC [section]'. Observers override it to
+        handle the whole batch at once.
+
+        Args:
+            events (pd.DataFrame): Events with the columns 'model_file', 'metric',
+                'sectionName' (None for global metrics) and 'score'.
+        """
+        metric_names = event_metric_names(events)
+        for model_name, metric_name, score in zip(events["model_file"], metric_names, events["score"]):
+            self.update(model_name, metric_name, score)
+
+    def flush(self):
+        """Writes out any buffered events. Observers without buffers do nothing."""
+        pass
+
+    def close(self):
+        """Flushes buffered events and releases resources held by the observer."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
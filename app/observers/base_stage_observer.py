@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+class BaseStageObserver(ABC):
+    """Abstract base class for observers that listen to pipeline stage timings."""
+
+    @abstractmethod
+    def on_stage(self, record: dict):
+        """
+        Handles the event when a pipeline stage finishes.
+
+        Args:
+            record (dict): Stage measurements: 'stage', 'wall_sec', 'cpu_sec',
+                'peak_rss_mb', 'pid', plus 'model_file', 'rows' and 'peak_traced_mb'
+                when available.
+        """
+        pass
@@ -1,4 +1,7 @@
+import sys
+import pandas as pd
 from observers.base_observer import BaseObserver
+from observers.events import format_event_lines
 
 class ConsoleLogger(BaseObserver):
     """Observer that logs model evaluation results to the console."""
@@ -13,3 +16,12 @@ class ConsoleLogger(BaseObserver):
             score (float): Computed score for the model.
         """
         print(f"[LOG] Model: {model_name} | Metric: {metric_name} | Score: {score:.4f}")
+
+    def update_batch(self, events: pd.DataFrame):
+        """
+        Logs a batch of evaluation results to the console with a single write.
+
+        Args:
+            events (pd.DataFrame): Batch of evaluation events.
+        """
+        sys.stdout.write(format_event_lines(events, prefix="[LOG] "))
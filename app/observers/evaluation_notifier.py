@@ -1,3 +1,4 @@
+import pandas as pd
 from observers.base_observer import BaseObserver
 
 class EvaluationNotifier:
@@ -27,3 +28,31 @@ class EvaluationNotifier:
         """
         for observer in self.observers:
             observer.update(model_name, metric_name, score)
+
+    def notify_batch(self, events: pd.DataFrame):
+        """
+        Notifies all observers about a batch of evaluation events.
+
+        Args:
+            events (pd.DataFrame): Events with the columns 'model_file', 'metric',
+                'sectionName' (None for global metrics) and 'score'.
+        """
+        for observer in self.observers:
+            observer.update_batch(events)
+
+    def flush(self):
+        """Flushes the buffered events of every observer."""
+        for observer in self.observers:
+            observer.flush()
+
+    def close(self):
+        """Flushes and closes every observer."""
+        for observer in self.observers:
+            observer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+# Columns of a batch of evaluation events. 'sectionName' is None for global metrics.
+EVENT_COLUMNS = ["model_file", "metric", "sectionName", "score"]
+
+
+def make_events(global_results: list, section_results: list) -> pd.DataFrame:
+    """
+    Builds a batch of evaluation events from the results of the pipeline.
+
+    Args:
+        global_results (list): Global results (dicts with 'model_file', 'metric' and 'score').
+        section_results (list): Section results, which also have a 'sectionName'.
+
+    Returns:
+        pd.DataFrame: One row per event with the columns in `EVENT_COLUMNS`, global
+                      results first.
+    """
+    rows = [dict(result, sectionName=None) for result in global_results] + list(section_results)
+    return pd.DataFrame(rows, columns=EVENT_COLUMNS)
+
+
+def event_metric_names(events: pd.DataFrame) -> pd.Series:
+    """
+    Returns the metric name of each event as passed to `BaseObserver.update`:
+    the metric, followed by the section between brackets for section events.
+
+    Args:
+        events (pd.DataFrame): Batch of events.
+
+    Returns:
+        pd.Series: Metric names, aligned with the events.
+    """
+    metrics = events["metric"].astype(str)
+    sections = events["sectionName"]
+    has_section = sections.notna()
+    return metrics.where(~has_section, metrics + " [" + sections.astype(str) + "]")
+
+
+def format_event_lines(events: pd.DataFrame, prefix: str = "") -> str:
+    """
+    Formats a batch of events as log lines, one per event, in a single pass.
+
+    Args:
+        events (pd.DataFrame): Batch of events.
+        prefix (str): Text written at the start of every line.
+
+    Returns:
+        str: The log lines, each terminated by a newline.
+    """
+    if events.empty:
+        return ""
+    scores = np.char.mod("%.4f", events["score"].to_numpy(dtype=np.float64))
+    lines = (prefix + "Model: " + events["model_file"].astype(str)
+             + " | Metric: " + event_metric_names(events)
+             + " | Score: " + scores + "\n")
+    return "".join(lines.tolist())
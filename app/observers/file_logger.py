@@ -1,23 +1,42 @@
 import os
+import time
+import pandas as pd
 from observers.base_observer import BaseObserver
+from observers.events import format_event_lines
 
 class FileLogger(BaseObserver):
     """Observer that logs model evaluation results to a file."""
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, buffered: bool = False, buffer_size: int = 1000,
+                 flush_interval: float = 5.0):
         """
         Initializes the FileLogger.
 
         Args:
             file_path (str): Path to the log file.
+            buffered (bool): If True, keeps the file open and writes lines in batches
+                instead of opening and closing the file for every event.
+            buffer_size (int): Number of buffered lines that triggers a flush.
+            flush_interval (float): Seconds since the last flush that trigger a flush.
         """
         self.file_path = file_path
+        self.buffered = buffered
+        self.buffer_size = max(1, buffer_size)
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._buffered_lines = 0
+        self._file = None
+        self._last_flush = time.monotonic()
         self._ensure_log_directory()
 
     def _ensure_log_directory(self):
         """Ensures that the log directory exists."""
         os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
 
+    @staticmethod
+    def _format(model_name: str, metric_name: str, score: float) -> str:
+        return f"Model: {model_name} | Metric: {metric_name} | Score: {score:.4f}\n"
+
     def update(self, model_name: str, metric_name: str, score: float):
         """
         Logs evaluation results to a file.
@@ -27,5 +46,51 @@ class FileLogger(BaseObserver):
             metric_name (str): Name of the evaluation metric.
             score (float): Computed score for the model.
         """
-        with open(self.file_path, "a", encoding="utf-8") as file:
-            file.write(f"Model: {model_name} | Metric: {metric_name} | Score: {score:.4f}\n")
+        line = self._format(model_name, metric_name, score)
+        if not self.buffered:
+            with open(self.file_path, "a", encoding="utf-8") as file:
+                file.write(line)
+            return
+
+        self._append(line, 1)
+
+    def update_batch(self, events: pd.DataFrame):
+        """
+        Logs a batch of evaluation results to the file with a single write.
+
+        Args:
+            events (pd.DataFrame): Batch of evaluation events.
+        """
+        text = format_event_lines(events)
+        if not self.buffered:
+            with open(self.file_path, "a", encoding="utf-8") as file:
+                file.write(text)
+            return
+        self._append(text, len(events))
+
+    def _append(self, text: str, n_lines: int):
+        """Buffers text holding `n_lines` lines and flushes on size or time."""
+        self._buffer.append(text)
+        self._buffered_lines += n_lines
+        if (self._buffered_lines >= self.buffer_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered lines in a single call and flushes them to the OS."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._file = open(self.file_path, "a", encoding="utf-8")
+        self._file.write("".join(self._buffer))
+        self._file.flush()
+        self._buffer = []
+        self._buffered_lines = 0
+
+    def close(self):
+        """Flushes the buffered lines and closes the log file."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
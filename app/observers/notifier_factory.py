@@ -0,0 +1,33 @@
+from observers.evaluation_notifier import EvaluationNotifier
+from utils.registry import NOTIFIERS, OBSERVERS
+
+
+def create_notifier(config: dict) -> EvaluationNotifier:
+    """
+    Creates the notifier described by the configuration, with a ConsoleLogger and,
+    when 'log_file' is set, a FileLogger. Only the notifier and observers used are imported.
+
+    Args:
+        config (dict): Pipeline configuration. The optional 'notifier' section selects
+                       asynchronous delivery ('async', 'max_queue_size', 'overflow').
+
+    Returns:
+        EvaluationNotifier: The notifier with its observers attached.
+    """
+    notifier_config = config.get("notifier") or {}
+    if notifier_config.get("async", False):
+        notifier = NOTIFIERS.create("async", max_queue_size=notifier_config.get("max_queue_size", 10000),
+                                    overflow=notifier_config.get("overflow", "block"))
+    else:
+        notifier = NOTIFIERS.create("sync")
+
+    notifier.add_observer(OBSERVERS.create("console"))
+
+    log_file = config.get("log_file")
+    if log_file:
+        log_buffer_size = config.get("log_buffer_size", 0)
+        notifier.add_observer(OBSERVERS.create("file", log_file,
+                                               buffered=log_buffer_size > 0,
+                                               buffer_size=log_buffer_size,
+                                               flush_interval=config.get("log_flush_interval_sec", 5.0)))
+    return notifier
@@ -0,0 +1,54 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from reports.base_report import BaseReport
+
+# Low-cardinality columns repeated on every row, stored dictionary-encoded.
+DICTIONARY_COLUMNS = ("model_file", "metric", "sectionName", "valid_file_name", "other_model_file")
+
+
+def results_to_table(results: pd.DataFrame) -> pa.Table:
+    """
+    Converts evaluation results into a typed Arrow table.
+
+    The 'model_file', 'metric', 'sectionName', 'valid_file_name' and 'other_model_file'
+    columns are dictionary-encoded and 'score' is stored as float64; other columns keep their
+    inferred types.
+
+    Args:
+        results (pd.DataFrame): The evaluation results.
+
+    Returns:
+        pa.Table: The results as an Arrow table.
+    """
+    table = pa.Table.from_pandas(results, preserve_index=False)
+    for column in DICTIONARY_COLUMNS:
+        if column in table.column_names:
+            index = table.schema.get_field_index(column)
+            values = table.column(column)
+            if values.type != pa.string():
+                values = values.cast(pa.string())
+            table = table.set_column(index, column, values.dictionary_encode())
+    if "score" in table.column_names:
+        index = table.schema.get_field_index("score")
+        table = table.set_column(index, "score", table.column("score").cast(pa.float64()))
+    return table
+
+
+class ArrowReport(BaseReport):
+    """Generates an Arrow IPC (Feather v2) report from evaluation results."""
+
+    def generate_report(self, results: pd.DataFrame, output_path: str):
+        """
+        Saves the evaluation results to an Arrow IPC file.
+
+        Args:
+            results (pd.DataFrame): The evaluation results.
+            output_path (str): Path to save the report.
+        """
+        table = results_to_table(results)
+        with pa.OSFile(output_path, "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        print(f"[REPORT] Arrow report saved at: {output_path}")
@@ -4,6 +4,10 @@ import pandas as pd
 class BaseReport(ABC):
     """Abstract base class for generating evaluation reports."""
 
+    # Whether the report adds to its output instead of overwriting it (e.g. a database).
+    # Such reports also implement `replace_results(results, output_path, model_files)`.
+    appends = False
+
     @abstractmethod
     def generate_report(self, results: pd.DataFrame, output_path: str):
         """
@@ -0,0 +1,19 @@
+import pandas as pd
+import pyarrow.parquet as pq
+from reports.base_report import BaseReport
+from reports.arrow_report import results_to_table
+
+class ParquetReport(BaseReport):
+    """Generates a Parquet report from evaluation results."""
+
+    def generate_report(self, results: pd.DataFrame, output_path: str):
+        """
+        Saves the evaluation results to a Parquet file, with dictionary-encoded
+        'model_file', 'metric' and 'sectionName' columns.
+
+        Args:
+            results (pd.DataFrame): The evaluation results.
+            output_path (str): Path to save the report.
+        """
+        pq.write_table(results_to_table(results), output_path)
+        print(f"[REPORT] Parquet report saved at: {output_path}")
@@ -1,6 +1,6 @@
-from reports.csv_report import CSVReport
-from reports.json_report import JSONReport
+import os
 import pandas as pd
+from utils.registry import REPORTS
 
 class ReportGenerator:
     """Handles the creation of evaluation reports in different formats."""
@@ -10,26 +10,58 @@ class ReportGenerator:
         Initializes the report generator.
 
         Args:
-            format (str): The format of the report ("csv" or "json").
+            format (str): The format of the report ("csv", "json", "parquet", "arrow" or "sqlite").
         """
         self.format = format.lower()
         self.report = self._get_report_instance()
 
     def _get_report_instance(self):
-        """Returns the appropriate report generator based on the format."""
-        if self.format == "csv":
-            return CSVReport()
-        elif self.format == "json":
-            return JSONReport()
-        else:
-            raise ValueError(f"Unsupported report format: {self.format}")
-
-    def generate(self, results: pd.DataFrame, output_path: str):
+        """Returns the appropriate report generator based on the format, importing only its backend."""
+        return REPORTS.create(self.format)
+
+    def generate(self, results: pd.DataFrame, output_path: str, atomic: bool = False):
         """
         Generates a report based on the evaluation results.
 
         Args:
             results (pd.DataFrame): The evaluation results.
             output_path (str): Path to save the report.
+            atomic (bool): Whether to write the report to a temporary file first and then
+                rename it over `output_path`, so that readers never see a partial report.
+                Reports that append to their output (SQLite) are always written in place,
+                in a transaction.
+        """
+        if not atomic or self.report.appends:
+            self.report.generate_report(results, output_path)
+            return
+        root, extension = os.path.splitext(output_path)
+        tmp_path = f"{root}.{os.getpid()}.tmp{extension}"
+        try:
+            self.report.generate_report(results, tmp_path)
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def update(self, results: pd.DataFrame, output_path: str, model_files=None):
+        """
+        Updates a report written by this generator, e.g. after some model files changed.
+
+        Reports that append to their output (SQLite) replace, within their run, the rows
+        of `model_files` with the rows of those files in `results` (or every row of the
+        run when `model_files` is None). Other reports are rewritten atomically from
+        `results`, which must then hold the results of every model file.
+
+        Args:
+            results (pd.DataFrame): The evaluation results of every model file.
+            output_path (str): Path of the report.
+            model_files (list, optional): Model files whose results changed (evaluated
+                again or removed).
         """
-        self.report.generate_report(results, output_path)
+        if not self.report.appends:
+            self.generate(results, output_path, atomic=True)
+            return
+        if model_files is not None:
+            results = (results[results["model_file"].isin(model_files)] if "model_file" in results
+                       else results.iloc[0:0])
+        self.report.replace_results(results, output_path, model_files)
@@ -0,0 +1,184 @@
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+import pandas as pd
+from reports.base_report import BaseReport
+
+# Report kinds written by the pipeline as `<output_path>_<kind>`, stored as tables of one database.
+REPORT_TABLES = ("global", "by_section", "latency", "by_run", "significance", "line_items")
+DEFAULT_TABLE = "results"
+RUN_COLUMN = "run_timestamp"
+# Columns indexed (with the run timestamp) when a table has them.
+KEY_COLUMNS = ("metric", "model_file", "sectionName")
+
+
+def database_location(output_path: str) -> tuple:
+    """
+    Maps a report path to its SQLite database and table.
+
+    `<base>_<kind>.sqlite` (e.g. `reports/evaluation_report_global.sqlite`) is stored in
+    the table `<kind>` of `<base>.sqlite`, so all the reports of a pipeline share one
+    database. Other paths are stored in the table 'results' of the file itself.
+
+    Args:
+        output_path (str): Report path.
+
+    Returns:
+        tuple: (database_path, table).
+    """
+    root, extension = os.path.splitext(output_path)
+    for table in REPORT_TABLES:
+        if root.endswith(f"_{table}"):
+            return f"{root[:-len(table) - 1]}{extension}", table
+    return output_path, DEFAULT_TABLE
+
+
+def _sql_type(dtype) -> str:
+    """Returns the SQLite column type of a pandas dtype."""
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class SQLiteReport(BaseReport):
+    """
+    Appends evaluation results to an embedded SQLite database.
+
+    Unlike the file reports, nothing is overwritten: every call inserts the results
+    tagged with the run timestamp of the report instance, so the database keeps the
+    history of all runs and readers can query a single run, model or metric through
+    the indexes on (run_timestamp, metric, model_file, sectionName).
+    """
+
+    appends = True
+
+    def __init__(self, run_timestamp: str = None):
+        """
+        Initializes the SQLite report.
+
+        Args:
+            run_timestamp (str, optional): Timestamp identifying the run. Defaults to the
+                current UTC time, in ISO 8601 format with microseconds.
+        """
+        self.run_timestamp = run_timestamp or datetime.now(timezone.utc).isoformat(timespec="microseconds")
+
+    def generate_report(self, results: pd.DataFrame, output_path: str):
+        """
+        Inserts the evaluation results into the database, in a single transaction.
+
+        The table is created on first use, with one column per results column plus the
+        run timestamp, and columns seen for the first time are added to it.
+
+        Args:
+            results (pd.DataFrame): The evaluation results.
+            output_path (str): Report path (see `database_location`).
+        """
+        self._write(results, output_path)
+
+    def replace_results(self, results: pd.DataFrame, output_path: str, model_files=None):
+        """
+        Replaces rows of this instance's run with the given results, in a single transaction.
+
+        Used by long-running pipelines (watch mode) to update a run in place instead of
+        appending the whole history on every update.
+
+        Args:
+            results (pd.DataFrame): The new results.
+            output_path (str): Report path (see `database_location`).
+            model_files (list, optional): Model files whose rows are replaced. Defaults
+                to every row of the run.
+        """
+        self._write(results, output_path, replace=True, model_files=model_files)
+
+    def _write(self, results: pd.DataFrame, output_path: str, replace: bool = False, model_files=None):
+        """Inserts the results, after deleting the replaced rows of the run when `replace` is set."""
+        database_path, table = database_location(output_path)
+        columns = [RUN_COLUMN] + [str(column) for column in results.columns]
+        values = [[self.run_timestamp] * len(results)] + [
+            results[column].astype(object).where(results[column].notna(), None).tolist()
+            for column in results.columns
+        ]
+        rows = list(zip(*values))
+
+        connection = sqlite3.connect(database_path)
+        try:
+            with connection:
+                self._prepare_table(connection, table, results)
+                if replace:
+                    self._delete_rows(connection, table, model_files)
+                connection.execute("INSERT OR REPLACE INTO runs (run_timestamp) VALUES (?)", (self.run_timestamp,))
+                placeholders = ", ".join("?" * len(columns))
+                connection.executemany(
+                    f"INSERT INTO {_quote(table)} ({', '.join(map(_quote, columns))}) VALUES ({placeholders})",
+                    rows)
+        finally:
+            connection.close()
+
+        print(f"[REPORT] SQLite report saved at: {database_path} (table '{table}')")
+
+    def _delete_rows(self, connection: sqlite3.Connection, table: str, model_files):
+        """Deletes the rows of this run, or only those of the given model files."""
+        query = f"DELETE FROM {_quote(table)} WHERE {RUN_COLUMN} = ?"
+        parameters = [self.run_timestamp]
+        if model_files is not None:
+            columns = {row[1] for row in connection.execute(f"PRAGMA table_info({_quote(table)})")}
+            if "model_file" not in columns:
+                return
+            model_files = list(model_files)
+            query += f" AND model_file IN ({', '.join('?' * len(model_files))})"
+            parameters += model_files
+        connection.execute(query, parameters)
+
+    @staticmethod
+    def _prepare_table(connection: sqlite3.Connection, table: str, results: pd.DataFrame):
+        """Creates the runs table, the results table and its index, and adds missing columns."""
+        connection.execute("CREATE TABLE IF NOT EXISTS runs (run_timestamp TEXT PRIMARY KEY)")
+        connection.execute(f"CREATE TABLE IF NOT EXISTS {_quote(table)} ({RUN_COLUMN} TEXT NOT NULL)")
+        existing = {row[1] for row in connection.execute(f"PRAGMA table_info({_quote(table)})")}
+        for column, dtype in results.dtypes.items():
+            if str(column) not in existing:
+                connection.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(str(column))} {_sql_type(dtype)}")
+                existing.add(str(column))
+        key_columns = [RUN_COLUMN] + [column for column in KEY_COLUMNS if column in existing]
+        index_name = f"idx_{table}_{'_'.join(key_columns)}"
+        connection.execute(f"CREATE INDEX IF NOT EXISTS {_quote(index_name)} "
+                           f"ON {_quote(table)} ({', '.join(map(_quote, key_columns))})")
+
+
+def read_run(output_path: str, run_timestamp: str = None, metric: str = None) -> pd.DataFrame:
+    """
+    Reads the results of one run from a SQLite report.
+
+    Args:
+        output_path (str): Report path (see `database_location`).
+        run_timestamp (str, optional): Run to read. Defaults to the latest run of the table.
+        metric (str, optional): Only read the rows of this metric.
+
+    Returns:
+        pd.DataFrame: The results in insertion order, without the run timestamp column
+                      (empty if the table does not exist).
+    """
+    database_path, table = database_location(output_path)
+    connection = sqlite3.connect(database_path)
+    try:
+        tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if table not in tables:
+            return pd.DataFrame()
+        if run_timestamp is None:
+            run_timestamp = connection.execute(f"SELECT MAX({RUN_COLUMN}) FROM {_quote(table)}").fetchone()[0]
+        query = f"SELECT * FROM {_quote(table)} WHERE {RUN_COLUMN} = ?"
+        parameters = [run_timestamp]
+        if metric is not None:
+            query += " AND metric = ?"
+            parameters.append(metric)
+        df = pd.read_sql_query(query + " ORDER BY rowid", connection, params=parameters)
+    finally:
+        connection.close()
+    return df.drop(columns=[RUN_COLUMN])
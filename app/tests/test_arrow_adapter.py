@@ -0,0 +1,135 @@
+import pytest
+import json
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from adapters.arrow_adapter import ArrowAdapter
+from adapters.validation import SchemaValidationError
+from adapters.adapter_factory import get_ground_truth_adapter, get_model_output_adapter
+from adapters.json_adapter import JSONAdapter
+from utils.convert import convert_ground_truth, convert_model_output
+
+GROUND_TRUTH_DATA = {
+    "totalCostUsd": 1000.5,
+    "rows": [
+        {"sectionName": "Plumbing", "qty": 10, "rateUsd": 50, "rowTotalCostUsd": 500.5, "label": "Pipe", "uom": "EA", "category": "material"},
+        {"sectionName": "Electrical", "qty": 5, "rateUsd": 100, "rowTotalCostUsd": 500, "label": "Wiring", "uom": None, "category": "labor"}
+    ]
+}
+
+MODEL_OUTPUT_DATA = {
+    "estimate_preds": [
+        {"valid_file_name": "example_01", "rows": GROUND_TRUTH_DATA["rows"], "time_to_estimate_sec": 12.5},
+        {"valid_file_name": "example_02", "rows": GROUND_TRUTH_DATA["rows"][:1], "time_to_estimate_sec": 3}
+    ]
+}
+
+
+@pytest.fixture
+def json_files(tmp_path):
+    """Fixture to create JSON ground truth and model output files."""
+    gt_path = tmp_path / "example_01.json"
+    model_path = tmp_path / "model.json"
+    gt_path.write_text(json.dumps(GROUND_TRUTH_DATA), encoding="utf-8")
+    model_path.write_text(json.dumps(MODEL_OUTPUT_DATA), encoding="utf-8")
+    return str(gt_path), str(model_path)
+
+
+@pytest.mark.parametrize("extension", [".parquet", ".arrow", ".feather"])
+def test_ground_truth_round_trip(json_files, tmp_path, extension):
+    """Test that a converted ground truth file reads back like the JSON original."""
+    gt_path, _ = json_files
+    output_path = str(tmp_path / f"example_01{extension}")
+    convert_ground_truth(gt_path, output_path)
+
+    adapter = get_ground_truth_adapter(output_path)
+    assert isinstance(adapter, ArrowAdapter)
+    assert adapter.get_total_cost() == 1000.5
+
+    store = adapter.to_row_store()
+    expected = JSONAdapter(gt_path).to_row_store()
+    assert store.column("sectionName").tolist() == expected.column("sectionName").tolist()
+    assert store.column("uom").tolist() == ["EA", None]
+    assert np.array_equal(store.numeric["rowTotalCostUsd"], expected.numeric["rowTotalCostUsd"])
+    assert list(adapter.to_dataframe()["label"]) == ["Pipe", "Wiring"]
+
+
+@pytest.mark.parametrize("extension", [".parquet", ".arrow"])
+def test_model_output_round_trip(json_files, tmp_path, extension):
+    """Test that a converted model output file keeps prediction boundaries, names and times."""
+    _, model_path = json_files
+    output_path = str(tmp_path / f"model{extension}")
+    convert_model_output(model_path, output_path)
+
+    store = get_model_output_adapter(output_path).to_model_output_store()
+    assert store.offsets.tolist() == [0, 2, 3]
+    assert store.names == ["example_01", "example_02"]
+    assert store.times.tolist() == [12.5, 3.0]
+    assert store.column("label").tolist() == ["Pipe", "Wiring", "Pipe"]
+
+
+def test_arrow_ipc_is_zero_copy(json_files, tmp_path):
+    """Test that float64 columns of a memory-mapped IPC file are not copied."""
+    _, model_path = json_files
+    output_path = str(tmp_path / "model.arrow")
+    convert_model_output(model_path, output_path)
+
+    store = ArrowAdapter(output_path).to_model_output_store()
+    assert not store.numeric["rowTotalCostUsd"].flags.owndata, "Column should be a view on the Arrow buffer."
+
+
+def test_model_output_missing_columns(json_files, tmp_path):
+    """Test that a table without model output columns is rejected."""
+    gt_path, _ = json_files
+    output_path = str(tmp_path / "example_01.parquet")
+    convert_ground_truth(gt_path, output_path)
+
+    with pytest.raises(ValueError, match="prediction_id"):
+        ArrowAdapter(output_path).to_model_output_store()
+
+
+def write_model_output_table(path, **columns):
+    """Writes a Parquet model output table of four rows in three predictions."""
+    data = {"prediction_id": [0, 0, 1, 2], "valid_file_name": ["example_01", "example_01", "example_02", "example_03"],
+            "time_to_estimate_sec": [1.0, 1.0, 2.0, 3.0], "sectionName": ["Plumbing"] * 4,
+            "rowTotalCostUsd": [100.0, 200.0, 50.0, 75.0]}
+    data.update(columns)
+    pq.write_table(pa.table(data), path)
+    return str(path)
+
+
+def test_model_output_validation(tmp_path):
+    """Test that predictions with null or non-finite totals are dropped, or reject the file in strict mode."""
+    path = write_model_output_table(tmp_path / "model.parquet", rowTotalCostUsd=[100.0, None, 50.0, float("nan")])
+    adapter = ArrowAdapter(path)
+    store = adapter.to_model_output_store()
+
+    assert store.names == ["example_02"]
+    assert store.numeric["rowTotalCostUsd"].tolist() == [50.0]
+    errors = [(e["check"], e["column"], e["examples"]) for e in adapter.validation_report.to_dict()["errors"]]
+    assert errors == [("null", "rowTotalCostUsd", [0]), ("non_finite", "rowTotalCostUsd", [2])]
+
+    with pytest.raises(SchemaValidationError, match="2 of 3 predictions"):
+        ArrowAdapter(path).to_model_output_store("strict")
+
+
+def test_model_output_validation_checks_column_types(tmp_path):
+    """Test that a column of the wrong type or a missing required column rejects the file."""
+    path = write_model_output_table(tmp_path / "model.parquet", qty=["1", "2", "3", "4"])
+    with pytest.raises(SchemaValidationError, match="'qty' must be a number, found string"):
+        ArrowAdapter(path).to_model_output_store()
+
+    sections = pa.array(["a", "b", "c", "d"]).dictionary_encode()
+    path = write_model_output_table(tmp_path / "model.parquet", sectionName=sections)
+    assert ArrowAdapter(path).to_model_output_store().n_segments == 3, "Dictionary-encoded strings are strings."
+
+    table = pq.read_table(path).drop_columns(["rowTotalCostUsd"])
+    pq.write_table(table, path)
+    with pytest.raises(SchemaValidationError, match="'rowTotalCostUsd' column is missing"):
+        ArrowAdapter(path).to_model_output_store()
+
+
+def test_unsupported_extension(tmp_path):
+    """Test that the factory rejects unknown extensions."""
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        get_model_output_adapter(str(tmp_path / "model.xml"))
@@ -0,0 +1,30 @@
+import pytest
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from reports.arrow_report import ArrowReport
+
+@pytest.fixture
+def sample_results():
+    """Fixture to create sample global evaluation results."""
+    return pd.DataFrame([
+        {"model_file": "2.json", "metric": "MAE", "score": 10.5},
+        {"model_file": "4.json", "metric": "MAE", "score": 8.2}
+    ])
+
+@pytest.fixture
+def arrow_report():
+    """Fixture to create an ArrowReport instance."""
+    return ArrowReport()
+
+def test_arrow_report_generation(arrow_report, sample_results, tmp_path):
+    """Test that ArrowReport generates a valid Arrow IPC file."""
+    output_file = tmp_path / "test_evaluation_report.arrow"
+    arrow_report.generate_report(sample_results, str(output_file))
+
+    assert output_file.exists(), "Arrow report file should be created."
+
+    table = feather.read_table(str(output_file))
+    assert table.num_rows == 2, "Arrow file should contain two rows."
+    assert pa.types.is_dictionary(table.schema.field("model_file").type), "model_file should be dictionary-encoded."
+    assert table.column("score").to_pylist() == [10.5, 8.2]
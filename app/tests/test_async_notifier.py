@@ -0,0 +1,67 @@
+import pytest
+import threading
+from observers.base_observer import BaseObserver
+from observers.async_notifier import AsyncEvaluationNotifier
+
+
+class BlockingObserver(BaseObserver):
+    """Observer that records events and waits for a gate before handling each one."""
+
+    def __init__(self):
+        self.events = []
+        self.gate = threading.Event()
+        self.flushed = False
+        self.closed = False
+
+    def update(self, model_name, metric_name, score):
+        self.gate.wait()
+        self.events.append((model_name, metric_name, score))
+
+    def flush(self):
+        self.flushed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def observer():
+    """Fixture to create a BlockingObserver."""
+    return BlockingObserver()
+
+
+def test_async_notifier_delivers_in_order(observer):
+    """Test that notify returns before delivery and flush waits for every event."""
+    notifier = AsyncEvaluationNotifier(max_queue_size=100)
+    notifier.add_observer(observer)
+    for i in range(10):
+        notifier.notify("model.json", "MAE", float(i))
+
+    assert observer.events == [], "Events should not be delivered while the observer is blocked."
+    observer.gate.set()
+    notifier.flush()
+
+    assert [event[2] for event in observer.events] == [float(i) for i in range(10)]
+    assert observer.flushed, "Flushing the notifier should flush its observers."
+
+    notifier.close()
+    assert observer.closed, "Closing the notifier should close its observers."
+
+
+def test_async_notifier_drop_policy(observer):
+    """Test that the drop policy discards events once the queue is full."""
+    notifier = AsyncEvaluationNotifier(max_queue_size=2, overflow="drop")
+    notifier.add_observer(observer)
+    for i in range(10):
+        notifier.notify("model.json", "MAE", float(i))
+
+    assert notifier.dropped_events >= 7, "Events beyond the queue capacity should be dropped."
+    observer.gate.set()
+    notifier.close()
+    assert len(observer.events) == 10 - notifier.dropped_events
+
+
+def test_async_notifier_invalid_policy():
+    """Test that an unknown overflow policy is rejected."""
+    with pytest.raises(ValueError):
+        AsyncEvaluationNotifier(overflow="ignore")
@@ -0,0 +1,45 @@
+import pytest
+import os
+import json
+from benchmarks.synthetic import generate_corpus, section_names
+from benchmarks.run_benchmarks import run_benchmarks, main
+from adapters.streaming_json_adapter import StreamingJSONAdapter
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Fixture to generate a small synthetic corpus."""
+    return generate_corpus(str(tmp_path / "data"), n_examples=3, n_models=2, predictions_per_example=2,
+                           n_sections=14, rows_per_section=2, seed=1)
+
+
+def test_generate_corpus(corpus):
+    """Test that the synthetic corpus follows the layout of the data directory."""
+    assert sorted(os.listdir(corpus["ground_truth_dir"])) == ["example_01.json", "example_02.json", "example_03.json"]
+    assert sorted(os.listdir(corpus["model_outputs_dir"])) == ["model_01.json", "model_02.json"]
+
+    with open(os.path.join(corpus["ground_truth_dir"], "example_01.json"), "r", encoding="utf-8") as file:
+        ground_truth = json.load(file)
+    assert set(ground_truth) == {"test_n", "input", "rows", "totalCostUsd"}
+    assert {row["sectionName"] for row in ground_truth["rows"]} <= set(section_names(14))
+
+    store = StreamingJSONAdapter(os.path.join(corpus["model_outputs_dir"], "model_01.json")).to_model_output_store()
+    assert store.n_segments == 6, "Each model file should hold K predictions per example."
+    assert len(section_names(14)) == len(set(section_names(14))) == 14
+
+
+def test_run_benchmarks(corpus, tmp_path):
+    """Test that every stage is timed and results are written as JSON."""
+    stages = run_benchmarks(os.path.dirname(corpus["ground_truth_dir"]), repeat=1)
+    for stage in ["load_ground_truth_store", "parse_model_outputs", "validate_model_outputs", "gather_segments",
+                  "evaluate[MAE]", "bootstrap", "match_line_items", "write_report[parquet]", "notify_observers", "pipeline_run"]:
+        assert stage in stages, f"Stage '{stage}' should be timed."
+        assert stages[stage]["median_sec"] >= 0
+    assert stages["parse_model_outputs"]["rows"] > 0
+
+    output = tmp_path / "benchmark.json"
+    main(["--examples", "2", "--models", "1", "--repeat", "1", "--output", str(output)])
+    with open(output, "r", encoding="utf-8") as file:
+        results = json.load(file)
+    assert results["params"]["examples"] == 2
+    assert set(results["stages"]) == set(stages)
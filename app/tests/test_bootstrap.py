@@ -0,0 +1,123 @@
+import pytest
+import numpy as np
+import utils.bootstrap
+from evaluators.mae_evaluator import MAE
+from evaluators.mape_evaluator import MAPE
+from evaluators.mre_evaluator import MRE
+from evaluators.asymmetric_evaluator import AsymmetricLoss
+from adapters.row_store import RowStoreBuilder
+from utils.eval import evaluate_sections
+from utils.bootstrap import (bootstrap_settings, resample_counts, unit_section_totals, bootstrap_scores,
+                             confidence_interval, significance_matrix)
+
+GT_ROWS = {
+    "example_01": [{"sectionName": "Plumbing", "rowTotalCostUsd": 500}, {"sectionName": "Electrical", "rowTotalCostUsd": 300}],
+    "example_02": [{"sectionName": "Plumbing", "rowTotalCostUsd": 200}],
+    "example_03": [{"sectionName": "Framing", "rowTotalCostUsd": 100}],
+}
+
+PREDICTIONS = [
+    ("example_01", [{"sectionName": "Plumbing", "rowTotalCostUsd": 450}]),
+    ("example_01", [{"sectionName": "Plumbing", "rowTotalCostUsd": 600}, {"sectionName": "Electrical", "rowTotalCostUsd": 250}]),
+    ("example_02", [{"sectionName": "Plumbing", "rowTotalCostUsd": 150}, {"sectionName": "Permits", "rowTotalCostUsd": 20}]),
+]
+
+
+@pytest.fixture
+def evaluators():
+    return {"MAE": MAE(), "MAPE": MAPE(), "MRE": MRE(), "ASYMMETRIC": AsymmetricLoss()}
+
+
+@pytest.fixture
+def stores():
+    """Fixture to create segment-aligned ground truth and prediction stores."""
+    gt_builder, model_builder = RowStoreBuilder(), RowStoreBuilder()
+    for name, rows in PREDICTIONS:
+        gt_builder.add_segment(GT_ROWS[name], name)
+        model_builder.add_segment(rows, name)
+    return gt_builder.build(), model_builder.build()
+
+
+def test_resample_counts():
+    """Test that each resample draws every unit count once, reproducibly."""
+    counts = resample_counts(5, 1000, seed=3)
+
+    assert counts.shape == (1000, 5)
+    assert (counts.sum(axis=1) == 5).all(), "Each resample should draw as many units as there are."
+    np.testing.assert_array_equal(counts, resample_counts(5, 1000, seed=3))
+    assert abs(counts.mean() - 1.0) < 0.05
+
+
+def test_resample_counts_in_blocks(evaluators, stores, monkeypatch):
+    """Test that drawing and scoring the resamples in small blocks gives the same compact counts and scores."""
+    gt_store, model_store = stores
+    units = unit_section_totals(gt_store, model_store)
+    counts = resample_counts(model_store.n_segments, 50, seed=2)
+    samples = bootstrap_scores(evaluators, counts, *units)
+    assert counts.dtype == np.uint8, "Counts should be stored in the smallest integer type."
+
+    monkeypatch.setattr(utils.bootstrap, "BLOCK_CELLS", 7)
+    blocked_counts = resample_counts(model_store.n_segments, 50, seed=2)
+    np.testing.assert_array_equal(blocked_counts, counts)
+    blocked_samples = bootstrap_scores(evaluators, blocked_counts, *units)
+    for name in evaluators:
+        np.testing.assert_allclose(blocked_samples[name], samples[name], err_msg=name)
+
+
+@pytest.mark.parametrize("unit_names", [None, ["example_01", "example_02", "example_03"]])
+def test_unit_weights_reproduce_global_score(evaluators, stores, unit_names):
+    """Test that drawing every unit once gives back the global scores."""
+    gt_store, model_store = stores
+    units = unit_section_totals(gt_store, model_store, unit_names)
+    counts = np.ones((2, len(units[0])))
+    samples = bootstrap_scores(evaluators, counts, *units)
+    global_scores, _ = evaluate_sections(evaluators, gt_store, model_store)
+
+    for name, score in global_scores.items():
+        np.testing.assert_allclose(samples[name], [score, score], err_msg=name)
+
+
+def test_bootstrap_matches_explicit_resamples(evaluators, stores):
+    """Test that batched resamples match scoring each resample's pairs explicitly."""
+    gt_store, model_store = stores
+    counts = resample_counts(model_store.n_segments, 20, seed=1)
+    samples = bootstrap_scores(evaluators, counts, *unit_section_totals(gt_store, model_store))
+
+    for resample, row in enumerate(counts):
+        segments = np.repeat(np.arange(model_store.n_segments), row.astype(int)).tolist()
+        expected, _ = evaluate_sections(evaluators, gt_store.take_segments(segments),
+                                        model_store.take_segments(segments))
+        for name, score in expected.items():
+            assert np.isclose(samples[name][resample], score, equal_nan=True), (name, resample)
+
+
+def test_confidence_interval():
+    """Test percentile intervals, ignoring NaN samples."""
+    samples = np.append(np.arange(101, dtype=float), np.nan)
+    assert confidence_interval(samples, 0.9) == pytest.approx((5.0, 95.0))
+    assert np.isnan(confidence_interval(np.full(3, np.nan))).all()
+
+
+def test_significance_matrix():
+    """Test that only clearly lower scores are significantly better."""
+    rng = np.random.default_rng(0)
+    samples = {"a.json": rng.normal(10, 1, 1000), "b.json": rng.normal(20, 1, 1000), "c.json": rng.normal(20, 1, 1000)}
+    rows = {(row["model_file"], row["other_model_file"]): row for row in significance_matrix(samples)}
+
+    assert len(rows) == 6, "Every ordered pair of distinct models should be compared."
+    assert rows[("a.json", "b.json")]["significantly_better"]
+    assert not rows[("b.json", "a.json")]["significantly_better"]
+    assert not rows[("b.json", "c.json")]["significantly_better"]
+    assert rows[("b.json", "c.json")]["p_better"] + rows[("c.json", "b.json")]["p_better"] == pytest.approx(1.0)
+
+
+def test_bootstrap_settings():
+    """Test defaults, disabling and validation of the bootstrap section."""
+    assert bootstrap_settings({}) is None
+    assert bootstrap_settings({"bootstrap": {"samples": 0}}) is None
+    assert bootstrap_settings({"bootstrap": {"samples": 100}}) == \
+        {"samples": 100, "confidence": 0.95, "unit": "example", "seed": 0}
+    with pytest.raises(ValueError):
+        bootstrap_settings({"bootstrap": {"samples": 100, "unit": "section"}})
+    with pytest.raises(ValueError):
+        bootstrap_settings({"bootstrap": {"samples": 100, "confidence": 1.5}})
@@ -0,0 +1,71 @@
+import pytest
+import os
+import time
+import numpy as np
+from evaluators.mae_evaluator import MAE
+from evaluators.asymmetric_evaluator import AsymmetricLoss
+from utils.cache import ResultCache, hash_file, hash_directory, hash_evaluators
+
+GLOBAL_RESULTS = [{"model_file": "a.json", "metric": "MAE", "score": 12.5}]
+SECTION_RESULTS = [{"model_file": "a.json", "sectionName": "Plumbing", "metric": "MAE", "score": float("nan")}]
+LATENCY_RESULTS = [{"model_file": "a.json", "valid_file_name": None, "n_predictions": 2, "p50_sec": 1.5}]
+RUN_RESULTS = [{"model_file": "a.json", "valid_file_name": "example_01", "run": 0, "metric": "MAE", "score": 3.0}]
+BOOTSTRAP_RESULTS = {"MAE": np.array([11.0, 12.5, np.nan])}
+LINE_ITEM_RESULTS = [{"model_file": "a.json", "sectionName": None, "n_matched": 4, "qty_mae": 1.5}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fixture to create a ResultCache in a temporary directory."""
+    return ResultCache(str(tmp_path / "cache"), max_size_mb=1)
+
+
+def test_cache_round_trip(cache):
+    """Test that stored results are returned under the requested model file name."""
+    key = ResultCache.make_key("model", "gt", "evaluators")
+    assert cache.get(key, "a.json") is None, "Empty cache should miss."
+
+    cache.put(key, GLOBAL_RESULTS, SECTION_RESULTS, LATENCY_RESULTS, RUN_RESULTS, BOOTSTRAP_RESULTS, LINE_ITEM_RESULTS)
+    (global_results, section_results, latency_results, run_results, bootstrap_results,
+     line_item_results) = cache.get(key, "b.json")
+
+    assert global_results == [{"model_file": "b.json", "metric": "MAE", "score": 12.5}]
+    assert section_results[0]["sectionName"] == "Plumbing"
+    assert section_results[0]["model_file"] == "b.json"
+    assert latency_results == [dict(LATENCY_RESULTS[0], model_file="b.json")]
+    assert run_results == [dict(RUN_RESULTS[0], model_file="b.json")]
+    np.testing.assert_array_equal(bootstrap_results["MAE"], BOOTSTRAP_RESULTS["MAE"])
+    assert line_item_results == [dict(LINE_ITEM_RESULTS[0], model_file="b.json")]
+
+
+def test_cache_eviction(cache):
+    """Test that the least recently used entries are evicted above the size limit."""
+    keys = [ResultCache.make_key(str(i), "gt", "evaluators") for i in range(4)]
+    for i, key in enumerate(keys):
+        cache.put(key, GLOBAL_RESULTS, SECTION_RESULTS, LATENCY_RESULTS, RUN_RESULTS, BOOTSTRAP_RESULTS, LINE_ITEM_RESULTS)
+        os.utime(os.path.join(cache.cache_dir, f"{key}.json"), (time.time() + i, time.time() + i))
+    entry_size = os.path.getsize(os.path.join(cache.cache_dir, f"{keys[0]}.json"))
+    cache.max_size_bytes = 2 * entry_size
+    cache.evict()
+
+    assert len(os.listdir(cache.cache_dir)) == 2, "Cache should be trimmed to its size limit."
+    assert cache.get(keys[0], "a.json") is None, "Oldest entry should be evicted."
+    assert cache.get(keys[-1], "a.json") is not None, "Newest entry should be kept."
+
+
+def test_hashes(tmp_path):
+    """Test that hashes change with file content and evaluator parameters."""
+    (tmp_path / "example_01.json").write_text('{"rows": []}', encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+    directory_hash = hash_directory(str(tmp_path))
+    file_hash = hash_file(str(tmp_path / "example_01.json"))
+
+    (tmp_path / "notes.txt").write_text("still ignored", encoding="utf-8")
+    assert hash_directory(str(tmp_path)) == directory_hash
+    (tmp_path / "example_01.json").write_text('{"rows": [1]}', encoding="utf-8")
+    assert hash_directory(str(tmp_path)) != directory_hash
+    assert hash_file(str(tmp_path / "example_01.json")) != file_hash
+
+    assert hash_evaluators({"MAE": MAE()}) == hash_evaluators({"MAE": MAE()})
+    assert hash_evaluators({"ASYMMETRIC": AsymmetricLoss(alpha=2.0)}) != hash_evaluators({"ASYMMETRIC": AsymmetricLoss(alpha=3.0)})
+    assert hash_evaluators({"MAE": MAE()}, {"samples": 100}) != hash_evaluators({"MAE": MAE()}, {"samples": 200})
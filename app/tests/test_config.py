@@ -0,0 +1,64 @@
+import pytest
+from utils.config import load_config, validate_config
+
+@pytest.fixture
+def config(tmp_path):
+    """Fixture to create a valid configuration over existing directories."""
+    for name in ("ground_truth", "model_outputs"):
+        (tmp_path / name).mkdir()
+    return {
+        "ground_truth_dir": str(tmp_path / "ground_truth"),
+        "model_outputs_dir": str(tmp_path / "model_outputs"),
+        "evaluation": {"metrics": ["MAE", "mape"], "format": "json"},
+        "bootstrap": {"samples": 100, "confidence": 0.9},
+        "service": {"port": 8080, "workers": 2},
+    }
+
+def test_load_config(tmp_path):
+    """Test that YAML files are loaded, empty files are empty and missing files use defaults."""
+    path = tmp_path / "config.yaml"
+    path.write_text("workers: 2\nevaluation:\n  format: csv\n", encoding="utf-8")
+    assert load_config(str(path)) == {"workers": 2, "evaluation": {"format": "csv"}}
+
+    path.write_text("", encoding="utf-8")
+    assert load_config(str(path)) == {}
+    assert load_config(str(tmp_path / "missing.yaml")) == {}
+
+    path.write_text("- a list\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="must be a mapping"):
+        load_config(str(path))
+
+def test_validate_config_accepts_valid_config(config):
+    """Test that a valid configuration has no problems."""
+    assert validate_config(config) == []
+
+def test_validate_config_reports_every_problem(config, tmp_path):
+    """Test that all problems are reported, not only the first one."""
+    config["model_outputs_dir"] = str(tmp_path / "missing")
+    config["evaluation"] = {"metrics": ["MAE", "RMSE"], "format": "xml"}
+    config["bootstrap"]["unit"] = "section"
+    config["validation"] = {"mode": "loose"}
+    config["notifier"] = {"overflow": "ignore"}
+    config["workers"] = 0
+    config["service"]["port"] = "http"
+    config["profile"] = {"enabled": True, "max_records": 0}
+
+    assert validate_config(config) == [
+        f"'model_outputs_dir' is not a directory: {tmp_path / 'missing'}",
+        "Unsupported metric: RMSE",
+        "Unsupported report format: xml",
+        "Unsupported bootstrap unit: section",
+        "Unsupported validation mode: loose",
+        "Unsupported overflow policy: ignore",
+        "'workers' must be at least 1: 0",
+        "'service.port' must be an integer: 'http'",
+        "'profile.max_records' must be at least 1: 0",
+    ]
+
+def test_validate_config_requires_metrics_and_mappings(config):
+    """Test that a configuration without metrics, or with a malformed section, is invalid."""
+    config["evaluation"]["metrics"] = []
+    assert validate_config(config) == ["'evaluation.metrics' must list at least one metric."]
+
+    config["watch"] = "fast"
+    assert validate_config(config) == ["'watch' must be a mapping."]
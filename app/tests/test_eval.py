@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+import pandas as pd
+from evaluators.base_evaluator import BaseEvaluator
+from evaluators.mae_evaluator import MAE
+from evaluators.mape_evaluator import MAPE
+from evaluators.mre_evaluator import MRE
+from evaluators.asymmetric_evaluator import AsymmetricLoss
+from adapters.row_store import RowStore
+from utils.eval import (align_sections, evaluate_sections, evaluate_by_section, evaluate_by_section_per_section,
+                        segment_section_totals, evaluate_segments, run_indices)
+
+GT_ROWS = [
+    {"sectionName": "Plumbing", "rowTotalCostUsd": 500},
+    {"sectionName": "Electrical", "rowTotalCostUsd": 300},
+    {"sectionName": "Plumbing", "rowTotalCostUsd": 100},
+    {"sectionName": "Permits", "rowTotalCostUsd": 0}
+]
+
+MODEL_ROWS = [
+    {"sectionName": "Plumbing", "rowTotalCostUsd": 550},
+    {"sectionName": "Framing", "rowTotalCostUsd": 200},
+    {"sectionName": "Permits", "rowTotalCostUsd": 50}
+]
+
+
+class SquaredError(BaseEvaluator):
+    """Custom evaluator relying on the default evaluate_aligned."""
+
+    def evaluate(self, ground_truth, predictions):
+        ground_truth -= predictions  # Mutates its input on purpose.
+        return np.mean(ground_truth ** 2)
+
+
+@pytest.fixture
+def evaluators():
+    return {"MAE": MAE(), "MAPE": MAPE(), "MRE": MRE(), "ASYMMETRIC": AsymmetricLoss(), "SQUARED": SquaredError()}
+
+
+def test_align_sections():
+    """Test that sections are aligned on their sorted union, with zeros for missing ones."""
+    sections, gt, model = align_sections(pd.DataFrame(GT_ROWS), RowStore.from_rows(MODEL_ROWS))
+
+    assert sections == ["Electrical", "Framing", "Permits", "Plumbing"]
+    assert gt.tolist() == [300.0, 0.0, 0.0, 600.0]
+    assert model.tolist() == [0.0, 200.0, 50.0, 550.0]
+
+
+def test_evaluate_sections_matches_single_metric_functions(evaluators):
+    """Test that the fused evaluation matches one call per metric."""
+    gt_df, model_df = pd.DataFrame(GT_ROWS), pd.DataFrame(MODEL_ROWS)
+    global_scores, section_scores = evaluate_sections(evaluators, RowStore.from_rows(GT_ROWS), RowStore.from_rows(MODEL_ROWS))
+
+    for name, evaluator in evaluators.items():
+        assert np.isclose(global_scores[name], evaluate_by_section(evaluator, gt_df, model_df), equal_nan=True)
+        expected = evaluate_by_section_per_section(evaluator, gt_df, model_df)
+        assert list(section_scores[name]) == list(expected)
+        assert np.allclose(list(section_scores[name].values()), list(expected.values()), equal_nan=True)
+
+    assert np.isclose(global_scores["MAE"], (300 + 200 + 50 + 50) / 4)
+    assert np.isnan(section_scores["MAPE"]["Permits"]), "Sections with zero ground truth have no MAPE."
+
+
+class RecordingMAE(MAE):
+    """MAE recording the arrays it receives."""
+
+    def __init__(self, supports_aligned_arrays):
+        self.supports_aligned_arrays = supports_aligned_arrays
+        self.received = []
+
+    def evaluate(self, ground_truth, predictions):
+        self.received.append(ground_truth)
+        return super().evaluate(ground_truth, predictions)
+
+    def evaluate_aligned(self, ground_truth, predictions):
+        self.received.append(ground_truth)
+        return super().evaluate_aligned(ground_truth, predictions)
+
+
+def test_evaluate_sections_dispatches_on_supports_aligned_arrays():
+    """Test that only evaluators declaring supports_aligned_arrays get the shared read-only arrays."""
+    shared, copying = RecordingMAE(True), RecordingMAE(False)
+    global_scores, _ = evaluate_sections({"SHARED": shared, "COPYING": copying, "SQUARED": SquaredError()},
+                                         RowStore.from_rows(GT_ROWS), RowStore.from_rows(MODEL_ROWS))
+
+    assert not shared.received[0].flags.writeable, "Declaring evaluators should get the shared arrays."
+    assert all(array.flags.writeable for array in copying.received), "Other evaluators should get copies."
+    assert copying.received[0] is not shared.received[0]
+    assert global_scores["SHARED"] == global_scores["COPYING"]
+    assert global_scores["SQUARED"] == np.mean(np.array([300.0, -200.0, -50.0, 50.0]) ** 2)
+
+
+def test_default_elementwise_falls_back_to_evaluate():
+    """Test that evaluators without a vectorized version still get per-element scores."""
+    scores = SquaredError().evaluate_elementwise(np.array([1.0, 2.0]), np.array([3.0, 2.0]))
+    assert scores.tolist() == [4.0, 0.0]
+
+
+def test_evaluate_segments_matches_single_segments(evaluators):
+    """Test that each (example, run) pair gets the score of evaluating it alone."""
+    gt_store = RowStore.concat([RowStore.from_rows(GT_ROWS, "example_01"), RowStore.from_rows(GT_ROWS[:2], "example_02"),
+                                RowStore.from_rows(GT_ROWS, "example_01")])
+    model_store = RowStore.concat([RowStore.from_rows(MODEL_ROWS, "example_01"), RowStore.from_rows(MODEL_ROWS[:1], "example_02"),
+                                   RowStore.from_rows(MODEL_ROWS[1:], "example_01")])
+    sections, gt_matrix, model_matrix, mask = segment_section_totals(gt_store, model_store)
+    assert sections == ["Electrical", "Framing", "Permits", "Plumbing"]
+    assert mask[1].tolist() == [True, False, False, True], "Pairs should only use their own sections."
+
+    scores = evaluate_segments(evaluators, gt_store, model_store)
+    for segment in range(3):
+        _, gt_array, model_array = align_sections(gt_store.take_segments([segment]), model_store.take_segments([segment]))
+        for name, evaluator in evaluators.items():
+            expected = evaluator.evaluate_aligned(gt_array, model_array)
+            assert np.isclose(scores[name][segment], expected, equal_nan=True), (name, segment)
+
+    assert run_indices(model_store.names).tolist() == [0, 0, 1]
@@ -3,6 +3,8 @@ from observers.evaluation_notifier import EvaluationNotifier
 from observers.console_logger import ConsoleLogger
 from observers.file_logger import FileLogger
 import os
+from observers.base_observer import BaseObserver
+from observers.events import make_events
 
 @pytest.fixture
 def notifier():
@@ -57,3 +59,34 @@ def test_notifier_with_multiple_observers(notifier, console_logger, file_logger,
     assert captured.out == expected_output, "ConsoleLogger did not receive notification correctly."
     assert len(lines) == 1, "FileLogger should log only one entry."
     assert lines[0].strip() == "Model: Llama-2 | Metric: MAPE | Score: 12.3400"
+
+
+class RecordingObserver(BaseObserver):
+    """Observer implementing only `update`, to exercise the batch fallback."""
+
+    def __init__(self):
+        self.events = []
+
+    def update(self, model_name, metric_name, score):
+        self.events.append((model_name, metric_name, score))
+
+def test_notify_batch(notifier, console_logger, file_logger, capsys):
+    """Test that a batch produces the same lines as one notification per event."""
+    recorder = RecordingObserver()
+    for observer in (console_logger, file_logger, recorder):
+        notifier.add_observer(observer)
+
+    events = make_events([{"model_file": "GPT-4", "metric": "MAE", "score": 10.5}],
+                         [{"model_file": "GPT-4", "metric": "MAE", "sectionName": "Plumbing", "score": 2.0},
+                          {"model_file": "GPT-4", "metric": "MAE", "sectionName": "Roof", "score": float("nan")}])
+    notifier.notify_batch(events)
+
+    expected_lines = ["Model: GPT-4 | Metric: MAE | Score: 10.5000",
+                      "Model: GPT-4 | Metric: MAE [Plumbing] | Score: 2.0000",
+                      "Model: GPT-4 | Metric: MAE [Roof] | Score: nan"]
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [f"[LOG] {line}" for line in expected_lines]
+    with open(file_logger.file_path, "r", encoding="utf-8") as file:
+        assert file.read().splitlines() == expected_lines
+    assert [event[1] for event in recorder.events] == ["MAE", "MAE [Plumbing]", "MAE [Roof]"], \
+        "Observers without update_batch should receive one update per event."
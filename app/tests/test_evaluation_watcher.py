@@ -0,0 +1,186 @@
+import pytest
+import json
+import os
+import sqlite3
+import threading
+from evaluators.evaluator_pipeline import EvaluationPipeline
+from evaluators.evaluation_watcher import EvaluationWatcher
+from evaluators.mae_evaluator import MAE
+from observers.evaluation_notifier import EvaluationNotifier
+
+GROUND_TRUTH = {"rows": [{"sectionName": "Plumbing", "qty": 1, "rateUsd": 500, "rowTotalCostUsd": 500,
+                          "label": "Pipe", "uom": "EA", "category": "material"}]}
+
+
+def write_model_output(path, total):
+    """Writes a model output file with one prediction of `total` for example_01."""
+    rows = [{"sectionName": "Plumbing", "qty": 1, "rateUsd": total, "rowTotalCostUsd": total,
+             "label": "Pipe", "uom": "EA", "category": "material"}]
+    prediction = {"valid_file_name": "example_01", "rows": rows, "time_to_estimate_sec": 1.0}
+    path.write_text(json.dumps({"estimate_preds": [prediction]}), encoding="utf-8")
+
+
+def read_scores(tmp_path):
+    with open(tmp_path / "reports" / "report_global.json", encoding="utf-8") as file:
+        return {row["model_file"]: row["score"] for row in json.load(file)}
+
+
+def make_watcher(tmp_path, report_format="json"):
+    """Creates and starts a watcher over one ground truth and one model output, with no debounce."""
+    for name in ("ground_truth", "model_outputs", "reports"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "ground_truth" / "example_01.json").write_text(json.dumps(GROUND_TRUTH), encoding="utf-8")
+    write_model_output(tmp_path / "model_outputs" / "a.json", 400)
+    config = {
+        "ground_truth_dir": str(tmp_path / "ground_truth"),
+        "model_outputs_dir": str(tmp_path / "model_outputs"),
+        "evaluation": {"format": report_format, "output_path": str(tmp_path / "reports" / "report")},
+        "watch": {"poll_interval_sec": 0.01, "debounce_sec": 0},
+    }
+    pipeline = EvaluationPipeline(config, {"MAE": MAE()}, notifier=EvaluationNotifier())
+    watcher = EvaluationWatcher.from_config(pipeline, config)
+    watcher.start()
+    return watcher
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    """Fixture to create a watcher over one ground truth and one model output, with no debounce."""
+    return make_watcher(tmp_path)
+
+
+def test_watcher_updates_reports_incrementally(watcher, tmp_path, monkeypatch):
+    """Test that only new or changed files are evaluated and removed files are dropped."""
+    assert read_scores(tmp_path) == {"a.json": 100.0}
+    assert watcher.poll_once() is False, "Nothing changed since the start."
+
+    evaluated = []
+    compute = watcher.pipeline._compute_model_file
+    monkeypatch.setattr(watcher.pipeline, "_compute_model_file",
+                        lambda model_file: evaluated.append(model_file) or compute(model_file))
+
+    write_model_output(tmp_path / "model_outputs" / "b.json", 550)
+    assert watcher.poll_once() is True
+    assert read_scores(tmp_path) == {"a.json": 100.0, "b.json": 50.0}
+    assert evaluated == ["b.json"], "Unchanged files should not be re-evaluated."
+
+    write_model_output(tmp_path / "model_outputs" / "a.json", 5000)
+    os.remove(tmp_path / "model_outputs" / "b.json")
+    assert watcher.poll_once() is True
+    assert read_scores(tmp_path) == {"a.json": 4500.0}
+    assert not list((tmp_path / "reports").glob("*.tmp*")), "Reports should be replaced atomically."
+
+
+def test_watcher_reloads_changed_ground_truth(watcher, tmp_path):
+    """Test that a ground truth change re-evaluates every model file."""
+    ground_truth = json.loads(json.dumps(GROUND_TRUTH))
+    ground_truth["rows"][0]["rowTotalCostUsd"] = 1000
+    (tmp_path / "ground_truth" / "example_01.json").write_text(json.dumps(ground_truth), encoding="utf-8")
+
+    assert watcher.poll_once() is True
+    assert read_scores(tmp_path) == {"a.json": 600.0}
+
+
+def test_watcher_updates_sqlite_reports_in_place(tmp_path):
+    """Test that with SQLite reports the watch session keeps one run, replacing only the changed rows."""
+    watcher = make_watcher(tmp_path, "sqlite")
+    write_model_output(tmp_path / "model_outputs" / "b.json", 550)
+    assert watcher.poll_once() is True
+    write_model_output(tmp_path / "model_outputs" / "b.json", 600)
+    assert watcher.poll_once() is True
+
+    database = tmp_path / "reports" / "report.sqlite"
+    with sqlite3.connect(database) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM runs").fetchone() == (1,)
+        global_scores = connection.execute("SELECT model_file, score FROM global ORDER BY model_file").fetchall()
+        latency_rows = connection.execute("SELECT model_file, COUNT(*) FROM latency GROUP BY model_file").fetchall()
+    assert global_scores == [("a.json", 100.0), ("b.json", 100.0)]
+    assert latency_rows == [("a.json", 2), ("b.json", 2)], "Unchanged models should not be appended again."
+
+    os.remove(tmp_path / "model_outputs" / "a.json")
+    assert watcher.poll_once() is True
+    with sqlite3.connect(database) as connection:
+        assert connection.execute("SELECT DISTINCT model_file FROM by_section").fetchall() == [("b.json",)]
+        assert connection.execute("SELECT model_file FROM global").fetchall() == [("b.json",)]
+
+
+def test_watcher_keeps_worker_pool(watcher, tmp_path):
+    """Test that the worker pool stays alive between updates and restarts when the ground truth changes."""
+    watcher.pipeline.workers = 2
+    for name, total in (("b.json", 550), ("c.json", 600)):
+        write_model_output(tmp_path / "model_outputs" / name, total)
+    assert watcher.poll_once() is True
+    executor = watcher.pipeline._executor
+    assert executor is not None, "The pool should be kept after the update."
+
+    for name, total in (("b.json", 450), ("c.json", 300)):
+        write_model_output(tmp_path / "model_outputs" / name, total)
+    assert watcher.poll_once() is True
+    assert watcher.pipeline._executor is executor, "The same pool should serve every update."
+    assert read_scores(tmp_path) == {"a.json": 100.0, "b.json": 50.0, "c.json": 200.0}
+
+    ground_truth = json.loads(json.dumps(GROUND_TRUTH))
+    ground_truth["rows"][0]["rowTotalCostUsd"] = 1000
+    (tmp_path / "ground_truth" / "example_01.json").write_text(json.dumps(ground_truth), encoding="utf-8")
+    assert watcher.poll_once() is True
+    assert watcher.pipeline._executor is not executor, "Workers holding the old ground truth should be replaced."
+    assert read_scores(tmp_path) == {"a.json": 600.0, "b.json": 550.0, "c.json": 700.0}
+
+    watcher.close()
+    assert watcher.pipeline._executor is None
+
+
+def fail_once(monkeypatch, target, name, error):
+    """Makes `target.name` raise `error` on its next call only."""
+    original = getattr(target, name)
+    calls = []
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise error
+        return original(*args, **kwargs)
+    monkeypatch.setattr(target, name, wrapper)
+
+
+def test_watcher_retries_failed_update(watcher, tmp_path, monkeypatch):
+    """Test that an update whose reports cannot be written is retried by the next poll."""
+    fail_once(monkeypatch, watcher.pipeline, "update_reports", OSError("disk full"))
+    write_model_output(tmp_path / "model_outputs" / "b.json", 550)
+
+    with pytest.raises(OSError):
+        watcher.poll_once()
+    assert read_scores(tmp_path) == {"a.json": 100.0}
+    assert watcher.poll_once() is True, "The failed update should be retried."
+    assert read_scores(tmp_path) == {"a.json": 100.0, "b.json": 50.0}
+
+
+def test_watcher_retries_failed_ground_truth_reload(watcher, tmp_path, monkeypatch):
+    """Test that a ground truth reload that fails is retried by the next poll."""
+    fail_once(monkeypatch, watcher.pipeline, "load_ground_truth", FileNotFoundError("example_01.json"))
+    ground_truth = json.loads(json.dumps(GROUND_TRUTH))
+    ground_truth["rows"][0]["rowTotalCostUsd"] = 1000
+    (tmp_path / "ground_truth" / "example_01.json").write_text(json.dumps(ground_truth), encoding="utf-8")
+
+    with pytest.raises(FileNotFoundError):
+        watcher.poll_once()
+    assert watcher.poll_once() is True
+    assert read_scores(tmp_path) == {"a.json": 600.0}
+
+
+def test_watch_loop_survives_errors(watcher, tmp_path, monkeypatch):
+    """Test that the watch loop logs errors and keeps running until stopped."""
+    stop_event = threading.Event()
+    polls = []
+
+    def poll_once():
+        polls.append(None)
+        if len(polls) == 1:
+            raise OSError("model file removed while reading")
+        stop_event.set()
+        return False
+    monkeypatch.setattr(watcher, "poll_once", poll_once)
+    monkeypatch.setattr(watcher, "start", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+
+    watcher.watch(stop_event)
+    assert len(polls) == 2, "The loop should keep polling after a failed start and a failed poll."
@@ -0,0 +1,201 @@
+import pytest
+import json
+import logging
+from evaluators.evaluator_pipeline import EvaluationPipeline
+from evaluators.mae_evaluator import MAE
+from evaluators.mape_evaluator import MAPE
+from observers.evaluation_notifier import EvaluationNotifier
+from observers.base_observer import BaseObserver
+
+GROUND_TRUTHS = {
+    "example_01": [
+        {"sectionName": "Plumbing", "qty": 10, "rateUsd": 50, "rowTotalCostUsd": 500, "label": "Pipe", "uom": "EA", "category": "material"},
+        {"sectionName": "Electrical", "qty": 5, "rateUsd": 100, "rowTotalCostUsd": 500, "label": "Wiring", "uom": "LF", "category": "labor"}
+    ],
+    "example_02": [
+        {"sectionName": "Plumbing", "qty": 2, "rateUsd": 100, "rowTotalCostUsd": 200, "label": "Toilet", "uom": "EA", "category": "material"}
+    ]
+}
+
+MODEL_OUTPUTS = {
+    "a.json": [("example_01", 400), ("example_02", 250)],
+    "b.json": [("example_01", 600), ("example_01", 450)],
+    "c.json": [("example_02", 180)]
+}
+
+
+class RecordingObserver(BaseObserver):
+    """Observer that records every event it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def update(self, model_name: str, metric_name: str, score: float):
+        self.events.append((model_name, metric_name, score))
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Fixture to create ground truth and model output directories."""
+    gt_dir = tmp_path / "ground_truth"
+    outputs_dir = tmp_path / "model_outputs"
+    gt_dir.mkdir()
+    outputs_dir.mkdir()
+
+    for name, rows in GROUND_TRUTHS.items():
+        (gt_dir / f"{name}.json").write_text(json.dumps({"rows": rows}), encoding="utf-8")
+
+    for model_file, preds in MODEL_OUTPUTS.items():
+        estimate_preds = [
+            {
+                "valid_file_name": valid_file_name,
+                "rows": [{"sectionName": "Plumbing", "qty": 1, "rateUsd": total, "rowTotalCostUsd": total,
+                          "label": "Pipe", "uom": "EA", "category": "material"}],
+                "time_to_estimate_sec": 1.5
+            }
+            for valid_file_name, total in preds
+        ]
+        (outputs_dir / model_file).write_text(json.dumps({"estimate_preds": estimate_preds}), encoding="utf-8")
+
+    return {
+        "ground_truth_dir": str(gt_dir),
+        "model_outputs_dir": str(outputs_dir),
+        "evaluation": {"format": "json", "output_path": str(tmp_path / "reports" / "report")}
+    }
+
+
+def run_pipeline(config):
+    """Runs the pipeline and returns the collected results and observed events."""
+    observer = RecordingObserver()
+    notifier = EvaluationNotifier()
+    notifier.add_observer(observer)
+    pipeline = EvaluationPipeline(config, {"MAE": MAE(), "MAPE": MAPE()}, notifier=notifier)
+    results = [pipeline.process_model_file(model_file) for model_file in sorted(MODEL_OUTPUTS)]
+    return results, observer.events
+
+
+def test_process_model_file_scores(config):
+    """Test the global and per-section scores of a single model file."""
+    results, events = run_pipeline(config)
+    global_results, section_results, _, _, _, _ = results[0]
+
+    assert {key: global_results[0][key] for key in ("model_file", "metric", "score")} == \
+        {"model_file": "a.json", "metric": "MAE", "score": 275.0}
+    assert [r["sectionName"] for r in section_results if r["metric"] == "MAE"] == ["Electrical", "Plumbing"]
+    assert events[0] == ("a.json", "MAE", 275.0), "Global metrics should be notified first."
+
+
+@pytest.mark.parametrize("mode", ["lenient", "strict"])
+def test_schema_validation_mode(config, mode, caplog):
+    """Test that invalid predictions are dropped in lenient mode and reject the file in strict mode."""
+    model_path = f"{config['model_outputs_dir']}/a.json"
+    with open(model_path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    data["estimate_preds"][1]["rows"][0]["rowTotalCostUsd"] = "250"
+    with open(model_path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+
+    config["validation"] = {"mode": mode}
+    pipeline = EvaluationPipeline(config, {"MAE": MAE()}, notifier=EvaluationNotifier())
+    results = pipeline.process_model_file("a.json")
+
+    assert "'rowTotalCostUsd' must be a number, found str" in caplog.text
+    if mode == "strict":
+        assert results is None, "The file should be rejected."
+    else:
+        run_results = results[3]
+        assert {result["valid_file_name"] for result in run_results} == {"example_01"}
+
+
+def test_parallel_run_matches_sequential(config, tmp_path):
+    """Test that running with several workers gives the same reports and event order."""
+    sequential_observer, parallel_observer = RecordingObserver(), RecordingObserver()
+
+    for workers, observer in ((1, sequential_observer), (2, parallel_observer)):
+        notifier = EvaluationNotifier()
+        notifier.add_observer(observer)
+        run_config = dict(config, workers=workers)
+        run_config["evaluation"] = dict(config["evaluation"], output_path=str(tmp_path / f"report_{workers}"))
+        EvaluationPipeline(run_config, {"MAE": MAE(), "MAPE": MAPE()}, notifier=notifier).run()
+
+    with open(tmp_path / "report_1_by_section.json", encoding="utf-8") as file:
+        sequential = json.load(file)
+    with open(tmp_path / "report_2_by_section.json", encoding="utf-8") as file:
+        parallel = json.load(file)
+
+    assert parallel == sequential, "Parallel reports should match the sequential ones."
+    assert parallel_observer.events == sequential_observer.events, "Events should arrive in file order."
+    assert [event[0] for event in parallel_observer.events][0] == "a.json"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_writes_profile(config, tmp_path, workers):
+    """Test that an enabled profiler writes a profile next to the reports, including worker stages."""
+    (tmp_path / "reports").mkdir()
+    run_config = dict(config, workers=workers, profile={"enabled": True})
+    EvaluationPipeline(run_config, {"MAE": MAE()}, notifier=EvaluationNotifier()).run()
+
+    with open(tmp_path / "reports" / "report_profile.json", encoding="utf-8") as file:
+        profile = json.load(file)
+
+    assert profile["summary"]["parse_model_output"]["calls"] == len(MODEL_OUTPUTS)
+    assert profile["summary"]["evaluate"]["rows"] == 5, "Evaluated rows should be recorded per model file."
+    assert {"load_ground_truth", "write_reports"} <= set(profile["summary"])
+
+
+def test_run_without_profile(config, tmp_path):
+    """Test that no profile is written when profiling is disabled."""
+    (tmp_path / "reports").mkdir()
+    EvaluationPipeline(config, {"MAE": MAE()}, notifier=EvaluationNotifier()).run()
+    assert not (tmp_path / "reports" / "report_profile.json").exists()
+
+
+def test_run_scores(config):
+    """Test that each (example, run) pair is scored separately and rolled up per model."""
+    results, _ = run_pipeline(config)
+    global_results, _, _, run_results, _, _ = results[1]
+    mae_runs = [result for result in run_results if result["metric"] == "MAE"]
+
+    assert [(r["valid_file_name"], r["run"]) for r in mae_runs] == [("example_01", 0), ("example_01", 1)]
+    # Run 0 predicts 600 Plumbing vs 500 Plumbing + 500 Electrical; run 1 predicts 450.
+    assert [r["score"] for r in mae_runs] == [pytest.approx(300.0), pytest.approx(275.0)]
+    assert global_results[0]["score_run_mean"] == pytest.approx(287.5)
+    assert global_results[0]["score_run_std"] == pytest.approx(17.67766953)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_bootstrap(config, tmp_path, workers, caplog):
+    """Test that bootstrap adds confidence intervals and a pairwise significance report."""
+    caplog.set_level(logging.INFO)
+    (tmp_path / "reports").mkdir()
+    run_config = dict(config, workers=workers, bootstrap={"samples": 500, "seed": 1})
+    EvaluationPipeline(run_config, {"MAE": MAE(), "MAPE": MAPE()}, notifier=EvaluationNotifier()).run()
+
+    with open(tmp_path / "reports" / "report_global.json", encoding="utf-8") as file:
+        global_results = json.load(file)
+    with open(tmp_path / "reports" / "report_significance.json", encoding="utf-8") as file:
+        significance = json.load(file)
+
+    for result in global_results:
+        assert result["score_ci_low"] <= result["score_ci_high"], result
+    assert len(significance) == 2 * 3 * 2, "Each metric should compare every ordered pair of models."
+    assert {row["model_file"] for row in significance} == set(MODEL_OUTPUTS)
+    assert "report_significance.json" in caplog.text, "The log should name every exported report."
+
+
+def test_run_line_items(config, tmp_path, caplog):
+    """Test that line-item matching writes one summary per model file and section."""
+    caplog.set_level(logging.INFO)
+    (tmp_path / "reports").mkdir()
+    run_config = dict(config, line_items={"min_similarity": 0.5})
+    EvaluationPipeline(run_config, {"MAE": MAE()}, notifier=EvaluationNotifier()).run()
+
+    with open(tmp_path / "reports" / "report_line_items.json", encoding="utf-8") as file:
+        line_items = json.load(file)
+    overall = {row["model_file"]: row for row in line_items if row["sectionName"] is None}
+
+    assert set(overall) == set(MODEL_OUTPUTS)
+    assert "report_line_items.json" in caplog.text, "The log should name every exported report."
+    # a.json: 'Pipe' matches example_01's pipe; example_01's wiring and example_02's toilet are missing.
+    assert (overall["a.json"]["n_matched"], overall["a.json"]["n_missing"], overall["a.json"]["n_hallucinated"]) == (1, 2, 1)
+    assert overall["a.json"]["total_mae"] == pytest.approx(100.0)
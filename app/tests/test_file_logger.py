@@ -27,6 +27,26 @@ def test_file_logger_creates_file(file_logger):
     """Test if FileLogger creates the log file when it doesn't exist."""
     assert os.path.exists(LOG_FILE), "Log file should be created by FileLogger."
 
+def test_buffered_file_logger(tmp_path):
+    """Test that a buffered FileLogger writes lines only on flush, in the same format."""
+    log_file = str(tmp_path / "buffered.log")
+    with FileLogger(log_file, buffered=True, buffer_size=3, flush_interval=3600) as logger:
+        logger.update("GPT-4", "MAE", 10.5)
+        logger.update("Llama-2", "MAPE", 12.34)
+        assert not os.path.exists(log_file), "Buffered lines should not be written before a flush."
+
+        logger.update("GPT-4", "MRE", 0.25)
+        with open(log_file, "r", encoding="utf-8") as file:
+            assert len(file.readlines()) == 3, "Reaching buffer_size should flush the buffer."
+
+        logger.update("Llama-2", "MAE", 1.0)
+
+    with open(log_file, "r", encoding="utf-8") as file:
+        lines = file.readlines()
+    assert len(lines) == 4, "Closing the logger should flush the remaining lines."
+    assert lines[0].strip() == "Model: GPT-4 | Metric: MAE | Score: 10.5000"
+    assert lines[3].strip() == "Model: Llama-2 | Metric: MAE | Score: 1.0000"
+
 def teardown_module(module):
     """Cleanup: Remove the test log file after tests."""
     if os.path.exists(LOG_FILE):
@@ -0,0 +1,33 @@
+import io
+import sys
+from utils.import_profile import parse_import_time, format_import_summary, profile_imports
+
+def test_parse_import_time():
+    """Test that import time records are parsed with their nesting depth."""
+    assert parse_import_time("import time:       564 |      32044 |     numpy._core\n") == \
+        {"module": "numpy._core", "self_ms": 0.564, "cumulative_ms": 32.044, "depth": 2}
+    assert parse_import_time("import time: self [us] | cumulative | imported package\n") is None
+    assert parse_import_time("2025-01-01 - INFO - Configuration loaded\n") is None
+
+def test_format_import_summary():
+    """Test that the summary totals every module and lists the slowest top-level imports."""
+    records = [parse_import_time(line) for line in (
+        "import time:       100 |        100 |   numpy.linalg",
+        "import time:       400 |        500 | numpy",
+        "import time:       200 |        200 | json",
+    )]
+    lines = format_import_summary(records, top=1).splitlines()
+
+    assert lines[0].startswith("[IMPORTS] 0.7 ms importing 3 modules.")
+    assert len(lines) == 3 and lines[2].split() == ["0.5", "0.4", "numpy"]
+
+def test_profile_imports(tmp_path):
+    """Test that the script runs with import timing and its other output is passed through."""
+    script = tmp_path / "script.py"
+    script.write_text("import sys, json\nprint('warning', file=sys.stderr)\nsys.exit(3)\n", encoding="utf-8")
+    stream = io.StringIO()
+
+    assert profile_imports(str(script), [], stream=stream) == 3
+    output = stream.getvalue()
+    assert output.startswith("warning\n"), "Other standard error lines should be passed through."
+    assert "[IMPORTS]" in output and " json\n" in output
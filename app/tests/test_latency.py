@@ -0,0 +1,65 @@
+import pytest
+import numpy as np
+import pandas as pd
+from adapters.row_store import RowStoreBuilder
+from utils.latency import grouped_quantiles, model_latency, pareto_frontier, add_latency_columns
+
+
+@pytest.fixture
+def store():
+    """Fixture to create a model output store with three predictions for two examples."""
+    rows = [{"sectionName": "Plumbing", "qty": 1, "rateUsd": 10, "rowTotalCostUsd": 10,
+             "label": "Pipe", "uom": "EA", "category": "material"}]
+    builder = RowStoreBuilder()
+    for name, time in [("example_02", 30.0), ("example_01", 10.0), ("example_02", 50.0)]:
+        builder.add_segment(rows, name, time)
+    return builder.build()
+
+
+def test_grouped_quantiles_match_numpy():
+    """Test that grouped quantiles match np.quantile on every group, ignoring NaN."""
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(size=200)
+    values[::17] = np.nan
+    codes = rng.integers(0, 4, size=200)
+    result = grouped_quantiles(values, codes, 5, [0.5, 0.9, 0.99])
+
+    for group in range(4):
+        group_values = values[(codes == group) & ~np.isnan(values)]
+        np.testing.assert_allclose(result[group], np.quantile(group_values, [0.5, 0.9, 0.99]))
+    assert np.isnan(result[4]).all(), "Empty groups should have NaN quantiles."
+
+
+def test_model_latency(store):
+    """Test the latency rows of a model file: the whole file first, then each example."""
+    rows = model_latency(store, "a.json")
+
+    assert [row["valid_file_name"] for row in rows] == [None, "example_01", "example_02"]
+    assert rows[0]["n_predictions"] == 3
+    assert rows[0]["mean_sec"] == pytest.approx(30.0)
+    assert rows[0]["p50_sec"] == pytest.approx(30.0)
+    assert rows[0]["throughput_per_sec"] == pytest.approx(3 / 90.0)
+    assert rows[2]["p90_sec"] == pytest.approx(48.0)
+
+
+def test_pareto_frontier():
+    """Test that dominated, duplicated and NaN points are excluded from the frontier."""
+    costs = np.array([1.0, 2.0, 3.0, 2.0, 1.0, np.nan])
+    errors = np.array([5.0, 3.0, 4.0, 3.0, 6.0, 0.0])
+    assert pareto_frontier(costs, errors).tolist() == [True, True, False, False, False, False]
+
+
+def test_add_latency_columns():
+    """Test that model latency and the Pareto flag are added to every global row."""
+    global_df = pd.DataFrame([{"model_file": "a.json", "metric": "MAE", "score": 10.0},
+                              {"model_file": "b.json", "metric": "MAE", "score": 20.0},
+                              {"model_file": "a.json", "metric": "MRE", "score": 0.5},
+                              {"model_file": "b.json", "metric": "MRE", "score": 0.1}])
+    latency_df = pd.DataFrame([{"model_file": "a.json", "valid_file_name": None, "n_predictions": 1, "mean_sec": 5.0,
+                                "p50_sec": 5.0, "p90_sec": 5.0, "p99_sec": 5.0, "total_sec": 5.0, "throughput_per_sec": 0.2},
+                               {"model_file": "b.json", "valid_file_name": None, "n_predictions": 1, "mean_sec": 1.0,
+                                "p50_sec": 1.0, "p90_sec": 1.0, "p99_sec": 1.0, "total_sec": 1.0, "throughput_per_sec": 1.0}])
+    merged = add_latency_columns(global_df, latency_df)
+
+    assert merged["latency_p50_sec"].tolist() == [5.0, 1.0, 5.0, 1.0]
+    assert merged["pareto_optimal"].tolist() == [True, True, False, True]
@@ -29,3 +29,9 @@ def test_mae_with_empty_lists(evaluator):
     ground_truth = []
     predictions = []
     assert np.isnan(evaluator.evaluate(ground_truth, predictions))
+
+def test_mae_elementwise(evaluator):
+    """Test that elementwise MAE returns one absolute error per element."""
+    ground_truth = np.array([100.0, 200.0, 300.0])
+    predictions = np.array([110.0, 190.0, 250.0])
+    assert evaluator.evaluate_elementwise(ground_truth, predictions).tolist() == [10.0, 10.0, 50.0]
@@ -0,0 +1,71 @@
+import os
+import sys
+import subprocess
+import pytest
+import main
+import observers.notifier_factory
+from observers.evaluation_notifier import EvaluationNotifier
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.mark.parametrize("argv, expected", [
+    ([], ["evaluate"]),
+    (["--watch"], ["evaluate", "--watch"]),
+    (["--config", "c.yaml", "--no-cache"], ["--config", "c.yaml", "evaluate", "--no-cache"]),
+    (["--profile-imports", "list-metrics"], ["--profile-imports", "list-metrics"]),
+    (["--help"], ["--help"]),
+])
+def test_default_command(argv, expected):
+    """Test that commands default to 'evaluate', so the previous command lines keep working."""
+    assert main.with_default_command(argv) == expected
+
+def test_list_metrics(capsys):
+    """Test that list-metrics prints every registered metric."""
+    assert main.main(["list-metrics"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in lines] == ["MAE", "MRE", "MAPE", "ASYMMETRIC"]
+
+def test_validate_config(tmp_path, capsys):
+    """Test that validate-config exits with 0 for a valid file and 1 with the problems otherwise."""
+    for name in ("ground_truth", "model_outputs"):
+        (tmp_path / name).mkdir()
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f"ground_truth_dir: {tmp_path / 'ground_truth'}\n"
+                           f"model_outputs_dir: {tmp_path / 'model_outputs'}\n"
+                           "evaluation:\n  metrics: [MAE]\n  format: json\n", encoding="utf-8")
+    assert main.main(["--config", str(config_path), "validate-config"]) == 0
+    assert "is valid" in capsys.readouterr().out
+
+    config_path.write_text("evaluation:\n  metrics: [RMSE]\n", encoding="utf-8")
+    assert main.main(["--config", str(config_path), "validate-config"]) == 1
+    assert "Unsupported metric: RMSE" in capsys.readouterr().err
+
+    assert main.main(["--config", str(tmp_path / "missing.yaml"), "validate-config"]) == 1
+
+def test_evaluate_closes_notifier_when_setup_fails(tmp_path, monkeypatch):
+    """Test that the notifier is closed when the pipeline cannot be created."""
+    class RecordingNotifier(EvaluationNotifier):
+        closed = False
+
+        def close(self):
+            RecordingNotifier.closed = True
+            super().close()
+    monkeypatch.setattr(observers.notifier_factory, "create_notifier", lambda config: RecordingNotifier())
+    for name in ("ground_truth", "model_outputs"):
+        (tmp_path / name).mkdir()
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f"ground_truth_dir: {tmp_path / 'ground_truth'}\n"
+                           f"model_outputs_dir: {tmp_path / 'model_outputs'}\n"
+                           "evaluation:\n  metrics: [MAE]\n  format: json\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Ground truths not found"):
+        main.main(["--config", str(config_path), "evaluate", "--no-cache"])
+    assert RecordingNotifier.closed
+
+@pytest.mark.parametrize("command", ["list-metrics", "validate-config"])
+def test_light_commands_do_not_import_pandas(command):
+    """Test that the commands that do not evaluate start without pandas or numpy."""
+    code = (f"import sys, main; main.main([{command!r}]); "
+            "print(sorted(m for m in ('pandas', 'numpy', 'pyarrow') if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=APP_DIR, capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines()[-1] == "[]"
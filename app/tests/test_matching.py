@@ -0,0 +1,119 @@
+import pytest
+import re
+import numpy as np
+from adapters.row_store import RowStoreBuilder
+from utils.matching import (line_item_settings, tokenize_labels, candidate_pairs, greedy_assignment,
+                            match_line_items, line_item_report)
+
+GT_ROWS = [
+    {"sectionName": "Plumbing", "label": "Copper pipe 1/2 in", "uom": "LF", "qty": 10, "rateUsd": 5, "rowTotalCostUsd": 50},
+    {"sectionName": "Plumbing", "label": "Toilet install", "uom": "EA", "qty": 2, "rateUsd": 300, "rowTotalCostUsd": 600},
+    {"sectionName": "Electrical", "label": "Outlet", "uom": "EA", "qty": 8, "rateUsd": 20, "rowTotalCostUsd": 160},
+    {"sectionName": "Electrical", "label": "Wire 12 AWG", "uom": "LF", "qty": 100, "rateUsd": 1, "rowTotalCostUsd": 100},
+]
+
+PRED_ROWS = [
+    {"sectionName": "Plumbing", "label": "copper pipe", "uom": "lf", "qty": 12, "rateUsd": 5, "rowTotalCostUsd": 60},
+    {"sectionName": "Plumbing", "label": "Install toilet", "uom": "EA", "qty": 2, "rateUsd": 250, "rowTotalCostUsd": 500},
+    {"sectionName": "Electrical", "label": "outlet", "uom": None, "qty": 8, "rateUsd": 25, "rowTotalCostUsd": 200},
+    {"sectionName": "Electrical", "label": "Wire 12 AWG", "uom": "EA", "qty": 1, "rateUsd": 90, "rowTotalCostUsd": 90},
+    {"sectionName": "Framing", "label": "Outlet", "uom": "EA", "qty": 1, "rateUsd": 20, "rowTotalCostUsd": 20},
+]
+
+
+def build_store(segments):
+    builder = RowStoreBuilder()
+    for rows in segments:
+        builder.add_segment(rows, "example_01")
+    return builder.build()
+
+
+def test_tokenize_labels():
+    """Test that labels are split into distinct lowercase tokens on a shared vocabulary."""
+    vocabulary = {}
+    offsets, token_ids = tokenize_labels(["Pipe pipe 1/2", None, "PIPE"], vocabulary)
+
+    assert offsets.tolist() == [0, 3, 3, 4]
+    assert sorted(vocabulary) == ["1", "2", "pipe"]
+    assert token_ids[3] == vocabulary["pipe"]
+
+
+def test_candidates_respect_section_and_uom():
+    """Test that only rows of the same section with compatible units are candidates."""
+    _, gt_rows, pred_rows, similarity = candidate_pairs(build_store([GT_ROWS]), build_store([PRED_ROWS]))
+    pairs = dict(zip(zip(gt_rows.tolist(), pred_rows.tolist()), similarity.tolist()))
+
+    assert pairs == {(0, 0): pytest.approx(0.4), (1, 1): 1.0, (2, 2): 1.0}, \
+        "Wire (LF vs EA) and the Framing outlet should not be candidates."
+
+
+def test_greedy_assignment_is_one_to_one():
+    """Test that better candidates take their rows first."""
+    gt_rows, pred_rows = np.array([0, 0, 1, 1]), np.array([0, 1, 0, 1])
+    accepted = greedy_assignment(gt_rows, pred_rows, np.array([1, 0, 2, 3]))
+    assert accepted.tolist() == [1, 2], "Row 0 takes prediction 1, leaving prediction 0 to row 1."
+
+
+def test_matching_matches_sequential_greedy():
+    """Test the vectorized matching against a pairwise greedy reference on random rows."""
+    rng = np.random.default_rng(0)
+    words = ["pipe", "copper", "install", "toilet", "outlet", "panel", "wire", "stud", "paint"]
+
+    def random_rows(n):
+        return [{"sectionName": f"S{rng.integers(3)}", "label": " ".join(rng.choice(words, size=rng.integers(1, 4))),
+                 "uom": ["EA", "lf", None][rng.integers(3)], "rowTotalCostUsd": float(rng.integers(100))}
+                for _ in range(n)]
+
+    for _ in range(10):
+        gt_segments = [random_rows(rng.integers(0, 12)) for _ in range(3)]
+        pred_segments = [random_rows(rng.integers(0, 12)) for _ in range(3)]
+        _, gt_rows, pred_rows, _ = match_line_items(build_store(gt_segments), build_store(pred_segments))
+
+        gt_flat = [(segment, row) for segment, rows in enumerate(gt_segments) for row in rows]
+        pred_flat = [(segment, row) for segment, rows in enumerate(pred_segments) for row in rows]
+        candidates = []
+        for i, (gt_segment, gt_row) in enumerate(gt_flat):
+            for j, (pred_segment, pred_row) in enumerate(pred_flat):
+                if gt_segment != pred_segment or gt_row["sectionName"] != pred_row["sectionName"]:
+                    continue
+                if gt_row["uom"] and pred_row["uom"] and gt_row["uom"].upper() != pred_row["uom"].upper():
+                    continue
+                gt_tokens = set(re.findall(r"[a-z0-9]+", gt_row["label"]))
+                pred_tokens = set(re.findall(r"[a-z0-9]+", pred_row["label"]))
+                similarity = len(gt_tokens & pred_tokens) / len(gt_tokens | pred_tokens)
+                if similarity >= 0.3:
+                    gap = abs(gt_row["rowTotalCostUsd"] - pred_row["rowTotalCostUsd"])
+                    candidates.append((-similarity, gap, i, j))
+        expected, used_gt, used_pred = set(), set(), set()
+        for _, _, i, j in sorted(candidates):
+            if i not in used_gt and j not in used_pred:
+                used_gt.add(i)
+                used_pred.add(j)
+                expected.add((i, j))
+
+        assert set(zip(gt_rows.tolist(), pred_rows.tolist())) == expected
+
+
+def test_line_item_report():
+    """Test the file and section summaries: counts, missing and hallucinated items and errors."""
+    rows = line_item_report(build_store([GT_ROWS]), build_store([PRED_ROWS]), "a.json")
+    by_section = {row["sectionName"]: row for row in rows}
+
+    assert [row["sectionName"] for row in rows] == [None, "Electrical", "Framing", "Plumbing"]
+    overall = by_section[None]
+    assert (overall["n_gt_items"], overall["n_pred_items"], overall["n_matched"]) == (4, 5, 3)
+    assert (overall["n_missing"], overall["n_hallucinated"]) == (1, 2)
+    assert overall["recall"] == pytest.approx(0.75)
+    assert by_section["Plumbing"]["qty_mae"] == pytest.approx(1.0)
+    assert by_section["Plumbing"]["rate_mape"] == pytest.approx((0 + 50 / 300 * 100) / 2)
+    assert by_section["Electrical"]["total_mae"] == pytest.approx(40.0)
+    assert by_section["Framing"]["n_hallucinated"] == 1 and np.isnan(by_section["Framing"]["recall"])
+
+
+def test_line_item_settings():
+    """Test that matching is enabled by its config section and validated."""
+    assert line_item_settings({}) is None
+    assert line_item_settings({"line_items": {"enabled": False}}) is None
+    assert line_item_settings({"line_items": {}}) == {"min_similarity": 0.3}
+    with pytest.raises(ValueError):
+        line_item_settings({"line_items": {"min_similarity": 0}})
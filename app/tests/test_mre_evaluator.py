@@ -38,3 +38,11 @@ def test_mre_with_empty_lists(evaluator):
     ground_truth = []
     predictions = []
     assert np.isnan(evaluator.evaluate(ground_truth, predictions))
+
+def test_mre_elementwise(evaluator):
+    """Test that elementwise MRE matches scoring each element separately."""
+    ground_truth = np.array([0.0, 200.0, 300.0])
+    predictions = np.array([50.0, 190.0, 330.0])
+    scores = evaluator.evaluate_elementwise(ground_truth, predictions)
+    assert np.isnan(scores[0]), "Zero ground truth should give NaN."
+    assert np.allclose(scores[1:], [0.05, 0.1])
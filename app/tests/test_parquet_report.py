@@ -0,0 +1,36 @@
+import pytest
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from reports.parquet_report import ParquetReport
+
+@pytest.fixture
+def sample_results():
+    """Fixture to create sample per-section evaluation results."""
+    return pd.DataFrame([
+        {"model_file": "2.json", "sectionName": "Plumbing", "metric": "MAE", "score": 10.5},
+        {"model_file": "2.json", "sectionName": "Framing", "metric": "MAE", "score": 8},
+        {"model_file": "4.json", "sectionName": "Plumbing", "metric": "MAPE", "score": None}
+    ])
+
+@pytest.fixture
+def parquet_report():
+    """Fixture to create a ParquetReport instance."""
+    return ParquetReport()
+
+def test_parquet_report_generation(parquet_report, sample_results, tmp_path):
+    """Test that ParquetReport generates a valid, typed Parquet file."""
+    output_file = tmp_path / "test_evaluation_report.parquet"
+    parquet_report.generate_report(sample_results, str(output_file))
+
+    assert output_file.exists(), "Parquet report file should be created."
+
+    table = pq.read_table(output_file)
+    assert table.column_names == ["model_file", "sectionName", "metric", "score"]
+    assert pa.types.is_dictionary(table.schema.field("metric").type), "metric should be dictionary-encoded."
+    assert pa.types.is_dictionary(table.schema.field("sectionName").type), "sectionName should be dictionary-encoded."
+    assert table.schema.field("score").type == pa.float64()
+
+    df = pd.read_parquet(output_file)
+    assert df["model_file"].astype(str).tolist() == ["2.json", "2.json", "4.json"]
+    assert df["score"].isna().tolist() == [False, False, True]
@@ -0,0 +1,103 @@
+import pytest
+from observers.base_stage_observer import BaseStageObserver
+from utils.profiling import StageProfiler, NullProfiler, create_profiler
+
+
+class RecordingStageObserver(BaseStageObserver):
+    """Stage observer that records every stage it receives."""
+
+    def __init__(self):
+        self.records = []
+
+    def on_stage(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def profiler():
+    """Fixture to create a StageProfiler with a recording observer."""
+    profiler = StageProfiler()
+    profiler.add_observer(RecordingStageObserver())
+    return profiler
+
+
+def test_stage_records(profiler):
+    """Test that stages record timings, custom fields and notify observers."""
+    with profiler.stage("parse_model_output", model_file="a.json") as stage:
+        stage["rows"] = 10
+    with profiler.stage("parse_model_output", model_file="b.json") as stage:
+        stage["rows"] = 5
+
+    record = profiler.records[0]
+    assert record["stage"] == "parse_model_output" and record["model_file"] == "a.json"
+    assert record["wall_sec"] >= 0 and record["cpu_sec"] >= 0 and record["peak_rss_mb"] > 0
+    assert profiler.observers[0].records == profiler.records, "Observers should receive every record."
+
+    summary = profiler.summary()["parse_model_output"]
+    assert summary["calls"] == 2 and summary["rows"] == 15
+
+    assert len(profiler.drain()) == 2
+    assert profiler.records == [], "Drained records should be forgotten."
+
+
+def test_limit_keeps_most_recent_records(profiler, tmp_path):
+    """Test that a limited profiler keeps only its most recent records but notifies every stage."""
+    profiler.limit(3)
+    for index in range(10):
+        with profiler.stage("score", request=index):
+            pass
+
+    assert [record["request"] for record in profiler.records] == [7, 8, 9]
+    assert len(profiler.observers[0].records) == 10
+    assert profiler.summary()["score"]["calls"] == 3
+    profiler.write(str(tmp_path / "profile.json"))
+    assert [record["request"] for record in profiler.drain()] == [7, 8, 9]
+    assert list(profiler.records) == []
+
+
+def test_long_running_modes_limit_records(tmp_path):
+    """Test that the watch mode and the scoring service bound the records of their profiler."""
+    from evaluators.evaluation_watcher import EvaluationWatcher
+    from evaluators.scoring_service import ScoringService
+
+    class Pipeline:
+        config = {"profile": {"enabled": True, "max_records": 5}}
+        model_outputs_dir = ground_truth_dir = str(tmp_path)
+
+        def __init__(self):
+            self.profiler = create_profiler(self.config)
+
+    for mode in (EvaluationWatcher, ScoringService):
+        pipeline = Pipeline()
+        mode(pipeline)
+        for _ in range(20):
+            with pipeline.profiler.stage("score"):
+                pass
+        assert len(pipeline.profiler.records) == 5, mode.__name__
+
+
+def test_stage_recorded_on_error(profiler):
+    """Test that a stage is recorded even when its block raises."""
+    with pytest.raises(ValueError):
+        with profiler.stage("evaluate"):
+            raise ValueError("boom")
+    assert profiler.records[0]["stage"] == "evaluate"
+
+
+def test_trace_memory():
+    """Test that tracemalloc peaks are recorded when memory tracing is enabled."""
+    profiler = StageProfiler(trace_memory=True)
+    with profiler.stage("allocate"):
+        data = bytearray(4 * 1024 * 1024)
+    assert profiler.records[0]["peak_traced_mb"] >= 4
+    del data
+
+
+def test_null_profiler():
+    """Test that profiling is disabled by default and the null profiler records nothing."""
+    profiler = create_profiler({})
+    assert isinstance(profiler, NullProfiler) and not profiler.enabled
+    with profiler.stage("evaluate") as stage:
+        stage["rows"] = 3
+    assert profiler.drain() == []
+    assert isinstance(create_profiler({"profile": {"enabled": True}}), StageProfiler)
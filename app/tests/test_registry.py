@@ -0,0 +1,40 @@
+import sys
+import pytest
+from utils.registry import LazyRegistry, EVALUATORS, REPORTS
+from evaluators.mae_evaluator import MAE
+
+@pytest.fixture
+def registry():
+    """Fixture to create a registry with an entry whose module is not imported yet."""
+    sys.modules.pop("json.tool", None)
+    return LazyRegistry("tool", {"json": "json.tool:main"})
+
+def test_registry_imports_on_first_use(registry):
+    """Test that listing names imports nothing and `get` imports only the requested module."""
+    assert registry.names() == ["json"]
+    assert "json" in registry and "yaml" not in registry
+    assert registry.path("json") == "json.tool:main"
+    assert "json.tool" not in sys.modules, "Listing the names should not import the module."
+
+    main = registry.get("json")
+    assert "json.tool" in sys.modules
+    assert main is sys.modules["json.tool"].main
+    assert registry.path("json") == "json.tool:main", "The path should not change once imported."
+
+def test_registry_unknown_name(registry):
+    """Test that unknown names raise a ValueError naming the kind of entry."""
+    with pytest.raises(ValueError, match="Unsupported tool: yaml"):
+        registry.get("yaml")
+
+def test_registry_register_and_create(registry):
+    """Test that classes can be registered directly and instantiated by name."""
+    registry.register("mae", MAE)
+    assert isinstance(registry.create("mae"), MAE)
+    assert registry.path("mae") == "evaluators.mae_evaluator:MAE"
+
+def test_builtin_registries():
+    """Test that every built-in metric and report format resolves to a class."""
+    assert EVALUATORS.names() == ["MAE", "MRE", "MAPE", "ASYMMETRIC"]
+    for registry in (EVALUATORS, REPORTS):
+        for name in registry.names():
+            assert isinstance(registry.get(name), type), f"{name} should resolve to a class."
@@ -31,3 +31,12 @@ def test_invalid_report_format():
     """Test that ReportGenerator raises an error for unsupported formats."""
     with pytest.raises(ValueError, match="Unsupported report format: xml"):
         ReportGenerator(format="xml")
+
+@pytest.mark.parametrize("report_format", ["parquet", "arrow"])
+def test_columnar_report_generation_with_report_generator(sample_results, tmp_path, report_format):
+    """Test that ReportGenerator correctly generates Parquet and Arrow reports."""
+    output_file = tmp_path / f"test_evaluation_report.{report_format}"
+    report_generator = ReportGenerator(format=report_format)
+    report_generator.generate(sample_results, str(output_file))
+
+    assert output_file.exists(), f"{report_format} report file should be created."
@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+import pandas as pd
+from adapters.row_store import RowStore, RowStoreBuilder
+from utils.eval import section_totals
+
+ROWS_A = [
+    {"sectionName": "Plumbing", "qty": 10, "rateUsd": 50, "rowTotalCostUsd": 500, "label": "Pipe", "uom": "EA", "category": "material"},
+    {"sectionName": "Electrical", "qty": 5, "rateUsd": 100, "rowTotalCostUsd": None, "label": "Wiring", "uom": "LF", "category": "labor"},
+    {"sectionName": None, "qty": 1, "rateUsd": 1, "rowTotalCostUsd": 1, "label": "Misc", "uom": "EA", "category": "labor"}
+]
+
+ROWS_B = [
+    {"sectionName": "Framing", "qty": 2, "rateUsd": 25.5, "rowTotalCostUsd": 51, "label": "Stud", "uom": "EA", "category": "material"},
+    {"sectionName": "Plumbing", "qty": 1, "rateUsd": 80, "rowTotalCostUsd": 80, "label": "Valve", "uom": "EA"}
+]
+
+
+@pytest.fixture
+def store():
+    """Fixture to create a store with two segments."""
+    builder = RowStoreBuilder()
+    builder.add_segment(ROWS_A, "example_01", 1.5)
+    builder.add_segment(ROWS_B, "example_02", 2.0)
+    return builder.build()
+
+
+def test_builder_layout(store):
+    """Test offsets, names, times and column encoding of a built store."""
+    assert store.offsets.tolist() == [0, 3, 5]
+    assert store.names == ["example_01", "example_02"]
+    assert store.times.tolist() == [1.5, 2.0]
+    assert store.numeric["qty"].dtype == np.float64
+    assert np.isnan(store.numeric["rowTotalCostUsd"][1]), "Null values should become NaN."
+    assert store.codes["sectionName"][2] == -1, "Missing categories should be coded as -1."
+    assert store.column("category").tolist() == ["material", "labor", "labor", "material", None]
+    assert store.segment_ids().tolist() == [0, 0, 0, 1, 1]
+
+
+def test_section_totals_match_groupby(store):
+    """Test that section totals match a pandas groupby sum."""
+    df = pd.DataFrame(ROWS_A + ROWS_B)
+    expected = df.groupby("sectionName")["rowTotalCostUsd"].sum()
+
+    totals = section_totals(store)
+    assert totals.index.tolist() == expected.index.tolist()
+    assert np.allclose(totals.to_numpy(), expected.to_numpy())
+
+
+def test_take_segments_and_concat(store):
+    """Test segment selection with repetitions and concatenation with merged categories."""
+    taken = store.take_segments([1, 1, 0])
+    assert taken.names == ["example_02", "example_02", "example_01"]
+    assert taken.offsets.tolist() == [0, 2, 4, 7]
+    assert taken.column("label").tolist() == ["Stud", "Valve", "Stud", "Valve", "Pipe", "Wiring", "Misc"]
+
+    other = RowStore.from_rows([{"sectionName": "Roofing", "rowTotalCostUsd": 10}], "example_03")
+    merged = RowStore.concat([store, other])
+    assert merged.n_segments == 3
+    assert merged.column("sectionName").tolist()[-3:] == ["Framing", "Plumbing", "Roofing"]
+    assert section_totals(merged)["Plumbing"] == 580
+
+
+def test_from_dataframe_round_trip():
+    """Test that a store built from a DataFrame converts back to the same values."""
+    df = pd.DataFrame(ROWS_B)
+    store = RowStore.from_dataframe(df)
+    result = store.to_dataframe()
+
+    assert result["label"].tolist() == ["Stud", "Valve"]
+    assert result["rowTotalCostUsd"].tolist() == [51.0, 80.0]
+    assert result["category"].tolist() == ["material", None]
@@ -0,0 +1,209 @@
+import pytest
+import json
+import os
+import signal
+import time
+import pickle
+import threading
+import http.client
+import urllib.error
+import urllib.request
+from evaluators.evaluator_pipeline import EvaluationPipeline
+from evaluators.scoring_service import ScoringError, ScoringServer, ScoringService, score_payload
+from evaluators.mae_evaluator import MAE
+from observers.evaluation_notifier import EvaluationNotifier
+
+GROUND_TRUTH = {"rows": [{"sectionName": "Plumbing", "qty": 1, "rateUsd": 500, "rowTotalCostUsd": 500,
+                          "label": "Pipe", "uom": "EA", "category": "material"}]}
+
+
+def model_output(total, valid_file_name="example_01"):
+    """Builds a model output payload with one prediction of `total`."""
+    rows = [{"sectionName": "Plumbing", "qty": 1, "rateUsd": total, "rowTotalCostUsd": total,
+             "label": "Pipe", "uom": "EA", "category": "material"}]
+    return {"estimate_preds": [{"valid_file_name": valid_file_name, "rows": rows, "time_to_estimate_sec": 1.5}]}
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Fixture to create a configuration over one ground truth example."""
+    (tmp_path / "ground_truth").mkdir()
+    (tmp_path / "ground_truth" / "example_01.json").write_text(json.dumps(GROUND_TRUTH), encoding="utf-8")
+    return {"ground_truth_dir": str(tmp_path / "ground_truth"), "model_outputs_dir": str(tmp_path)}
+
+
+@pytest.fixture
+def pipeline(config):
+    """Fixture to create a pipeline scoring MAE."""
+    return EvaluationPipeline(config, {"MAE": MAE()}, notifier=EvaluationNotifier())
+
+
+def test_score_payload(pipeline):
+    """Test that a payload is scored globally, per section and for latency."""
+    response = score_payload(pipeline, json.dumps(model_output(400)), "model-a")
+
+    assert response["model_file"] == "model-a"
+    assert [(row["metric"], row["score"]) for row in response["global"]] == [("MAE", 100.0)]
+    assert [(row["sectionName"], row["score"]) for row in response["by_section"]] == [("Plumbing", 100.0)]
+    assert response["latency"][0]["mean_sec"] == 1.5
+    assert "line_items" not in response, "Line items should only be returned when configured."
+
+
+@pytest.mark.parametrize("payload, status", [
+    (b"{not json", 400),
+    (b"[]", 400),
+    ({"estimate_preds": [{"valid_file_name": "example_01"}]}, 400),
+    (model_output(400, "unknown_example"), 422),
+])
+def test_score_payload_errors(pipeline, payload, status):
+    """Test that invalid payloads and payloads without ground truth are rejected with their status."""
+    with pytest.raises(ScoringError) as error:
+        score_payload(pipeline, payload)
+    assert error.value.status == status
+
+
+def test_score_payload_validation(config):
+    """Test that dropped predictions are reported, and rejected payloads carry the validation report."""
+    payload = model_output(400)
+    payload["estimate_preds"].append({**payload["estimate_preds"][0], "time_to_estimate_sec": "slow"})
+    response = score_payload(EvaluationPipeline(config, {"MAE": MAE()}, notifier=EvaluationNotifier()), payload)
+    assert response["global"][0]["score"] == 100.0
+    assert response["validation"]["invalid_predictions"] == 1
+
+    config["validation"] = {"mode": "strict"}
+    with pytest.raises(ScoringError) as error:
+        score_payload(EvaluationPipeline(config, {"MAE": MAE()}, notifier=EvaluationNotifier()), payload)
+    assert error.value.status == 400
+    assert error.value.details["validation"]["errors"][0]["column"] == "time_to_estimate_sec"
+
+
+def test_scoring_error_keeps_status_when_pickled():
+    """Test that errors sent back by worker processes keep their status and details."""
+    error = pickle.loads(pickle.dumps(ScoringError("Nothing to score.", 422, {"validation": {}})))
+    assert (str(error), error.status, error.details) == ("Nothing to score.", 422, {"validation": {}})
+
+
+def test_service_scores_requests_in_batches(pipeline):
+    """Test that queued requests are scored in batches of at most max_batch_size."""
+    service = ScoringService(pipeline, max_batch_size=4, max_batch_wait_ms=0)
+    futures = [service.submit(model_output(500 + index), f"model-{index}") for index in range(10)]
+    with service:
+        scores = [future.result(timeout=10)["global"][0]["score"] for future in futures]
+
+    assert scores == [float(index) for index in range(10)]
+    metrics = service.metrics()
+    assert metrics["requests_total"] == 10
+    assert metrics["batches_total"] == 3, "Ten queued requests should be scored as batches of 4, 4 and 2."
+    assert metrics["latency_p50_ms"] > 0
+
+
+def test_service_rejects_requests_when_queue_is_full(pipeline):
+    """Test that requests beyond max_queue_size are rejected with 503."""
+    service = ScoringService(pipeline, max_queue_size=1)
+    service.submit(model_output(400))
+
+    with pytest.raises(ScoringError) as error:
+        service.submit(model_output(400))
+    assert error.value.status == 503
+    assert service.metrics()["requests_rejected"] == 1
+
+
+def test_service_with_worker_pool(config, pipeline):
+    """Test that batches split across worker processes return every response, in order."""
+    service = ScoringService(pipeline, workers=2, max_batch_size=4, max_batch_wait_ms=0)
+    futures = [service.submit(json.dumps(model_output(500 + index))) for index in range(4)]
+    futures.append(service.submit(b"{not json"))
+    with service:
+        scores = [future.result(timeout=30)["global"][0]["score"] for future in futures[:4]]
+        with pytest.raises(ScoringError):
+            futures[4].result(timeout=30)
+
+    assert scores == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_service_replaces_broken_worker_pool(pipeline):
+    """Test that a dead worker fails its batch, then the pool is replaced and the service recovers."""
+    with ScoringService(pipeline, workers=2, max_batch_wait_ms=0) as service:
+        assert service.score(model_output(500), timeout=30)["global"][0]["score"] == 0.0
+        os.kill(service._executor.submit(os.getpid).result(timeout=30), signal.SIGKILL)
+
+        with pytest.raises(ScoringError) as error:
+            service.score(model_output(500), timeout=30)
+        assert error.value.status == 500
+
+        deadline = time.monotonic() + 30
+        while service.health()["status"] != "ok" and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert service.health()["status"] == "ok", "The service should recover once the new pool is ready."
+        assert service.score(model_output(450), timeout=30)["global"][0]["score"] == 50.0
+
+
+def test_health_reports_pool_not_ready(pipeline):
+    """Test that the service reports itself unavailable while its worker pool is not ready."""
+    with ScoringService(pipeline) as service:
+        assert service.health()["status"] == "ok"
+        service._pool_ready = False
+        assert service.health()["status"] == "unavailable"
+
+
+@pytest.fixture
+def server(pipeline):
+    """Fixture to run the scoring service over HTTP on a free local port."""
+    with ScoringService(pipeline) as service:
+        server = ScoringServer(service, "127.0.0.1", 0, max_body_mb=0.001)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+
+def request(url, body=None):
+    """Sends a GET (or a POST when `body` is given) and returns (status, JSON body)."""
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=body)) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as error:
+        return error.code, json.load(error)
+
+
+def test_http_endpoints(server):
+    """Test the /score, /health and /metrics endpoints."""
+    status, health = request(f"{server}/health")
+    assert (status, health["status"], health["ground_truth_examples"]) == (200, "ok", 1)
+
+    status, response = request(f"{server}/score?model_file=model-a", json.dumps(model_output(450)).encode())
+    assert status == 200
+    assert (response["model_file"], response["global"][0]["score"]) == ("model-a", 50.0)
+
+    status, response = request(f"{server}/score", json.dumps(model_output(450, "unknown_example")).encode())
+    assert status == 422 and "error" in response
+
+    payload = model_output(450)
+    payload["estimate_preds"][0]["rows"][0]["rowTotalCostUsd"] = None
+    status, response = request(f"{server}/score", json.dumps(payload).encode())
+    assert status == 400 and response["validation"]["errors"][0]["check"] == "null"
+
+    status, metrics = request(f"{server}/metrics")
+    assert (status, metrics["requests_total"], metrics["requests_failed"]) == (200, 3, 2)
+
+
+def test_http_rejects_unknown_endpoints_and_large_payloads(server):
+    """Test that unknown endpoints answer 404 and payloads over max_body_mb answer 413."""
+    assert request(f"{server}/unknown")[0] == 404
+    assert request(f"{server}/score", b" " * 2048)[0] == 413
+
+
+@pytest.mark.parametrize("content_length, status", [("-1", 400), ("ten", 400), (None, 411)])
+def test_http_rejects_invalid_content_length(server, content_length, status):
+    """Test that a negative, non-numeric or missing Content-Length is answered without reading the body."""
+    connection = http.client.HTTPConnection(server.removeprefix("http://"), timeout=10)
+    connection.putrequest("POST", "/score")
+    if content_length is not None:
+        connection.putheader("Content-Length", content_length)
+    connection.endheaders()
+    response = connection.getresponse()
+
+    assert response.status == status
+    assert "Content-Length" in json.load(response)["error"]
+    connection.close()
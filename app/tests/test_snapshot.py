@@ -0,0 +1,79 @@
+import pytest
+import os
+import json
+import numpy as np
+from utils.load import load_ground_truth_store
+from adapters.row_store import RowStore
+from utils.snapshot import directory_fingerprint, load_snapshot, save_snapshot, snapshot_path
+
+GROUND_TRUTHS = {
+    "example_01": {"totalCostUsd": 1000, "rows": [
+        {"sectionName": "Plumbing", "qty": 10, "rateUsd": 50, "rowTotalCostUsd": 500, "label": "Pipe", "uom": "EA", "category": "material"},
+        {"sectionName": "Electrical", "qty": 5, "rateUsd": 100, "rowTotalCostUsd": 500, "label": "Wiring", "uom": "LF", "category": "labor"}
+    ]},
+    "example_02": {"rows": [
+        {"sectionName": "Plumbing", "qty": 2, "rateUsd": 100, "rowTotalCostUsd": 200, "label": "Toilet", "uom": "EA", "category": "material"}
+    ]}
+}
+
+
+@pytest.fixture
+def ground_truth_dir(tmp_path):
+    """Fixture to create a ground truth directory."""
+    gt_dir = tmp_path / "ground_truth"
+    gt_dir.mkdir()
+    for name, data in GROUND_TRUTHS.items():
+        (gt_dir / f"{name}.json").write_text(json.dumps(data), encoding="utf-8")
+    return str(gt_dir)
+
+
+def test_snapshot_round_trip(ground_truth_dir, tmp_path):
+    """Test that the snapshot reproduces the parsed ground truth with memory-mapped arrays."""
+    snapshot_dir = str(tmp_path / "snapshot")
+    store, totals = load_ground_truth_store(ground_truth_dir, snapshot_dir)
+    fingerprint = directory_fingerprint(ground_truth_dir)
+    assert os.path.exists(os.path.join(snapshot_path(snapshot_dir, fingerprint), "meta.json")), \
+        "Snapshot should be written."
+
+    snapshot = load_snapshot(snapshot_dir, directory_fingerprint(ground_truth_dir))
+    assert snapshot is not None, "Snapshot should be valid for an unchanged directory."
+    snapshot_store, snapshot_totals = snapshot
+
+    assert isinstance(snapshot_store.numeric["rowTotalCostUsd"], np.memmap)
+    assert snapshot_store.names == store.names == ["example_01", "example_02"]
+    assert snapshot_totals == totals == {"example_01": 1000, "example_02": 200.0}
+    assert snapshot_store.column("label").tolist() == ["Pipe", "Wiring", "Toilet"]
+    assert snapshot_store.section_totals().equals(store.section_totals())
+
+
+def test_snapshot_invalidated_on_change(ground_truth_dir, tmp_path):
+    """Test that a modified ground truth directory invalidates and rebuilds the snapshot."""
+    snapshot_dir = str(tmp_path / "snapshot")
+    load_ground_truth_store(ground_truth_dir, snapshot_dir)
+
+    with open(os.path.join(ground_truth_dir, "example_03.json"), "w", encoding="utf-8") as file:
+        json.dump({"rows": [{"sectionName": "Roofing", "rowTotalCostUsd": 50}]}, file)
+
+    assert load_snapshot(snapshot_dir, directory_fingerprint(ground_truth_dir)) is None
+    store, totals = load_ground_truth_store(ground_truth_dir, snapshot_dir)
+    assert store.names == ["example_01", "example_02", "example_03"]
+    assert load_snapshot(snapshot_dir, directory_fingerprint(ground_truth_dir)) is not None
+
+
+def test_resave_keeps_loaded_store_intact(tmp_path):
+    """Test that re-saving a snapshot never modifies the arrays mapped by a store loaded earlier."""
+    snapshot_dir = str(tmp_path / "snapshot")
+    old_store = RowStore.from_rows([{"sectionName": "Plumbing", "rowTotalCostUsd": 1.0}] * 3, name="g1")
+    save_snapshot(snapshot_dir, old_store, {"g1": 3.0}, "a" * 64)
+    loaded, _ = load_snapshot(snapshot_dir, "a" * 64)
+
+    new_store = RowStore.from_rows([{"sectionName": "Roofing", "rowTotalCostUsd": 99.0}], name="g2")
+    save_snapshot(snapshot_dir, new_store, {"g2": 99.0}, "b" * 64)
+
+    assert loaded.numeric["rowTotalCostUsd"].tolist() == [1.0, 1.0, 1.0]
+    assert loaded.column("sectionName").tolist() == ["Plumbing"] * 3
+    assert loaded.names == ["g1"]
+    assert load_snapshot(snapshot_dir, "a" * 64) is None, "Snapshots of other fingerprints should be removed."
+    reloaded, totals = load_snapshot(snapshot_dir, "b" * 64)
+    assert (reloaded.names, totals) == (["g2"], {"g2": 99.0})
+    assert sorted(os.listdir(snapshot_dir)) == ["b" * 64], "No temporary directory should be left behind."
@@ -0,0 +1,106 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+from reports.report_generator import ReportGenerator
+from reports.sqlite_report import SQLiteReport, database_location, read_run
+
+@pytest.fixture
+def sample_results():
+    """Fixture to create sample global evaluation results."""
+    return pd.DataFrame([
+        {"model_file": "2.json", "metric": "MAE", "score": 10.5},
+        {"model_file": "2.json", "metric": "MAPE", "score": np.nan},
+        {"model_file": "4.json", "metric": "MAE", "score": 8.2}
+    ])
+
+def test_database_location():
+    """Test that the pipeline reports share one database, one table per report kind."""
+    assert database_location("reports/eval_global.sqlite") == ("reports/eval.sqlite", "global")
+    assert database_location("reports/eval_by_section.sqlite") == ("reports/eval.sqlite", "by_section")
+    assert database_location("reports/eval_line_items.sqlite") == ("reports/eval.sqlite", "line_items")
+    assert database_location("reports/eval.sqlite") == ("reports/eval.sqlite", "results"), \
+        "Other paths should use the default table of the file itself."
+
+def test_sqlite_report_generation(sample_results, tmp_path):
+    """Test that SQLiteReport inserts the results, tagged with the run timestamp."""
+    output_file = tmp_path / "report_global.sqlite"
+    SQLiteReport("2025-01-01T00:00:00").generate_report(sample_results, str(output_file))
+
+    database = tmp_path / "report.sqlite"
+    assert database.exists(), "The database should be created next to the report path."
+    with sqlite3.connect(database) as connection:
+        rows = connection.execute("SELECT run_timestamp, model_file, metric, score FROM global").fetchall()
+        runs = connection.execute("SELECT run_timestamp FROM runs").fetchall()
+    assert rows == [("2025-01-01T00:00:00", "2.json", "MAE", 10.5),
+                    ("2025-01-01T00:00:00", "2.json", "MAPE", None),
+                    ("2025-01-01T00:00:00", "4.json", "MAE", 8.2)], "NaN should be stored as NULL."
+    assert runs == [("2025-01-01T00:00:00",)], "The run should be recorded."
+
+def test_sqlite_report_indexes_key_columns(sample_results, tmp_path):
+    """Test that the table is indexed on the run timestamp and the key columns it has."""
+    output_file = tmp_path / "report_global.sqlite"
+    SQLiteReport().generate_report(sample_results, str(output_file))
+
+    with sqlite3.connect(tmp_path / "report.sqlite") as connection:
+        indexes = connection.execute("PRAGMA index_list(global)").fetchall()
+        columns = [row[2] for row in connection.execute(f"PRAGMA index_info('{indexes[0][1]}')")]
+    assert columns == ["run_timestamp", "metric", "model_file"], "Index should lead with run and metric."
+
+def test_sqlite_report_appends_runs(sample_results, tmp_path):
+    """Test that each run is appended and read_run returns the latest one, or the requested one."""
+    output_file = str(tmp_path / "report_global.sqlite")
+    SQLiteReport("2025-01-01T00:00:00").generate_report(sample_results, output_file)
+    second_run = sample_results.assign(score=sample_results["score"] + 1)
+    SQLiteReport("2025-01-02T00:00:00").generate_report(second_run, output_file)
+
+    latest = read_run(output_file)
+    assert list(latest.columns) == ["model_file", "metric", "score"], "Run timestamp should be dropped."
+    assert latest["score"].tolist()[::2] == [11.5, 9.2], "The latest run should be read by default."
+    assert np.isnan(latest["score"][1]), "NULL should be read back as NaN."
+
+    first = read_run(output_file, run_timestamp="2025-01-01T00:00:00", metric="MAE")
+    assert first["score"].tolist() == [10.5, 8.2], "The requested run and metric should be read."
+
+def test_sqlite_report_adds_new_columns(sample_results, tmp_path):
+    """Test that columns seen for the first time are added to an existing table."""
+    output_file = str(tmp_path / "report_global.sqlite")
+    SQLiteReport("2025-01-01T00:00:00").generate_report(sample_results, output_file)
+    SQLiteReport("2025-01-02T00:00:00").generate_report(sample_results.assign(n_examples=3), output_file)
+
+    assert read_run(output_file)["n_examples"].tolist() == [3, 3, 3], "The new column should be stored."
+    assert read_run(output_file, "2025-01-01T00:00:00")["n_examples"].isna().all(), \
+        "Earlier runs should have NULL in the new column."
+
+def test_read_run_missing_table(sample_results, tmp_path):
+    """Test that reading a report kind that was never written returns an empty DataFrame."""
+    SQLiteReport().generate_report(sample_results, str(tmp_path / "report_global.sqlite"))
+
+    assert read_run(str(tmp_path / "report_latency.sqlite")).empty
+
+def test_sqlite_report_generation_with_report_generator(sample_results, tmp_path):
+    """Test that ReportGenerator appends SQLite reports in place, even when atomic."""
+    output_file = tmp_path / "report_by_section.sqlite"
+    ReportGenerator(format="sqlite").generate(sample_results, str(output_file), atomic=True)
+    ReportGenerator(format="sqlite").generate(sample_results, str(output_file), atomic=True)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["report.sqlite"], \
+        "No temporary file should be left and the database should not be replaced."
+    with sqlite3.connect(tmp_path / "report.sqlite") as connection:
+        assert connection.execute("SELECT COUNT(DISTINCT run_timestamp) FROM by_section").fetchone() == (2,)
+
+def test_sqlite_report_replaces_rows_of_its_run(sample_results, tmp_path):
+    """Test that replace_results only replaces the given model files within the report's run."""
+    output_file = str(tmp_path / "report_by_section.sqlite")
+    SQLiteReport("2025-01-01T00:00:00").generate_report(sample_results, output_file)
+    report = SQLiteReport("2025-01-02T00:00:00")
+    report.replace_results(sample_results, output_file)
+    report.replace_results(pd.DataFrame([{"model_file": "2.json", "metric": "MAE", "score": 1.0}]), output_file,
+                           ["2.json"])
+
+    assert read_run(output_file)[["model_file", "score"]].values.tolist() == [["4.json", 8.2], ["2.json", 1.0]]
+    assert len(read_run(output_file, "2025-01-01T00:00:00")) == 3, "Other runs should be kept."
+
+    report.replace_results(sample_results.iloc[0:0], output_file)
+    assert read_run(output_file, "2025-01-02T00:00:00").empty
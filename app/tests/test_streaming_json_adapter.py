@@ -0,0 +1,115 @@
+import pytest
+import json
+import pandas as pd
+from adapters.json_adapter import JSONAdapter
+from adapters.streaming_json_adapter import StreamingJSONAdapter
+
+MODEL_OUTPUT_DATA = {
+    "model": "test-model",
+    "estimate_preds": [
+        {
+            "valid_file_name": "example_01",
+            "rows": [
+                {"sectionName": "Plumbing", "qty": 10, "rateUsd": 50.25, "rowTotalCostUsd": 502.5, "label": "Pipe \"1/2\"", "uom": "EA", "category": "material", "metadata": None},
+                {"sectionName": "Electrical", "qty": 5, "rateUsd": 100, "rowTotalCostUsd": 500, "label": "Wiring", "uom": "LF", "category": "labor", "metadata": {"note": "[x]"}}
+            ],
+            "time_to_estimate_sec": 12345.678
+        },
+        {"valid_file_name": "example_02", "rows": []},
+        {
+            "valid_file_name": "example_01",
+            "rows": [{"sectionName": "Plumbing", "qty": 1, "rateUsd": 7, "rowTotalCostUsd": 7, "label": "Valve", "uom": "EA", "category": "material"}],
+            "time_to_estimate_sec": 3
+        }
+    ],
+    "trailer": [1, 2, 3]
+}
+
+
+@pytest.fixture
+def model_output_file(tmp_path):
+    """Fixture to create a pretty-printed model output file."""
+    file_path = tmp_path / "model.json"
+    file_path.write_text(json.dumps(MODEL_OUTPUT_DATA, indent=4), encoding="utf-8")
+    return str(file_path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_streaming_matches_json_adapter(model_output_file, chunk_size):
+    """Test that the streamed store matches JSONAdapter.to_model_output_store for any chunk size."""
+    expected_adapter = JSONAdapter(model_output_file)
+    expected = expected_adapter.to_model_output_store()
+    adapter = StreamingJSONAdapter(model_output_file, chunk_size=chunk_size)
+    streamed = adapter.to_model_output_store()
+
+    assert streamed.names == expected.names == ["example_01", "example_01"], \
+        "The prediction with missing keys should be dropped."
+    assert streamed.times.tolist() == expected.times.tolist()
+    assert streamed.offsets.tolist() == expected.offsets.tolist()
+    pd.testing.assert_frame_equal(streamed.to_dataframe(), expected.to_dataframe())
+    assert adapter.validation_report.to_dict() == expected_adapter.validation_report.to_dict()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 13])
+@pytest.mark.parametrize("padding", range(12))
+def test_numbers_split_across_chunks(tmp_path, chunk_size, padding):
+    """Test that numbers cut by a chunk boundary anywhere (e.g. after '.' or 'e') are read whole."""
+    file_path = tmp_path / "model.json"
+    file_path.write_text('{"%s": 1234.5678, "n": -1.5e-3, "estimate_preds": [{"valid_file_name": "example_01", '
+                         '"rows": [{"sectionName": "Plumbing", "rowTotalCostUsd": 1.25E+2}], '
+                         '"time_to_estimate_sec": 12345.678}]}' % ("x" * padding), encoding="utf-8")
+
+    predictions = list(StreamingJSONAdapter(str(file_path), chunk_size=chunk_size).iter_array("estimate_preds"))
+    assert predictions == JSONAdapter(str(file_path)).data["estimate_preds"]
+
+
+def test_streaming_is_lazy(model_output_file):
+    """Test that predictions are yielded one at a time."""
+    predictions = StreamingJSONAdapter(model_output_file).iter_array("estimate_preds")
+    first = next(predictions)
+    assert first["valid_file_name"] == "example_01"
+
+
+def test_streaming_to_dataframe(tmp_path):
+    """Test that a ground truth file can be read incrementally into a DataFrame."""
+    file_path = tmp_path / "gt.json"
+    file_path.write_text(json.dumps({"test_n": 1, "rows": MODEL_OUTPUT_DATA["estimate_preds"][0]["rows"]}), encoding="utf-8")
+
+    df = StreamingJSONAdapter(str(file_path), chunk_size=5).to_dataframe()
+    pd.testing.assert_frame_equal(df, JSONAdapter(str(file_path)).to_dataframe())
+
+
+def test_streaming_missing_key(tmp_path):
+    """Test that a ValueError is raised when 'estimate_preds' is missing."""
+    file_path = tmp_path / "not_model.json"
+    file_path.write_text(json.dumps({"rows": []}), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="estimate_preds"):
+        StreamingJSONAdapter(str(file_path)).to_model_output_store()
+
+
+def test_streaming_malformed_json(tmp_path):
+    """Test that truncated JSON raises a JSONDecodeError."""
+    file_path = tmp_path / "truncated.json"
+    file_path.write_text(json.dumps(MODEL_OUTPUT_DATA)[:150], encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        StreamingJSONAdapter(str(file_path), chunk_size=16).to_model_output_store()
+
+
+def test_streaming_missing_file():
+    """Test that StreamingJSONAdapter raises FileNotFoundError when the file does not exist."""
+    with pytest.raises(FileNotFoundError):
+        StreamingJSONAdapter("tests/data/non_existent.json")
+
+
+def test_streaming_model_output_store(model_output_file):
+    """Test that the streamed RowStore matches JSONAdapter.to_model_output_store."""
+    expected = JSONAdapter(model_output_file).to_model_output_store()
+    store = StreamingJSONAdapter(model_output_file, chunk_size=7).to_model_output_store()
+
+    assert store.names == expected.names == ["example_01", "example_01"]
+    assert store.offsets.tolist() == expected.offsets.tolist() == [0, 2, 3]
+    assert store.times.tolist() == [12345.678, 3.0]
+    assert store.column("label").tolist() == ['Pipe "1/2"', "Wiring", "Valve"]
+    assert store.numeric["rowTotalCostUsd"].tolist() == [502.5, 500.0, 7.0]
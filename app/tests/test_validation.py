@@ -0,0 +1,152 @@
+import pytest
+import json
+import pickle
+import numpy as np
+from adapters.json_adapter import JSONAdapter
+from adapters.streaming_json_adapter import StreamingJSONAdapter
+from adapters.validation import SchemaValidationError, build_model_output_store
+
+
+def row(total=100.0, section="Plumbing", **overrides):
+    """Builds a valid row with the given total, overriding any column."""
+    values = {"sectionName": section, "qty": 1, "rateUsd": total, "rowTotalCostUsd": total,
+              "label": "Pipe", "uom": "EA", "category": "material"}
+    values.update(overrides)
+    return values
+
+
+def prediction(rows, valid_file_name="example_01", time=1.5):
+    """Builds a prediction holding the given rows."""
+    return {"valid_file_name": valid_file_name, "rows": rows, "time_to_estimate_sec": time}
+
+
+def errors(report):
+    """Returns the (check, column, count, examples) of each problem of a report."""
+    return sorted((error["check"], error["column"] or "", error["count"], error["examples"])
+                  for error in report.to_dict()["errors"])
+
+
+def test_valid_predictions():
+    """Test that valid predictions pass and build the same store as without validation."""
+    predictions = [prediction([row(100), row(50, "Electrical", qty=None, uom=None)]),
+                   prediction([], "example_02", time=3)]
+    store, report = build_model_output_store(predictions, "model.json")
+
+    assert report.valid and report.to_dict()["errors"] == []
+    assert (report.n_predictions, report.n_rows) == (2, 2)
+    assert store.names == ["example_01", "example_02"]
+    assert store.offsets.tolist() == [0, 2, 2]
+    assert store.numeric["rowTotalCostUsd"].tolist() == [100.0, 50.0]
+    assert np.isnan(store.numeric["qty"][1]), "Optional numeric columns may be null."
+
+
+def test_row_problems_are_found_across_the_file():
+    """Test that null, mistyped and non-finite values are reported per column with their predictions."""
+    predictions = [
+        prediction([row(100), row(None)]),
+        prediction([row(100, rateUsd="12.5")]),
+        prediction([row(float("nan")), row(100, section=7)]),
+        prediction([row(100, qty=True)]),
+        prediction([row(100)]),
+    ]
+    _, report = build_model_output_store(predictions, "model.json")
+
+    assert errors(report) == [
+        ("non_finite", "rowTotalCostUsd", 1, [2]),
+        ("null", "rowTotalCostUsd", 1, [0]),
+        ("type", "qty", 1, [3]),
+        ("type", "rateUsd", 1, [1]),
+        ("type", "sectionName", 1, [2]),
+    ]
+    assert report.invalid_predictions == {0, 1, 2, 3}
+    assert "found str" in report.problems[("type", "rateUsd")]["message"]
+
+
+def test_prediction_problems():
+    """Test that malformed predictions are reported without reading their rows."""
+    predictions = [
+        "not a prediction",
+        {"valid_file_name": "example_01", "rows": []},
+        prediction({"sectionName": "Plumbing"}),
+        prediction([row(100), ["a", "list"], 3]),
+        prediction([row(100)], valid_file_name=None, time="fast"),
+        prediction([row(100)]),
+    ]
+    _, report = build_model_output_store(predictions, "model.json")
+
+    assert errors(report) == [
+        ("missing_key", "time_to_estimate_sec", 1, [1]),
+        ("not_an_object", "", 1, [0]),
+        ("not_an_object", "rows", 2, [3]),
+        ("null", "valid_file_name", 1, [4]),
+        ("type", "rows", 1, [2]),
+        ("type", "time_to_estimate_sec", 1, [4]),
+    ]
+    assert (report.n_predictions, report.n_rows) == (6, 2)
+
+
+def test_lenient_mode_drops_invalid_predictions():
+    """Test that lenient validation keeps only the valid predictions, in order."""
+    predictions = [prediction([row(100)], "example_01"), prediction([row("abc")], "example_02"),
+                   prediction([row(300), row(5)], "example_03", time=None), prediction([row(400)], "example_04")]
+    store, report = build_model_output_store(predictions, "model.json", mode="lenient")
+
+    assert store.names == ["example_01", "example_04"]
+    assert store.numeric["rowTotalCostUsd"].tolist() == [100.0, 400.0]
+    assert store.times.tolist() == [1.5, 1.5]
+    assert report.to_dict()["invalid_predictions"] == 2
+    assert "2 of 4 predictions" in report.summary()
+
+
+def test_lenient_mode_rejects_files_without_valid_predictions():
+    """Test that a file is rejected when lenient validation leaves no prediction."""
+    with pytest.raises(SchemaValidationError, match="1 of 1 predictions"):
+        build_model_output_store([prediction([row("abc")])], "model.json")
+
+
+def test_strict_mode_rejects_files_with_any_problem():
+    """Test that strict validation rejects the file and carries the report."""
+    predictions = [prediction([row(100)]), prediction([row(100, sectionName=None)])]
+    with pytest.raises(SchemaValidationError) as error:
+        build_model_output_store(predictions, "model.json", mode="strict")
+
+    report = error.value.report.to_dict()
+    assert (report["file"], report["mode"], report["valid"]) == ("model.json", "strict", False)
+    assert [(e["check"], e["column"], e["examples"]) for e in report["errors"]] == [("null", "sectionName", [1])]
+    assert isinstance(error.value, ValueError), "Rejected files should be handled like other invalid files."
+
+
+def test_error_keeps_report_when_pickled():
+    """Test that errors raised in worker processes keep their report."""
+    with pytest.raises(SchemaValidationError) as error:
+        build_model_output_store([prediction([row(None)])], "model.json")
+    restored = pickle.loads(pickle.dumps(error.value))
+    assert restored.report.to_dict() == error.value.report.to_dict()
+    assert str(restored) == str(error.value)
+
+
+def test_report_is_json_serializable():
+    """Test that the report can be written as JSON, with a bounded number of examples."""
+    predictions = [prediction([row(None)]) for _ in range(8)] + [prediction([row(100)])]
+    _, report = build_model_output_store(predictions, "model.json")
+
+    error = json.loads(json.dumps(report.to_dict()))["errors"][0]
+    assert (error["count"], error["predictions"], error["examples"]) == (8, 8, [0, 1, 2, 3, 4])
+    assert "..." in report.summary()
+
+
+@pytest.mark.parametrize("mode, expected", [("lenient", ["example_01"]), ("strict", None)])
+def test_adapters_validate_model_outputs(tmp_path, mode, expected):
+    """Test that the JSON adapters validate model outputs and keep the report."""
+    path = tmp_path / "model.json"
+    path.write_text(json.dumps({"estimate_preds": [prediction([row(100)]), prediction([row("1,000")])]}),
+                    encoding="utf-8")
+    for adapter in (JSONAdapter(str(path)), StreamingJSONAdapter(str(path), chunk_size=16)):
+        if expected is None:
+            with pytest.raises(SchemaValidationError) as error:
+                adapter.to_model_output_store(mode)
+            report = error.value.report
+        else:
+            assert adapter.to_model_output_store(mode).names == expected
+            report = adapter.validation_report
+        assert report.invalid_predictions == {1}
@@ -0,0 +1,50 @@
+import pytest
+import os
+from utils.watch import DirectoryPoller, directory_snapshot
+
+
+class FakeClock:
+    """Clock advanced manually by the tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_directory_snapshot_skips_temporary_files(tmp_path):
+    """Test that hidden, temporary and unsupported files are not listed."""
+    for name in ("a.json", ".hidden.json", "b.123.tmp.json", "notes.txt"):
+        (tmp_path / name).write_text("{}", encoding="utf-8")
+    assert list(directory_snapshot(str(tmp_path), (".json",))) == ["a.json"]
+    assert directory_snapshot(str(tmp_path / "missing")) == {}
+
+
+def test_poller_debounces_new_and_changed_files(tmp_path, clock):
+    """Test that files are reported once they stay unchanged for the debounce time."""
+    poller = DirectoryPoller(str(tmp_path), (".json",), debounce_sec=2.0, clock=clock)
+    (tmp_path / "old.json").write_text("{}", encoding="utf-8")
+    poller.prime()
+
+    (tmp_path / "new.json").write_text("{", encoding="utf-8")
+    assert poller.poll() == ([], []), "A new file should wait for the debounce time."
+    clock.now = 1.0
+    (tmp_path / "new.json").write_text("{}", encoding="utf-8")
+    assert poller.poll() == ([], []), "A file still being written restarts the debounce."
+    clock.now = 3.0
+    assert poller.poll() == (["new.json"], [])
+    assert poller.poll() == ([], []), "A reported file should not be reported again."
+
+    (tmp_path / "old.json").write_text('{"rows": []}', encoding="utf-8")
+    os.remove(tmp_path / "new.json")
+    clock.now = 4.0
+    assert poller.poll() == ([], ["new.json"])
+    clock.now = 6.0
+    assert poller.poll() == (["old.json"], [])
+    assert poller.files == ["old.json"]
@@ -0,0 +1,159 @@
+import numpy as np
+from adapters.row_store import RowStore
+from utils.eval import segment_section_totals
+from utils.config import BOOTSTRAP_UNITS, bootstrap_settings
+
+# Number of count matrix cells drawn, or converted to float64, at a time.
+BLOCK_CELLS = 1 << 20
+
+
+def resample_counts(n_units: int, n_samples: int, seed: int = 0) -> np.ndarray:
+    """
+    Draws bootstrap resamples of `n_units` units as a count matrix.
+
+    Row b holds how many times each unit was drawn in resample b, so a resampled sum
+    of per-unit values is a matrix product (see `bootstrap_scores`). The resamples are
+    drawn in blocks of rows and stored in the smallest unsigned integer type holding
+    their counts (in practice uint8), so the matrix takes B * n_units bytes instead of
+    the 24 bytes per cell of the int64 draws, bincount keys and float64 counts.
+
+    Args:
+        n_units (int): Number of units to resample.
+        n_samples (int): Number of bootstrap resamples (B).
+        seed (int): Seed of the random generator. The same seed gives the same matrix
+            in every process, which pairs the resamples of different models.
+
+    Returns:
+        np.ndarray: Unsigned integer matrix of shape (n_samples, n_units).
+    """
+    rng = np.random.default_rng(seed)
+    block_rows = max(1, BLOCK_CELLS // n_units)
+    blocks = []
+    for start in range(0, n_samples, block_rows):
+        rows = min(block_rows, n_samples - start)
+        # Consecutive draws continue the same stream, so the matrix does not depend on the block size.
+        indices = rng.integers(0, n_units, size=(rows, n_units))
+        keys = (np.arange(rows)[:, None] * n_units + indices).ravel()
+        block = np.bincount(keys, minlength=rows * n_units).reshape(rows, n_units)
+        blocks.append(block.astype(np.min_scalar_type(block.max())))
+    return np.concatenate(blocks)
+
+
+def unit_section_totals(gt_store: RowStore, model_store: RowStore, unit_names: list = None):
+    """
+    Sums the section costs of each bootstrap unit.
+
+    With `unit_names`, the unit is the example: the runs of each example are summed
+    into the row of its name, and examples without predictions keep empty rows.
+    Without it, each (example, run) pair is a unit.
+
+    Args:
+        gt_store (RowStore): Ground truth rows, segment-aligned with `model_store`.
+        model_store (RowStore): Prediction rows, one segment per (example, run) pair.
+        unit_names (list, optional): Names of the examples, in the order of the units.
+
+    Returns:
+        tuple: (gt_units, model_units, mask_units), matrices of shape (n_units, n_sections);
+               the mask flags the sections used by each unit.
+    """
+    _, gt_matrix, model_matrix, mask = segment_section_totals(gt_store, model_store)
+    if unit_names is None:
+        return gt_matrix, model_matrix, mask.astype(np.float64)
+
+    unit_index = {name: index for index, name in enumerate(unit_names)}
+    rows = np.array([unit_index[name] for name in model_store.names], dtype=np.int64)
+    shape = (len(unit_names), gt_matrix.shape[1])
+    gt_units, model_units, mask_units = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+    np.add.at(gt_units, rows, gt_matrix)
+    np.add.at(model_units, rows, model_matrix)
+    np.add.at(mask_units, rows, mask)
+    return gt_units, model_units, mask_units
+
+
+def bootstrap_scores(evaluators: dict, counts: np.ndarray, gt_units: np.ndarray, model_units: np.ndarray,
+                     mask_units: np.ndarray) -> dict:
+    """
+    Computes the score of every bootstrap resample with batched reductions.
+
+    The section totals of all resamples are `counts @ units`, computed over blocks of
+    resamples so that only one block of counts is converted to float64 at a time. Each
+    evaluator then scores all resamples at once with `evaluate_grouped`, so there is no
+    Python-level call per resample.
+
+    Args:
+        evaluators (dict): Dictionary of evaluator instances.
+        counts (np.ndarray): Resample count matrix (B, n_units), see `resample_counts`.
+        gt_units (np.ndarray): Ground truth section totals per unit.
+        model_units (np.ndarray): Predicted section totals per unit.
+        mask_units (np.ndarray): Number of times each section is used per unit.
+
+    Returns:
+        dict: Maps each metric to an array with the B resampled scores.
+    """
+    n_samples, n_sections = len(counts), gt_units.shape[1]
+    gt_samples, model_samples = np.empty((n_samples, n_sections)), np.empty((n_samples, n_sections))
+    mask_samples = np.empty((n_samples, n_sections), dtype=bool)
+    block_rows = max(1, BLOCK_CELLS // max(1, counts.shape[1]))
+    for start in range(0, n_samples, block_rows):
+        block = counts[start:start + block_rows].astype(np.float64)
+        gt_samples[start:start + block_rows] = block @ gt_units
+        model_samples[start:start + block_rows] = block @ model_units
+        mask_samples[start:start + block_rows] = (block @ mask_units) > 0
+    return {metric_name: evaluator.evaluate_grouped(gt_samples, model_samples, mask_samples)
+            for metric_name, evaluator in evaluators.items()}
+
+
+def confidence_interval(samples: np.ndarray, confidence: float = 0.95) -> tuple:
+    """
+    Computes the percentile confidence interval of bootstrap samples, ignoring NaN.
+
+    Args:
+        samples (np.ndarray): Resampled scores.
+        confidence (float): Confidence level.
+
+    Returns:
+        tuple: (low, high), NaN when no sample is finite.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    if np.isnan(samples).all():
+        return np.nan, np.nan
+    alpha = 1.0 - confidence
+    low, high = np.nanquantile(samples, [alpha / 2, 1 - alpha / 2])
+    return float(low), float(high)
+
+
+def significance_matrix(samples: dict, confidence: float = 0.95) -> list:
+    """
+    Compares every pair of models on their bootstrap samples (lower scores are better).
+
+    `p_better` is the fraction of resamples where the model scores lower than the other
+    model. The model is significantly better when `p_better` exceeds 1 - alpha / 2, i.e.
+    when the two-sided confidence interval of the score difference lies below zero.
+    With example-level resampling the resamples of all models are paired.
+
+    Args:
+        samples (dict): Maps each model file to its resampled scores (all of length B).
+        confidence (float): Confidence level.
+
+    Returns:
+        list: One dict per ordered pair of distinct models, with 'model_file',
+              'other_model_file', 'p_better' and 'significantly_better'.
+    """
+    models = list(samples)
+    if not models:
+        return []
+    matrix = np.vstack([np.asarray(samples[model], dtype=np.float64) for model in models])
+    threshold = 1.0 - (1.0 - confidence) / 2
+    rows = []
+    for index, model in enumerate(models):
+        p_better = (matrix[index][None, :] < matrix).mean(axis=1)
+        for other_index, other in enumerate(models):
+            if other_index == index:
+                continue
+            rows.append({
+                "model_file": model,
+                "other_model_file": other,
+                "p_better": float(p_better[other_index]),
+                "significantly_better": bool(p_better[other_index] > threshold),
+            })
+    return rows
@@ -0,0 +1,189 @@
+import os
+import json
+import hashlib
+import logging
+import numpy as np
+
+# Bump when the layout of cached results changes, so stale entries are never reused.
+CACHE_FORMAT_VERSION = 5
+
+
+def hash_file(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Computes the SHA-256 of a file's content, reading it in chunks.
+
+    Args:
+        file_path (str): Path to the file.
+        chunk_size (int): Number of bytes read at a time.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_directory(directory: str, extensions=(".json",)) -> str:
+    """
+    Computes a single hash over the names and contents of the files of a directory.
+
+    Args:
+        directory (str): Directory to hash.
+        extensions (tuple): Only files with these extensions are considered.
+
+    Returns:
+        str: Hexadecimal digest, independent of listing order.
+    """
+    digest = hashlib.sha256()
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.lower().endswith(tuple(extensions)):
+            digest.update(file_name.encode("utf-8"))
+            digest.update(hash_file(os.path.join(directory, file_name)).encode("ascii"))
+    return digest.hexdigest()
+
+
+def hash_evaluators(evaluators: dict, settings: dict = None) -> str:
+    """
+    Computes a hash of the evaluator configuration: metric names, evaluator classes
+    and their parameters (e.g. `AsymmetricLoss.alpha`).
+
+    Args:
+        evaluators (dict): Dictionary of evaluator instances.
+        settings (dict, optional): Other settings changing the results (e.g. the
+            bootstrap settings).
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    description = {
+        name: [f"{type(evaluator).__module__}.{type(evaluator).__qualname__}", vars(evaluator)]
+        for name, evaluator in evaluators.items()
+    }
+    payload = json.dumps([description, settings], sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk cache of per-model-file evaluation results.
+
+    Entries are JSON files named after a key derived from the content hash of the model
+    file, the hash of the ground truth set and the evaluator configuration. The total
+    size of the cache is kept under a limit by evicting the least recently used entries.
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: float = 256):
+        """
+        Initializes the result cache.
+
+        Args:
+            cache_dir (str): Directory holding the cache entries.
+            max_size_mb (float): Maximum total size of the entries, in megabytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(model_hash: str, ground_truth_hash: str, evaluators_hash: str) -> str:
+        """
+        Combines the hashes identifying an evaluation into a cache key.
+
+        Args:
+            model_hash (str): Content hash of the model output file.
+            ground_truth_hash (str): Hash of the ground truth set.
+            evaluators_hash (str): Hash of the evaluator configuration.
+
+        Returns:
+            str: The cache key.
+        """
+        payload = f"{CACHE_FORMAT_VERSION}:{model_hash}:{ground_truth_hash}:{evaluators_hash}"
+        return hashlib.sha256(payload.encode("ascii")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str, model_file: str):
+        """
+        Returns the cached results for a key, if any.
+
+        Args:
+            key (str): Cache key.
+            model_file (str): Name of the model file, written into the returned results
+                              since identical content may be stored under another name.
+
+        Returns:
+            tuple: (global_results, section_results, latency_results, run_results,
+                   bootstrap_results, line_item_results), or None on a cache miss.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                entry = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        global_results = [dict(result, model_file=model_file) for result in entry["global_results"]]
+        section_results = [dict(result, model_file=model_file) for result in entry["section_results"]]
+        latency_results = [dict(result, model_file=model_file) for result in entry["latency_results"]]
+        run_results = [dict(result, model_file=model_file) for result in entry["run_results"]]
+        bootstrap_results = {metric: np.asarray(samples, dtype=np.float64)
+                             for metric, samples in entry["bootstrap_results"].items()}
+        line_item_results = [dict(result, model_file=model_file) for result in entry["line_item_results"]]
+        return global_results, section_results, latency_results, run_results, bootstrap_results, line_item_results
+
+    def put(self, key: str, global_results: list, section_results: list, latency_results: list,
+            run_results: list, bootstrap_results: dict, line_item_results: list):
+        """
+        Stores the results for a key and evicts old entries if the cache is too large.
+
+        Args:
+            key (str): Cache key.
+            global_results (list): Global results of the model file.
+            section_results (list): Section results of the model file.
+            latency_results (list): Latency results of the model file.
+            run_results (list): Per-(example, run) results of the model file.
+            bootstrap_results (dict): Bootstrap samples of each metric of the model file.
+            line_item_results (list): Line-item matching summaries of the model file.
+        """
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump({"global_results": global_results, "section_results": section_results,
+                           "latency_results": latency_results, "run_results": run_results,
+                           "bootstrap_results": {metric: np.asarray(samples).tolist()
+                                                 for metric, samples in bootstrap_results.items()},
+                           "line_item_results": line_item_results}, file)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write cache entry {path}: {e}")
+            return
+        self.evict()
+
+    def evict(self):
+        """Removes the least recently used entries until the cache fits its size limit."""
+        entries = []
+        total_size = 0
+        for file_name in os.listdir(self.cache_dir):
+            if not file_name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, file_name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
@@ -0,0 +1,192 @@
+import os
+import logging
+
+from utils.registry import EVALUATORS, REPORTS
+
+# This module only uses the standard library, so configuration checks do not import
+# numpy, pandas or the evaluation modules.
+
+DEFAULT_CONFIG_PATH = "config.yaml"
+BOOTSTRAP_UNITS = ("example", "run")
+DEFAULT_MIN_SIMILARITY = 0.3
+OVERFLOW_POLICIES = ("block", "drop")
+VALIDATION_MODES = ("lenient", "strict")
+
+
+def load_config(path: str) -> dict:
+    """
+    Loads the YAML configuration file.
+
+    Args:
+        path (str): Path to the configuration file.
+
+    Returns:
+        dict: The configuration, empty when the file does not exist.
+
+    Raises:
+        ValueError: If the file does not hold a YAML mapping.
+    """
+    if not os.path.exists(path):
+        logging.info("Configuration file not found. Using default values.")
+        return {}
+    import yaml  # Only needed when a configuration file is read.
+    with open(path, "r") as f:
+        config = yaml.safe_load(f)
+    if config is None:
+        config = {}
+    if not isinstance(config, dict):
+        raise ValueError(f"The configuration must be a mapping: {path}")
+    logging.info(f"Configuration loaded from: {path}")
+    return config
+
+
+def bootstrap_settings(config: dict):
+    """
+    Reads the bootstrap settings from the `bootstrap` section of the configuration.
+
+    Args:
+        config (dict): Configuration dictionary.
+
+    Returns:
+        dict: 'samples', 'confidence', 'unit' and 'seed', or None when the section is
+              missing or `samples` is 0 (bootstrap disabled).
+
+    Raises:
+        ValueError: If the unit or the confidence level is not supported.
+    """
+    bootstrap_config = config.get("bootstrap") or {}
+    samples = int(bootstrap_config.get("samples", 0) or 0)
+    if samples <= 0:
+        return None
+    settings = {
+        "samples": samples,
+        "confidence": float(bootstrap_config.get("confidence", 0.95)),
+        "unit": bootstrap_config.get("unit", "example"),
+        "seed": int(bootstrap_config.get("seed", 0)),
+    }
+    if settings["unit"] not in BOOTSTRAP_UNITS:
+        raise ValueError(f"Unsupported bootstrap unit: {settings['unit']}")
+    if not 0 < settings["confidence"] < 1:
+        raise ValueError(f"Bootstrap confidence must be in (0, 1): {settings['confidence']}")
+    return settings
+
+
+def line_item_settings(config: dict):
+    """
+    Reads the line-item matching settings from the `line_items` section of the configuration.
+
+    Args:
+        config (dict): Configuration dictionary.
+
+    Returns:
+        dict: 'min_similarity', or None when the section is missing or `enabled` is false.
+
+    Raises:
+        ValueError: If the minimum similarity is not in (0, 1].
+    """
+    line_items_config = config.get("line_items")
+    if line_items_config is None or not line_items_config.get("enabled", True):
+        return None
+    settings = {"min_similarity": float(line_items_config.get("min_similarity", DEFAULT_MIN_SIMILARITY))}
+    if not 0 < settings["min_similarity"] <= 1:
+        raise ValueError(f"Line-item min_similarity must be in (0, 1]: {settings['min_similarity']}")
+    return settings
+
+
+def validation_mode(config: dict) -> str:
+    """
+    Reads the schema validation mode of model outputs from the `validation` section.
+
+    Args:
+        config (dict): Configuration dictionary.
+
+    Returns:
+        str: "lenient" (the default: invalid predictions are dropped) or "strict" (a file
+             with any invalid prediction is rejected).
+
+    Raises:
+        ValueError: If the mode is not supported.
+    """
+    mode = (config.get("validation") or {}).get("mode", "lenient")
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f"Unsupported validation mode: {mode}")
+    return mode
+
+
+def _check_number(errors: list, config: dict, section: str, key: str, minimum: float = 0,
+                  integer: bool = False):
+    """Appends an error when `config[section][key]` is set but is not a number >= minimum."""
+    section_config = config.get(section) if section else config
+    if not isinstance(section_config, dict) or section_config.get(key) is None:
+        return
+    value = section_config[key]
+    name = f"{section}.{key}" if section else key
+    valid_type = int if integer else (int, float)
+    if isinstance(value, bool) or not isinstance(value, valid_type):
+        errors.append(f"'{name}' must be {'an integer' if integer else 'a number'}: {value!r}")
+    elif value < minimum:
+        errors.append(f"'{name}' must be at least {minimum}: {value!r}")
+
+
+def validate_config(config: dict) -> list:
+    """
+    Checks a configuration without importing the evaluation modules.
+
+    Checks that the data directories exist, that the metrics and the report format are
+    registered, that the bootstrap, line-item, validation and notifier settings are
+    supported and that the numeric settings are numbers in range.
+
+    Args:
+        config (dict): Configuration dictionary.
+
+    Returns:
+        list: One message per problem found (empty when the configuration is valid).
+    """
+    errors = []
+    for key, default in (("ground_truth_dir", "data/ground_truth"), ("model_outputs_dir", "data/model_outputs")):
+        directory = config.get(key, default)
+        if not os.path.isdir(directory):
+            errors.append(f"'{key}' is not a directory: {directory}")
+
+    sections = ("evaluation", "notifier", "bootstrap", "line_items", "validation", "watch", "service", "profile",
+                "cache")
+    invalid_sections = [section for section in sections
+                        if config.get(section) is not None and not isinstance(config[section], dict)]
+    if invalid_sections:
+        return errors + [f"'{section}' must be a mapping." for section in invalid_sections]
+
+    evaluation = config.get("evaluation") or {}
+    metrics = evaluation.get("metrics") or []
+    if not isinstance(metrics, list) or not metrics:
+        errors.append("'evaluation.metrics' must list at least one metric.")
+    else:
+        errors += [f"Unsupported metric: {metric}" for metric in metrics if str(metric).upper() not in EVALUATORS]
+    report_format = str(evaluation.get("format", "csv")).lower()
+    if report_format not in REPORTS:
+        errors.append(f"Unsupported report format: {report_format}")
+
+    for settings in (bootstrap_settings, line_item_settings, validation_mode):
+        try:
+            settings(config)
+        except (TypeError, ValueError) as e:
+            errors.append(str(e))
+
+    overflow = (config.get("notifier") or {}).get("overflow", "block")
+    if overflow not in OVERFLOW_POLICIES:
+        errors.append(f"Unsupported overflow policy: {overflow}")
+
+    _check_number(errors, config, None, "workers", minimum=1, integer=True)
+    _check_number(errors, config, None, "log_buffer_size", integer=True)
+    _check_number(errors, config, "notifier", "max_queue_size", minimum=1, integer=True)
+    _check_number(errors, config, "watch", "poll_interval_sec")
+    _check_number(errors, config, "watch", "debounce_sec")
+    _check_number(errors, config, "service", "port", integer=True)
+    _check_number(errors, config, "service", "workers", minimum=1, integer=True)
+    _check_number(errors, config, "service", "max_batch_size", minimum=1, integer=True)
+    _check_number(errors, config, "service", "max_batch_wait_ms")
+    _check_number(errors, config, "service", "max_queue_size", minimum=1, integer=True)
+    _check_number(errors, config, "service", "max_body_mb")
+    _check_number(errors, config, "service", "request_timeout_sec")
+    _check_number(errors, config, "profile", "max_records", minimum=1, integer=True)
+    _check_number(errors, config, "cache", "max_size_mb")
+    return errors
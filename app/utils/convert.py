@@ -0,0 +1,98 @@
+import os
+import sys
+import numpy as np
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from adapters.json_adapter import JSONAdapter
+from adapters.streaming_json_adapter import StreamingJSONAdapter
+from adapters.arrow_adapter import PARQUET_EXTENSIONS, TOTAL_COST_METADATA_KEY
+from adapters.row_store import RowStore, NUMERIC_COLUMNS, CATEGORICAL_COLUMNS
+
+
+def row_store_to_table(store: RowStore, model_output: bool = False) -> pa.Table:
+    """
+    Converts a RowStore into an Arrow table in the layout read by ArrowAdapter.
+
+    Categorical columns are written as dictionary-encoded columns, reusing the store codes.
+
+    Args:
+        store (RowStore): Rows to convert.
+        model_output (bool): Whether to add the 'prediction_id', 'valid_file_name' and
+            'time_to_estimate_sec' columns of a model output table.
+
+    Returns:
+        pa.Table: One row per line item.
+    """
+    columns = {}
+    for column in CATEGORICAL_COLUMNS:
+        codes = store.codes[column]
+        indices = pa.array(codes.astype(np.int32), mask=codes < 0)
+        dictionary = pa.array(store.categories[column].tolist(), type=pa.string())
+        columns[column] = pa.DictionaryArray.from_arrays(indices, dictionary)
+    for column in NUMERIC_COLUMNS:
+        columns[column] = pa.array(store.numeric[column], from_pandas=True)
+
+    if model_output:
+        segment_ids = store.segment_ids()
+        columns["prediction_id"] = pa.array(segment_ids)
+        columns["valid_file_name"] = pa.array(np.asarray(store.names, dtype=object)[segment_ids].tolist(),
+                                              type=pa.string()).dictionary_encode()
+        columns["time_to_estimate_sec"] = pa.array(store.times[segment_ids], from_pandas=True)
+    return pa.table(columns)
+
+
+def write_table(table: pa.Table, output_path: str):
+    """
+    Writes an Arrow table as Parquet or Arrow IPC, depending on the file extension.
+
+    Args:
+        table (pa.Table): Table to write.
+        output_path (str): Destination file (.parquet/.pq or .arrow/.feather/.ipc).
+    """
+    if os.path.splitext(output_path)[1].lower() in PARQUET_EXTENSIONS:
+        pq.write_table(table, output_path)
+        return
+    with pa.OSFile(output_path, "wb") as sink:
+        with ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def convert_ground_truth(input_path: str, output_path: str):
+    """
+    Converts a JSON ground truth file into an Arrow IPC or Parquet file.
+
+    Args:
+        input_path (str): JSON ground truth file.
+        output_path (str): Destination file.
+    """
+    adapter = JSONAdapter(input_path)
+    table = row_store_to_table(adapter.to_row_store())
+    total = adapter.get_total_cost()
+    if total is not None:
+        table = table.replace_schema_metadata({TOTAL_COST_METADATA_KEY: str(total).encode("ascii")})
+    write_table(table, output_path)
+
+
+def convert_model_output(input_path: str, output_path: str):
+    """
+    Converts a JSON model output file into an Arrow IPC or Parquet file.
+
+    Args:
+        input_path (str): JSON model output file.
+        output_path (str): Destination file.
+    """
+    store = StreamingJSONAdapter(input_path).to_model_output_store()
+    write_table(row_store_to_table(store, model_output=True), output_path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] not in ("ground_truth", "model_output"):
+        print("Usage: python -m utils.convert {ground_truth|model_output} INPUT.json OUTPUT.{parquet|arrow}")
+        sys.exit(1)
+    kind, input_path, output_path = sys.argv[1:]
+    if kind == "ground_truth":
+        convert_ground_truth(input_path, output_path)
+    else:
+        convert_model_output(input_path, output_path)
+    print(f"[CONVERT] {input_path} -> {output_path}")
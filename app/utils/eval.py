@@ -1,42 +1,159 @@
 import numpy as np
+import pandas as pd
+from adapters.row_store import RowStore
+
+
+def section_totals(data):
+    """
+    Soma 'rowTotalCostUsd' por sectionName.
+
+    Aceita um DataFrame ou um RowStore; no RowStore a soma é feita em uma única
+    passada vetorizada sobre os códigos de seção, sem groupby.
+    """
+    if isinstance(data, RowStore):
+        return data.section_totals()
+    return data.groupby("sectionName")["rowTotalCostUsd"].sum()
+
+
+def align_sections(gt_df, model_df):
+    """
+    Agrega e alinha os custos por sectionName uma única vez.
+
+    Soma 'rowTotalCostUsd' por seção no ground truth e no modelo (DataFrames ou RowStores)
+    e alinha os dois resultados sobre a união ordenada das seções, com 0 para seções
+    ausentes de um dos lados.
+
+    Retorna:
+        tuple: (sections, gt_array, model_array), com arrays float64 alinhados a sections.
+    """
+    gt_group = section_totals(gt_df)
+    model_group = section_totals(model_df)
+    sections = gt_group.index.union(model_group.index).sort_values()
+    gt_array = gt_group.reindex(sections, fill_value=0).to_numpy(dtype=np.float64)
+    model_array = model_group.reindex(sections, fill_value=0).to_numpy(dtype=np.float64)
+    return list(sections), gt_array, model_array
+
+
+def evaluate_sections(evaluators, gt_df, model_df):
+    """
+    Avalia várias métricas de uma vez sobre as mesmas seções alinhadas.
+
+    A agregação por seção é feita uma única vez (ver align_sections). Os evaluators que
+    declaram supports_aligned_arrays recebem os mesmos arrays, somente leitura, sem cópia:
+    evaluate_aligned para o score global e evaluate_elementwise para todos os scores por
+    seção em uma única chamada vetorizada. Os demais recebem cópias próprias dos arrays,
+    via evaluate para o score global, e podem modificá-las.
+
+    Retorna:
+        tuple: (global_scores, section_scores), onde global_scores mapeia cada métrica
+               ao score agregado e section_scores mapeia cada métrica a um dicionário
+               {sectionName: score}, com as seções em ordem alfabética.
+    """
+    sections, gt_array, model_array = align_sections(gt_df, model_df)
+    gt_array.flags.writeable = False
+    model_array.flags.writeable = False
+    global_scores = {}
+    section_scores = {}
+    for metric_name, evaluator in evaluators.items():
+        if getattr(evaluator, "supports_aligned_arrays", False):
+            global_scores[metric_name] = evaluator.evaluate_aligned(gt_array, model_array)
+            elementwise = evaluator.evaluate_elementwise(gt_array, model_array)
+        else:
+            global_scores[metric_name] = evaluator.evaluate(gt_array.copy(), model_array.copy())
+            elementwise = evaluator.evaluate_elementwise(gt_array.copy(), model_array.copy())
+        section_scores[metric_name] = dict(zip(sections, elementwise))
+    return global_scores, section_scores
 
 
 def evaluate_by_section(evaluator, gt_df, model_df):
     """
     Avalia os custos de forma agregada por sectionName.
     
-    Agrupa os DataFrames por 'sectionName', soma os valores de 'rowTotalCostUsd' para cada
+    Agrupa os DataFrames (ou RowStores) por 'sectionName', soma os valores de 'rowTotalCostUsd' para cada
     seção e retorna o score calculado pelo evaluator sobre os arrays agregados.
     """
-    gt_group = gt_df.groupby("sectionName")["rowTotalCostUsd"].sum()
-    model_group = model_df.groupby("sectionName")["rowTotalCostUsd"].sum()
-    all_sections = set(gt_group.index).union(set(model_group.index))
-    gt_vals = []
-    model_vals = []
-    for section in all_sections:
-        gt_val = gt_group.get(section, 0)
-        model_val = model_group.get(section, 0)
-        gt_vals.append(gt_val)
-        model_vals.append(model_val)
-    gt_array = np.array(gt_vals)
-    model_array = np.array(model_vals)
+    _, gt_array, model_array = align_sections(gt_df, model_df)
     return evaluator.evaluate(gt_array, model_array)
 
 def evaluate_by_section_per_section(evaluator, gt_df, model_df):
     """
     Avalia os custos por sectionName.
     
-    Para cada sectionName, soma os valores de 'rowTotalCostUsd' do ground truth e do modelo e 
-    retorna o score calculado pelo evaluator. Retorna um dicionário com cada sectionName e seu score.
+    Para cada sectionName, soma os valores de 'rowTotalCostUsd' do ground truth e do modelo
+    (DataFrames ou RowStores) e retorna o score calculado pelo evaluator. Retorna um dicionário
+    com cada sectionName (em ordem alfabética) e seu score.
     """
-    gt_group = gt_df.groupby("sectionName")["rowTotalCostUsd"].sum()
-    model_group = model_df.groupby("sectionName")["rowTotalCostUsd"].sum()
-    all_sections = set(gt_group.index).union(set(model_group.index))
-    section_scores = {}
-    for section in all_sections:
-        gt_val = gt_group.get(section, 0)
-        model_val = model_group.get(section, 0)
-        # Passamos arrays de um elemento para manter a interface do evaluator
-        score = evaluator.evaluate(np.array([gt_val]), np.array([model_val]))
-        section_scores[section] = score
-    return section_scores
\ No newline at end of file
+    sections, gt_array, model_array = align_sections(gt_df, model_df)
+    return dict(zip(sections, evaluator.evaluate_elementwise(gt_array, model_array)))
+
+
+def _segment_section_matrix(store: RowStore, sections: np.ndarray, value_column: str):
+    """
+    Soma value_column por (segmento, seção) em uma única passada com bincount sobre a
+    chave segmento * n_seções + seção.
+
+    Retorna:
+        tuple: (totals, present), matrizes (n_segmentos, n_seções) com as somas e com a
+               indicação das seções que aparecem em cada segmento.
+    """
+    n_sections = len(sections)
+    size = store.n_segments * n_sections
+    codes = store.codes["sectionName"]
+    present = codes >= 0
+    section_index = np.searchsorted(sections, store.categories["sectionName"])
+    keys = store.segment_ids()[present] * n_sections + section_index[codes[present]]
+    values = np.nan_to_num(store.numeric[value_column][present], nan=0.0)
+    totals = np.bincount(keys, weights=values, minlength=size).reshape(store.n_segments, n_sections)
+    counts = np.bincount(keys, minlength=size).reshape(store.n_segments, n_sections)
+    return totals, counts > 0
+
+
+def segment_section_totals(gt_store: RowStore, model_store: RowStore, value_column: str = "rowTotalCostUsd"):
+    """
+    Agrega os custos por seção separadamente para cada segmento, ou seja, para cada par
+    (exemplo, execução), sem laços em Python.
+
+    O segmento i do ground truth corresponde ao segmento i do modelo. Assim como em
+    align_sections, cada par usa a união das seções presentes nos dois lados, com 0 para
+    seções ausentes de um dos lados.
+
+    Retorna:
+        tuple: (sections, gt_matrix, model_matrix, mask), com as seções em ordem alfabética,
+               matrizes float64 (n_segmentos, n_seções) e a máscara das seções de cada par.
+    """
+    sections = np.union1d(gt_store.categories["sectionName"].astype(str),
+                          model_store.categories["sectionName"].astype(str)).astype(object)
+    gt_matrix, gt_present = _segment_section_matrix(gt_store, sections, value_column)
+    model_matrix, model_present = _segment_section_matrix(model_store, sections, value_column)
+    mask = gt_present | model_present
+    used = mask.any(axis=0)
+    return list(sections[used]), gt_matrix[:, used], model_matrix[:, used], mask[:, used]
+
+
+def evaluate_segments(evaluators, gt_store: RowStore, model_store: RowStore):
+    """
+    Avalia várias métricas para cada par (exemplo, execução) em uma única chamada
+    vetorizada por métrica (evaluate_grouped), sobre as matrizes de segment_section_totals.
+
+    Retorna:
+        dict: Mapeia cada métrica a um array com o score de cada segmento.
+    """
+    _, gt_matrix, model_matrix, mask = segment_section_totals(gt_store, model_store)
+    gt_matrix.flags.writeable = False
+    model_matrix.flags.writeable = False
+    return {metric_name: evaluator.evaluate_grouped(gt_matrix, model_matrix, mask)
+            for metric_name, evaluator in evaluators.items()}
+
+
+def run_indices(names: list) -> np.ndarray:
+    """
+    Numera as execuções de cada exemplo: o índice de cada segmento entre os segmentos de
+    mesmo nome, na ordem em que aparecem (0 para a primeira execução).
+    """
+    codes, _ = pd.factorize(pd.Series(names, dtype=object))
+    order = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes)
+    starts = np.cumsum(counts) - counts
+    runs = np.empty(len(codes), dtype=np.int64)
+    runs[order] = np.arange(len(codes)) - starts[codes[order]]
+    return runs
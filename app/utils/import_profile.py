@@ -0,0 +1,84 @@
+import re
+import sys
+import subprocess
+
+# Lines written by `python -X importtime`: "import time: <self us> | <cumulative us> | <indent><module>".
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)\s*$")
+
+
+def parse_import_time(line: str):
+    """
+    Parses a line of `python -X importtime` output.
+
+    Args:
+        line (str): A line of the interpreter's standard error.
+
+    Returns:
+        dict or None: 'module', 'self_ms', 'cumulative_ms' and 'depth' (0 for modules
+                      imported directly by the program, not by another module), or None
+                      when the line is not an import time record.
+    """
+    match = IMPORT_TIME_PATTERN.match(line)
+    if match is None:
+        return None
+    self_us, cumulative_us, indent, module = match.groups()
+    return {"module": module, "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000,
+            "depth": len(indent) // 2}
+
+
+def format_import_summary(records: list, top: int = 15) -> str:
+    """
+    Summarizes import times: total time and module count, then the slowest imports made
+    directly by the program, with the time of the modules they imported.
+
+    Args:
+        records (list): Records returned by `parse_import_time`.
+        top (int): Number of imports listed.
+
+    Returns:
+        str: The summary, one line per import.
+    """
+    total_ms = sum(record["self_ms"] for record in records)
+    slowest = sorted((record for record in records if record["depth"] == 0),
+                     key=lambda record: record["cumulative_ms"], reverse=True)[:top]
+    lines = [f"[IMPORTS] {total_ms:.1f} ms importing {len(records)} modules. Slowest top-level imports:",
+             f"{'cumulative_ms':>15} {'self_ms':>9}  module"]
+    lines += [f"{record['cumulative_ms']:>15.1f} {record['self_ms']:>9.1f}  {record['module']}" for record in slowest]
+    return "\n".join(lines)
+
+
+def profile_imports(script: str, argv: list, top: int = 15, stream=None) -> int:
+    """
+    Runs a script in a child interpreter with `-X importtime` and prints the summary of
+    its imports (see `format_import_summary`) once it exits.
+
+    The output of the script is passed through; the import time records are collected
+    from its standard error as they are written.
+
+    Args:
+        script (str): Path of the script to run.
+        argv (list): Arguments of the script.
+        top (int): Number of imports listed in the summary.
+        stream (file, optional): Where other standard error lines and the summary are
+            written. Defaults to `sys.stderr`.
+
+    Returns:
+        int: The exit status of the script.
+    """
+    stream = stream or sys.stderr
+    records = []
+    process = subprocess.Popen([sys.executable, "-X", "importtime", script, *argv],
+                               stderr=subprocess.PIPE, text=True)
+    try:
+        for line in process.stderr:
+            record = parse_import_time(line)
+            if record is not None:
+                records.append(record)
+            elif not line.startswith("import time:"):
+                stream.write(line)
+                stream.flush()
+        returncode = process.wait()
+    except KeyboardInterrupt:
+        returncode = process.wait()
+    print(format_import_summary(records, top), file=stream)
+    return returncode
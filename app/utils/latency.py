@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+from adapters.row_store import RowStore
+
+LATENCY_QUANTILES = (0.5, 0.9, 0.99)
+LATENCY_COLUMNS = ["n_predictions", "mean_sec", "p50_sec", "p90_sec", "p99_sec", "total_sec", "throughput_per_sec"]
+
+# Latency statistic used as the cost axis of the Pareto frontier.
+PARETO_COST_COLUMN = "p50_sec"
+
+
+def grouped_quantiles(values: np.ndarray, codes: np.ndarray, n_groups: int, quantiles) -> np.ndarray:
+    """
+    Computes quantiles of the values of every group in a single vectorized pass.
+
+    Values are sorted by (group, value) once. The quantiles are then read at the
+    interpolated positions of each group, with the same linear interpolation as
+    `np.quantile`. NaN values are ignored.
+
+    Args:
+        values (np.ndarray): Values to summarize.
+        codes (np.ndarray): Group of each value, in [0, n_groups).
+        n_groups (int): Number of groups.
+        quantiles (sequence): Quantiles to compute, in [0, 1].
+
+    Returns:
+        np.ndarray: Array of shape (n_groups, len(quantiles)), NaN for empty groups.
+    """
+    quantiles = np.asarray(quantiles, dtype=np.float64)
+    valid = ~np.isnan(values)
+    values, codes = values[valid], codes[valid]
+    result = np.full((n_groups, len(quantiles)), np.nan)
+    if len(values) == 0:
+        return result
+
+    sorted_values = values[np.lexsort((values, codes))]
+    counts = np.bincount(codes, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    positions = starts[:, None] + quantiles[None, :] * (counts[:, None] - 1)
+    lower = np.clip(np.floor(positions).astype(np.int64), 0, len(sorted_values) - 1)
+    upper = np.clip(np.ceil(positions).astype(np.int64), 0, len(sorted_values) - 1)
+    fraction = positions - np.floor(positions)
+    interpolated = sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+    non_empty = counts > 0
+    result[non_empty] = interpolated[non_empty]
+    return result
+
+
+def grouped_latency(times: np.ndarray, codes: np.ndarray, n_groups: int) -> dict:
+    """
+    Computes the latency statistics of every group of predictions.
+
+    Args:
+        times (np.ndarray): Estimation time of each prediction, in seconds.
+        codes (np.ndarray): Group of each prediction, in [0, n_groups).
+        n_groups (int): Number of groups.
+
+    Returns:
+        dict: Maps each name in `LATENCY_COLUMNS` to an array with one value per group.
+              Predictions without a time are ignored.
+    """
+    valid = ~np.isnan(times)
+    counts = np.bincount(codes[valid], minlength=n_groups)
+    totals = np.bincount(codes[valid], weights=times[valid], minlength=n_groups)
+    quantiles = grouped_quantiles(times, codes, n_groups, LATENCY_QUANTILES)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = totals / counts
+        throughput = np.where(totals > 0, counts / totals, np.nan)
+    return {
+        "n_predictions": counts,
+        "mean_sec": means,
+        "p50_sec": quantiles[:, 0],
+        "p90_sec": quantiles[:, 1],
+        "p99_sec": quantiles[:, 2],
+        "total_sec": np.where(counts > 0, totals, np.nan),
+        "throughput_per_sec": throughput,
+    }
+
+
+def model_latency(store: RowStore, model_file: str) -> list:
+    """
+    Computes the latency statistics of a model output file, for the whole file and
+    for each example.
+
+    Args:
+        store (RowStore): Predictions of the model file; segment times hold the
+                          'time_to_estimate_sec' and segment names the example.
+        model_file (str): Name of the model output file.
+
+    Returns:
+        list: One dict per row with 'model_file', 'valid_file_name' (None for the row
+              of the whole file) and the `LATENCY_COLUMNS`. Example rows are sorted by name.
+    """
+    times = np.asarray(store.times, dtype=np.float64)
+    codes, examples = pd.factorize(pd.Series(store.names, dtype=object), sort=True)
+    overall = grouped_latency(times, np.zeros(len(times), dtype=np.int64), 1)
+    by_example = grouped_latency(times, codes, len(examples))
+
+    rows = [{"model_file": model_file, "valid_file_name": None,
+             **{column: overall[column][0].item() for column in LATENCY_COLUMNS}}]
+    for index, example in enumerate(examples):
+        rows.append({"model_file": model_file, "valid_file_name": example,
+                     **{column: by_example[column][index].item() for column in LATENCY_COLUMNS}})
+    return rows
+
+
+def pareto_frontier(costs: np.ndarray, errors: np.ndarray) -> np.ndarray:
+    """
+    Flags the points not dominated in (cost, error), both to be minimized.
+
+    A point is on the frontier when no other point is at least as good on both axes
+    and strictly better on one. Of identical points, only one is kept. Points with a
+    NaN cost or error are never on the frontier.
+
+    Args:
+        costs (np.ndarray): Cost of each point (e.g. latency).
+        errors (np.ndarray): Error of each point (e.g. a metric score).
+
+    Returns:
+        np.ndarray: Boolean mask of the points on the frontier.
+    """
+    costs = np.asarray(costs, dtype=np.float64)
+    errors = np.asarray(errors, dtype=np.float64)
+    on_frontier = np.zeros(len(costs), dtype=bool)
+    valid = np.flatnonzero(~(np.isnan(costs) | np.isnan(errors)))
+    if len(valid) == 0:
+        return on_frontier
+
+    order = valid[np.lexsort((errors[valid], costs[valid]))]
+    sorted_errors = errors[order]
+    best_before = np.concatenate(([np.inf], np.minimum.accumulate(sorted_errors)[:-1]))
+    on_frontier[order] = sorted_errors < best_before
+    return on_frontier
+
+
+def add_latency_columns(global_df: pd.DataFrame, latency_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds the model-level latency statistics to the global results, as 'latency_*'
+    columns, and flags for each metric the models on the latency/score Pareto frontier
+    ('pareto_optimal').
+
+    Args:
+        global_df (pd.DataFrame): Global results ('model_file', 'metric', 'score').
+        latency_df (pd.DataFrame): Latency results, as returned by `model_latency`.
+
+    Returns:
+        pd.DataFrame: The global results with the latency columns, in the same row order.
+    """
+    if global_df.empty or latency_df.empty:
+        return global_df
+
+    model_latency_df = latency_df[latency_df["valid_file_name"].isna()]
+    model_latency_df = model_latency_df[["model_file"] + LATENCY_COLUMNS[1:]].rename(
+        columns={column: f"latency_{column}" for column in LATENCY_COLUMNS[1:]})
+    merged = global_df.merge(model_latency_df, on="model_file", how="left")
+
+    pareto = np.zeros(len(merged), dtype=bool)
+    cost_column = f"latency_{PARETO_COST_COLUMN}"
+    for _, rows in merged.groupby("metric", sort=False).indices.items():
+        pareto[rows] = pareto_frontier(merged[cost_column].to_numpy()[rows], merged["score"].to_numpy()[rows])
+    merged["pareto_optimal"] = pareto
+    return merged
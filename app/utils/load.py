@@ -1,31 +1,72 @@
 import os
 import logging
-from adapters.json_adapter import JSONAdapter
+import numpy as np
+from adapters.adapter_factory import get_ground_truth_adapter, SUPPORTED_EXTENSIONS
+from adapters.row_store import RowStore
+from utils.snapshot import directory_fingerprint, load_snapshot, save_snapshot
 
 def load_all_ground_truths(ground_truth_dir):
     """
     Carrega todos os arquivos de ground truth do diretório informado.
+
+    O adapter é escolhido pela extensão do arquivo (JSON, Arrow IPC/Feather ou Parquet).
     
     Retorna:
         dict: Mapeia o nome base (sem extensão) para um dicionário contendo:
-              - "adapter": instância do JSONAdapter
-              - "df": DataFrame extraído da chave 'rows'
+              - "adapter": instância do adapter usado
+              - "store": RowStore colunar com as linhas do arquivo
               - "total": totalCostUsd se disponível ou a soma dos rowTotalCostUsd
     """
     gt_map = {}
     for file_name in os.listdir(ground_truth_dir):
-        if file_name.endswith(".json"):
+        if file_name.lower().endswith(SUPPORTED_EXTENSIONS):
             file_path = os.path.join(ground_truth_dir, file_name)
             try:
-                adapter = JSONAdapter(file_path)
-                df = adapter.to_dataframe()
+                adapter = get_ground_truth_adapter(file_path)
+                store = adapter.to_row_store()
             except Exception as e:
                 logging.warning(f"Não foi possível carregar {file_path}: {e}")
                 continue
-            if "totalCostUsd" in adapter.data:
-                total = adapter.data["totalCostUsd"]
-            else:
-                total = df["rowTotalCostUsd"].sum() if "rowTotalCostUsd" in df.columns else None
+            total = adapter.get_total_cost()
+            if total is None:
+                row_totals = store.numeric["rowTotalCostUsd"]
+                total = float(np.nansum(row_totals)) if not np.isnan(row_totals).all() else None
             base_name = os.path.splitext(file_name)[0]
-            gt_map[base_name] = {"adapter": adapter, "df": df, "total": total}
-    return gt_map
\ No newline at end of file
+            store.names = [base_name]
+            gt_map[base_name] = {"adapter": adapter, "store": store, "total": total}
+    return gt_map
+
+
+def load_ground_truth_store(ground_truth_dir, snapshot_dir=None):
+    """
+    Carrega o ground truth como um único RowStore colunar, com um segmento por arquivo.
+
+    Se snapshot_dir for informado, reutiliza o snapshot compilado (arrays .npy mapeados em
+    memória) enquanto os nomes, tamanhos e mtimes dos arquivos não mudarem; caso contrário,
+    faz o parse dos arquivos JSON e regrava o snapshot. Os dados brutos de cada arquivo não
+    são mantidos em memória.
+
+    Retorna:
+        tuple: (store, totals), onde totals mapeia o nome base de cada arquivo ao seu
+               totalCostUsd (ou à soma dos rowTotalCostUsd).
+    """
+    fingerprint = None
+    if snapshot_dir:
+        fingerprint = directory_fingerprint(ground_truth_dir, SUPPORTED_EXTENSIONS)
+        snapshot = load_snapshot(snapshot_dir, fingerprint)
+        if snapshot is not None:
+            logging.info(f"Ground truth loaded from snapshot: {snapshot_dir}")
+            return snapshot
+
+    gt_map = load_all_ground_truths(ground_truth_dir)
+    names = sorted(gt_map)
+    store = RowStore.concat([gt_map[name]["store"] for name in names])
+    totals = {name: gt_map[name]["total"] for name in names}
+
+    if snapshot_dir and names:
+        try:
+            save_snapshot(snapshot_dir, store, totals, fingerprint)
+            logging.info(f"Ground truth snapshot written to: {snapshot_dir}")
+        except OSError as e:
+            logging.warning(f"Não foi possível gravar o snapshot {snapshot_dir}: {e}")
+    return store, totals
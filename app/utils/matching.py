@@ -0,0 +1,250 @@
+import re
+import numpy as np
+from adapters.row_store import RowStore
+from utils.config import DEFAULT_MIN_SIMILARITY, line_item_settings
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+MATCH_FIELDS = ("qty", "rateUsd", "rowTotalCostUsd")
+FIELD_PREFIXES = {"qty": "qty", "rateUsd": "rate", "rowTotalCostUsd": "total"}
+LINE_ITEM_COLUMNS = ["n_gt_items", "n_pred_items", "n_matched", "n_missing", "n_hallucinated",
+                     "precision", "recall", "label_similarity",
+                     "qty_mae", "qty_mape", "rate_mae", "rate_mape", "total_mae", "total_mape"]
+
+
+def tokenize_labels(labels, vocabulary: dict) -> tuple:
+    """
+    Splits each label into its distinct lowercase alphanumeric tokens.
+
+    Only distinct labels are tokenized (e.g. the categories of a RowStore), so the cost
+    does not grow with the number of rows.
+
+    Args:
+        labels (array-like): Labels to tokenize (None for missing labels).
+        vocabulary (dict): Maps each token to its id; new tokens are added to it.
+
+    Returns:
+        tuple: (token_offsets, token_ids). The tokens of label i are
+               token_ids[token_offsets[i]:token_offsets[i + 1]].
+    """
+    token_ids, lengths = [], []
+    for label in labels:
+        tokens = set(TOKEN_PATTERN.findall(str(label).lower())) if label is not None else set()
+        token_ids.extend(vocabulary.setdefault(token, len(vocabulary)) for token in tokens)
+        lengths.append(len(tokens))
+    offsets = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)]).astype(np.int64)
+    return offsets, np.array(token_ids, dtype=np.int64)
+
+
+def _row_tokens(store: RowStore, vocabulary: dict) -> tuple:
+    """
+    Expands the label tokens of every row of a store.
+
+    Returns:
+        tuple: (rows, tokens, counts): one (row, token) pair per token of each row's label
+               and the number of distinct tokens of each row.
+    """
+    offsets, token_ids = tokenize_labels(store.categories["label"], vocabulary)
+    codes = store.codes["label"]
+    label_lengths = np.append(np.diff(offsets), 0)
+    # Code -1 (missing label) indexes the trailing 0: no tokens.
+    counts = label_lengths[codes]
+    rows = np.repeat(np.arange(store.n_rows), counts)
+    starts = np.repeat(offsets[np.maximum(codes, 0)] - np.cumsum(counts) + counts, counts)
+    tokens = token_ids[starts + np.arange(len(rows))]
+    return rows, tokens, counts
+
+
+def _shared_codes(gt_store: RowStore, pred_store: RowStore, column: str, normalize=None) -> tuple:
+    """Re-encodes a categorical column of both stores on their shared, sorted values (-1 when missing)."""
+    gt_values = gt_store.categories[column].astype(str)
+    pred_values = pred_store.categories[column].astype(str)
+    if normalize is not None:
+        gt_values, pred_values = normalize(gt_values), normalize(pred_values)
+    values = np.union1d(gt_values, pred_values)
+    gt_lookup = np.append(np.searchsorted(values, gt_values), -1)
+    pred_lookup = np.append(np.searchsorted(values, pred_values), -1)
+    return values, gt_lookup[gt_store.codes[column]], pred_lookup[pred_store.codes[column]]
+
+
+def candidate_pairs(gt_store: RowStore, pred_store: RowStore, min_similarity: float = DEFAULT_MIN_SIMILARITY):
+    """
+    Finds the candidate matches between ground truth and predicted line items.
+
+    Rows are candidates when they belong to the same segment and section, have
+    compatible units of measure (equal ignoring case, or missing on one side) and a
+    label Jaccard similarity of at least `min_similarity`. Candidates are generated from
+    a token inverted index: rows are joined on (segment, section, token), so only pairs
+    sharing a label token are ever compared.
+
+    Args:
+        gt_store (RowStore): Ground truth rows, segment-aligned with `pred_store`.
+        pred_store (RowStore): Predicted rows.
+        min_similarity (float): Minimum label Jaccard similarity.
+
+    Returns:
+        tuple: (sections, gt_rows, pred_rows, similarity), with the shared section names and,
+               for each candidate, the row positions in each store and the label similarity.
+    """
+    sections, gt_sections, pred_sections = _shared_codes(gt_store, pred_store, "sectionName")
+    _, gt_uoms, pred_uoms = _shared_codes(gt_store, pred_store, "uom", np.char.upper)
+    vocabulary = {}
+    gt_token_rows, gt_tokens, gt_counts = _row_tokens(gt_store, vocabulary)
+    pred_token_rows, pred_tokens, pred_counts = _row_tokens(pred_store, vocabulary)
+    empty = np.array([], dtype=np.int64)
+    if len(gt_tokens) == 0 or len(pred_tokens) == 0:
+        return sections.tolist(), empty, empty, np.array([], dtype=np.float64)
+
+    n_sections, n_tokens = len(sections), len(vocabulary)
+    gt_blocks = gt_store.segment_ids() * n_sections + gt_sections
+    pred_blocks = pred_store.segment_ids() * n_sections + pred_sections
+    gt_keys = np.where(gt_sections[gt_token_rows] >= 0, gt_blocks[gt_token_rows] * n_tokens + gt_tokens, -1)
+    pred_keys = np.where(pred_sections[pred_token_rows] >= 0,
+                         pred_blocks[pred_token_rows] * n_tokens + pred_tokens, -2)
+
+    # Inverted index join: every (gt row, pred row) pair sharing a (block, token) key.
+    gt_order = np.argsort(gt_keys, kind="stable")
+    gt_keys, gt_token_rows = gt_keys[gt_order], gt_token_rows[gt_order]
+    left = np.searchsorted(gt_keys, pred_keys, side="left")
+    right = np.searchsorted(gt_keys, pred_keys, side="right")
+    n_matches = right - left
+    join_pred = np.repeat(pred_token_rows, n_matches)
+    join_index = np.repeat(left - np.cumsum(n_matches) + n_matches, n_matches) + np.arange(n_matches.sum())
+    join_gt = gt_token_rows[join_index]
+
+    pair_keys, shared = np.unique(join_gt * pred_store.n_rows + join_pred, return_counts=True)
+    gt_rows, pred_rows = np.divmod(pair_keys, pred_store.n_rows)
+    similarity = shared / (gt_counts[gt_rows] + pred_counts[pred_rows] - shared)
+
+    gt_uom, pred_uom = gt_uoms[gt_rows], pred_uoms[pred_rows]
+    keep = (similarity >= min_similarity) & ((gt_uom == pred_uom) | (gt_uom < 0) | (pred_uom < 0))
+    return sections.tolist(), gt_rows[keep], pred_rows[keep], similarity[keep]
+
+
+def greedy_assignment(gt_rows: np.ndarray, pred_rows: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """
+    Selects a one-to-one matching from candidate pairs, best candidates first.
+
+    Gives the same matching as accepting the candidates one by one in `order`, skipping
+    those whose rows are already matched, but works in vectorized rounds: each round
+    accepts every candidate that is the best remaining one of both its rows.
+
+    Args:
+        gt_rows (np.ndarray): Ground truth row of each candidate.
+        pred_rows (np.ndarray): Predicted row of each candidate.
+        order (np.ndarray): Candidate positions from best to worst (a strict order).
+
+    Returns:
+        np.ndarray: Positions of the accepted candidates.
+    """
+    gt_rows, pred_rows = gt_rows[order], pred_rows[order]
+    alive = np.ones(len(order), dtype=bool)
+    accepted = []
+    while alive.any():
+        candidates = np.flatnonzero(alive)
+        _, gt_first = np.unique(gt_rows[candidates], return_index=True)
+        _, pred_first = np.unique(pred_rows[candidates], return_index=True)
+        mutual = np.intersect1d(candidates[gt_first], candidates[pred_first], assume_unique=True)
+        accepted.append(mutual)
+        alive[mutual] = False
+        alive &= ~np.isin(gt_rows, gt_rows[mutual]) & ~np.isin(pred_rows, pred_rows[mutual])
+    if not accepted:
+        return np.array([], dtype=np.int64)
+    return np.sort(order[np.concatenate(accepted)])
+
+
+def match_line_items(gt_store: RowStore, pred_store: RowStore, min_similarity: float = DEFAULT_MIN_SIMILARITY):
+    """
+    Matches predicted line items to ground truth line items, inside each segment and section.
+
+    Candidates (see `candidate_pairs`) are ranked by label similarity, then by the
+    absolute difference of their totals, and assigned greedily one to one.
+
+    Args:
+        gt_store (RowStore): Ground truth rows, segment-aligned with `pred_store`.
+        pred_store (RowStore): Predicted rows.
+        min_similarity (float): Minimum label Jaccard similarity.
+
+    Returns:
+        tuple: (sections, gt_rows, pred_rows, similarity) of the matched pairs.
+    """
+    sections, gt_rows, pred_rows, similarity = candidate_pairs(gt_store, pred_store, min_similarity)
+    total_gap = np.abs(gt_store.numeric["rowTotalCostUsd"][gt_rows] - pred_store.numeric["rowTotalCostUsd"][pred_rows])
+    order = np.lexsort((pred_rows, gt_rows, np.nan_to_num(total_gap, nan=np.inf), -similarity))
+    matched = greedy_assignment(gt_rows, pred_rows, order)
+    return sections, gt_rows[matched], pred_rows[matched], similarity[matched]
+
+
+def _grouped_nanmean(values: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    """Averages the values of each group, ignoring NaN (NaN for groups without values)."""
+    valid = ~np.isnan(values)
+    totals = np.bincount(groups[valid], weights=values[valid], minlength=n_groups)
+    counts = np.bincount(groups[valid], minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, totals / counts, np.nan)
+
+
+def line_item_report(gt_store: RowStore, pred_store: RowStore, model_file: str,
+                     min_similarity: float = DEFAULT_MIN_SIMILARITY) -> list:
+    """
+    Matches the line items of a model file and summarizes the matching, for the whole
+    file and for each section.
+
+    Ground truth items without a match are missing, predicted items without a match are
+    hallucinated. For the matched items, the absolute and absolute percentage errors of
+    'qty', 'rateUsd' and 'rowTotalCostUsd' are averaged (percentage errors skip items
+    whose ground truth value is zero).
+
+    Args:
+        gt_store (RowStore): Ground truth rows, segment-aligned with `pred_store`.
+        pred_store (RowStore): Predictions of the model file.
+        model_file (str): Name of the model output file.
+        min_similarity (float): Minimum label Jaccard similarity.
+
+    Returns:
+        list: One dict per row with 'model_file', 'sectionName' (None for the row of the
+              whole file) and the `LINE_ITEM_COLUMNS`. Section rows are sorted by name.
+    """
+    sections, gt_rows, pred_rows, similarity = match_line_items(gt_store, pred_store, min_similarity)
+    _, gt_sections, pred_sections = _shared_codes(gt_store, pred_store, "sectionName")
+    n_sections = len(sections)
+    # Group n_sections collects the rows without a section; the whole file is a separate group.
+    n_groups = n_sections + 1
+    gt_groups = np.where(gt_sections >= 0, gt_sections, n_sections)
+    pred_groups = np.where(pred_sections >= 0, pred_sections, n_sections)
+    matched_groups = gt_groups[gt_rows]
+
+    stats = {
+        "n_gt_items": np.bincount(gt_groups, minlength=n_groups),
+        "n_pred_items": np.bincount(pred_groups, minlength=n_groups),
+        "n_matched": np.bincount(matched_groups, minlength=n_groups),
+        "label_similarity": _grouped_nanmean(similarity, matched_groups, n_groups),
+    }
+    overall = {name: values.sum() for name, values in stats.items() if name.startswith("n_")}
+    overall["label_similarity"] = np.mean(similarity) if len(similarity) else np.nan
+
+    all_matched = np.zeros(len(matched_groups), dtype=np.int64)
+    for field in MATCH_FIELDS:
+        truth = gt_store.numeric[field][gt_rows]
+        error = np.abs(pred_store.numeric[field][pred_rows] - truth)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            percentage = np.where(truth == 0, np.nan, error / np.abs(truth) * 100)
+        prefix = FIELD_PREFIXES[field]
+        for suffix, values in (("mae", error), ("mape", percentage)):
+            stats[f"{prefix}_{suffix}"] = _grouped_nanmean(values, matched_groups, n_groups)
+            overall[f"{prefix}_{suffix}"] = _grouped_nanmean(values, all_matched, 1)[0]
+
+    def summarize(values: dict) -> dict:
+        n_gt, n_pred, n_matched = (int(values[name]) for name in ("n_gt_items", "n_pred_items", "n_matched"))
+        summary = dict(values, n_gt_items=n_gt, n_pred_items=n_pred, n_matched=n_matched,
+                       n_missing=n_gt - n_matched, n_hallucinated=n_pred - n_matched,
+                       precision=n_matched / n_pred if n_pred else np.nan,
+                       recall=n_matched / n_gt if n_gt else np.nan)
+        return {column: summary[column] if column.startswith("n_") else float(summary[column])
+                for column in LINE_ITEM_COLUMNS}
+
+    rows = [{"model_file": model_file, "sectionName": None, **summarize(overall)}]
+    for index, section in enumerate(sections):
+        if stats["n_gt_items"][index] or stats["n_pred_items"][index]:
+            rows.append({"model_file": model_file, "sectionName": str(section),
+                         **summarize({name: values[index] for name, values in stats.items()})})
+    return rows
@@ -0,0 +1,212 @@
+import os
+import json
+import time
+import resource
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from observers.base_stage_observer import BaseStageObserver
+
+# ru_maxrss is reported in kilobytes on Linux and in bytes on macOS.
+_RSS_UNIT_BYTES = 1 if os.uname().sysname == "Darwin" else 1024
+
+# Records kept by the profiler of a long-running process (watch mode, scoring service).
+DEFAULT_MAX_RECORDS = 10000
+
+
+def peak_rss_mb() -> float:
+    """Returns the peak resident set size of the current process, in megabytes."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT_BYTES / (1024 * 1024)
+
+
+class StageProfiler:
+    """
+    Records the wall time, CPU time and memory of the stages of an evaluation run.
+
+    Each stage is measured with the `stage` context manager. Finished stages are kept
+    in `records` and passed to every registered `BaseStageObserver`. Long-running
+    processes keep only the most recent records (see `limit`).
+    """
+
+    enabled = True
+
+    def __init__(self, trace_memory: bool = False):
+        """
+        Initializes the profiler.
+
+        Args:
+            trace_memory (bool): Whether to also record the peak Python allocations of each
+                stage with tracemalloc. More precise than the peak RSS, but slows down the run.
+        """
+        self.trace_memory = trace_memory
+        self.records = []
+        self.observers = []
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def add_observer(self, observer: BaseStageObserver):
+        """
+        Adds an observer notified of every finished stage.
+
+        Args:
+            observer (BaseStageObserver): Observer instance.
+        """
+        self.observers.append(observer)
+
+    def limit(self, max_records: int):
+        """
+        Keeps only the `max_records` most recent records, so the memory of a long-running
+        process does not grow with every stage it measures.
+
+        Args:
+            max_records (int): Maximum number of records kept.
+        """
+        self.records = deque(self.records, maxlen=max_records)
+
+    @contextmanager
+    def stage(self, name: str, **fields):
+        """
+        Measures the enclosed block as a stage.
+
+        Args:
+            name (str): Name of the stage.
+            **fields: Extra fields of the record, e.g. `model_file`.
+
+        Yields:
+            dict: The record of the stage, which the block may update (e.g. with 'rows').
+        """
+        record = {"stage": name, **fields}
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_sec"] = time.perf_counter() - wall_start
+            record["cpu_sec"] = time.process_time() - cpu_start
+            record["peak_rss_mb"] = peak_rss_mb()
+            if self.trace_memory:
+                record["peak_traced_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            record["pid"] = os.getpid()
+            self.add_records([record])
+
+    def add_records(self, records: list):
+        """
+        Adds finished stage records, e.g. those measured by a worker process.
+
+        Args:
+            records (list): Stage records.
+        """
+        self.records.extend(records)
+        for record in records:
+            for observer in self.observers:
+                observer.on_stage(record)
+
+    def drain(self) -> list:
+        """
+        Returns the records measured so far and forgets them.
+
+        Returns:
+            list: Stage records.
+        """
+        records = list(self.records)
+        self.records.clear()
+        return records
+
+    def summary(self) -> dict:
+        """
+        Aggregates the records by stage name.
+
+        Returns:
+            dict: For each stage, the number of calls, the total wall and CPU times, the
+                  total rows and the maximum peak memory.
+        """
+        summary = {}
+        for record in self.records:
+            entry = summary.setdefault(record["stage"], {"calls": 0, "wall_sec": 0.0, "cpu_sec": 0.0,
+                                                         "rows": 0, "peak_rss_mb": 0.0})
+            entry["calls"] += 1
+            entry["wall_sec"] += record["wall_sec"]
+            entry["cpu_sec"] += record["cpu_sec"]
+            entry["rows"] += record.get("rows", 0)
+            entry["peak_rss_mb"] = max(entry["peak_rss_mb"], record["peak_rss_mb"])
+        return summary
+
+    def write(self, output_path: str):
+        """
+        Writes the stage records and their summary as a JSON profile.
+
+        Args:
+            output_path (str): Path of the profile file.
+        """
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as file:
+            json.dump({"summary": self.summary(), "stages": list(self.records)}, file, indent=2)
+        print(f"[PROFILE] Run profile saved at: {output_path}")
+
+
+class _NullStage:
+    """Context manager of a disabled profiler: measures nothing."""
+
+    def __enter__(self):
+        return {}
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class NullProfiler:
+    """Profiler used when profiling is disabled. Every method is a no-op."""
+
+    enabled = False
+    _STAGE = _NullStage()
+
+    def add_observer(self, observer: BaseStageObserver):
+        pass
+
+    def limit(self, max_records: int):
+        pass
+
+    def stage(self, name: str, **fields):
+        return self._STAGE
+
+    def add_records(self, records: list):
+        pass
+
+    def drain(self) -> list:
+        return []
+
+    def write(self, output_path: str):
+        pass
+
+
+def max_profile_records(config: dict) -> int:
+    """
+    Reads the number of stage records kept by long-running processes.
+
+    Args:
+        config (dict): Pipeline configuration.
+
+    Returns:
+        int: 'profile.max_records', or DEFAULT_MAX_RECORDS when not set.
+    """
+    return int((config.get("profile") or {}).get("max_records") or DEFAULT_MAX_RECORDS)
+
+
+def create_profiler(config: dict):
+    """
+    Creates the profiler described by the 'profile' section of the configuration.
+
+    Args:
+        config (dict): Pipeline configuration.
+
+    Returns:
+        StageProfiler or NullProfiler: A NullProfiler unless 'profile.enabled' is true.
+    """
+    profile_config = config.get("profile") or {}
+    if not profile_config.get("enabled", False):
+        return NullProfiler()
+    return StageProfiler(trace_memory=profile_config.get("trace_memory", False))
@@ -0,0 +1,98 @@
+import importlib
+
+
+class LazyRegistry:
+    """
+    Maps names to classes that are imported on first use.
+
+    Entries are "module:attribute" paths, so names can be listed and validated without
+    importing anything; `get` imports the module of a single entry the first time it
+    is needed. Already imported classes can also be registered directly.
+    """
+
+    def __init__(self, kind: str, entries: dict = None):
+        """
+        Initializes the registry.
+
+        Args:
+            kind (str): What the names are, used in error messages (e.g. "report format").
+            entries (dict, optional): Maps each name to a "module:attribute" path or a class.
+        """
+        self.kind = kind
+        self._entries = dict(entries or {})
+
+    def register(self, name: str, target):
+        """
+        Registers a class under a name, replacing any previous entry.
+
+        Args:
+            name (str): Name of the entry.
+            target (str or type): "module:attribute" path of the class, or the class itself.
+        """
+        self._entries[name] = target
+
+    def names(self) -> list:
+        """Names of the entries, in registration order."""
+        return list(self._entries)
+
+    def __contains__(self, name) -> bool:
+        return name in self._entries
+
+    def path(self, name: str) -> str:
+        """
+        Returns the "module:attribute" path of an entry, without importing it.
+
+        Raises:
+            ValueError: If the name is not registered.
+        """
+        target = self._entry(name)
+        return target if isinstance(target, str) else f"{target.__module__}:{target.__qualname__}"
+
+    def get(self, name: str):
+        """
+        Returns the class registered under a name, importing its module if needed.
+
+        Raises:
+            ValueError: If the name is not registered.
+        """
+        target = self._entry(name)
+        if isinstance(target, str):
+            module_name, _, attribute = target.partition(":")
+            target = getattr(importlib.import_module(module_name), attribute)
+            self._entries[name] = target
+        return target
+
+    def create(self, name: str, *args, **kwargs):
+        """Instantiates the class registered under a name with the given arguments."""
+        return self.get(name)(*args, **kwargs)
+
+    def _entry(self, name: str):
+        if name not in self._entries:
+            raise ValueError(f"Unsupported {self.kind}: {name}")
+        return self._entries[name]
+
+
+EVALUATORS = LazyRegistry("metric", {
+    "MAE": "evaluators.mae_evaluator:MAE",
+    "MRE": "evaluators.mre_evaluator:MRE",
+    "MAPE": "evaluators.mape_evaluator:MAPE",
+    "ASYMMETRIC": "evaluators.asymmetric_evaluator:AsymmetricLoss",
+})
+
+REPORTS = LazyRegistry("report format", {
+    "csv": "reports.csv_report:CSVReport",
+    "json": "reports.json_report:JSONReport",
+    "parquet": "reports.parquet_report:ParquetReport",
+    "arrow": "reports.arrow_report:ArrowReport",
+    "sqlite": "reports.sqlite_report:SQLiteReport",
+})
+
+NOTIFIERS = LazyRegistry("notifier", {
+    "sync": "observers.evaluation_notifier:EvaluationNotifier",
+    "async": "observers.async_notifier:AsyncEvaluationNotifier",
+})
+
+OBSERVERS = LazyRegistry("observer", {
+    "console": "observers.console_logger:ConsoleLogger",
+    "file": "observers.file_logger:FileLogger",
+})
@@ -0,0 +1,138 @@
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import numpy as np
+from adapters.row_store import RowStore, NUMERIC_COLUMNS, CATEGORICAL_COLUMNS
+
+# Bump when the snapshot layout changes, so older snapshots are rebuilt.
+SNAPSHOT_FORMAT_VERSION = 2
+META_FILE = "meta.json"
+
+# Snapshots are immutable: each one lives in a subdirectory named by its fingerprint and is
+# published with an atomic rename, so arrays memory-mapped by a live store are never rewritten.
+
+
+def directory_fingerprint(directory: str, extensions=(".json",)) -> str:
+    """
+    Computes a cheap fingerprint of a directory from the name, size and modification
+    time of its files, without reading their content.
+
+    Args:
+        directory (str): Directory to fingerprint.
+        extensions (tuple): Only files with these extensions are considered.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    digest = hashlib.sha256(f"v{SNAPSHOT_FORMAT_VERSION}".encode("ascii"))
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.lower().endswith(tuple(extensions)):
+            stat = os.stat(os.path.join(directory, file_name))
+            digest.update(f"{file_name}:{stat.st_size}:{stat.st_mtime_ns};".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _array_files(snapshot_dir: str) -> dict:
+    """Maps each array of a RowStore to its .npy file inside the snapshot directory."""
+    names = [f"numeric.{column}" for column in NUMERIC_COLUMNS]
+    names += [f"codes.{column}" for column in CATEGORICAL_COLUMNS]
+    names += ["offsets", "times"]
+    return {name: os.path.join(snapshot_dir, f"{name}.npy") for name in names}
+
+
+def snapshot_path(snapshot_dir: str, fingerprint: str) -> str:
+    """Returns the directory holding the snapshot of a given fingerprint."""
+    return os.path.join(snapshot_dir, fingerprint)
+
+
+def save_snapshot(snapshot_dir: str, store: RowStore, totals: dict, fingerprint: str):
+    """
+    Writes a parsed ground truth set as a snapshot: one .npy file per column plus a
+    metadata file with the segment names, totals, categories and source fingerprint.
+
+    The snapshot is written to a temporary directory and renamed to its fingerprint
+    directory once complete, so readers only ever see complete snapshots and files
+    memory-mapped by stores loaded earlier are never modified. Snapshots of other
+    fingerprints are then removed; on POSIX systems a removed file stays readable by
+    the stores that map it.
+
+    Args:
+        snapshot_dir (str): Directory of the snapshots.
+        store (RowStore): Ground truth rows, one segment per ground truth file.
+        totals (dict): Total cost of each ground truth file.
+        fingerprint (str): Fingerprint of the ground truth directory.
+    """
+    os.makedirs(snapshot_dir, exist_ok=True)
+    target_dir = snapshot_path(snapshot_dir, fingerprint)
+    if os.path.exists(os.path.join(target_dir, META_FILE)):
+        return
+
+    tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=snapshot_dir)
+    try:
+        files = _array_files(tmp_dir)
+        for column in NUMERIC_COLUMNS:
+            np.save(files[f"numeric.{column}"], store.numeric[column])
+        for column in CATEGORICAL_COLUMNS:
+            np.save(files[f"codes.{column}"], store.codes[column])
+        np.save(files["offsets"], store.offsets)
+        np.save(files["times"], store.times)
+
+        meta = {
+            "fingerprint": fingerprint,
+            "names": store.names,
+            "totals": [totals.get(name) for name in store.names],
+            "categories": {column: store.categories[column].tolist() for column in CATEGORICAL_COLUMNS},
+        }
+        with open(os.path.join(tmp_dir, META_FILE), "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+        try:
+            os.replace(tmp_dir, target_dir)
+        except OSError:
+            # Another process published the same snapshot first.
+            if not os.path.exists(os.path.join(target_dir, META_FILE)):
+                raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    for name in os.listdir(snapshot_dir):
+        path = os.path.join(snapshot_dir, name)
+        if name != fingerprint and not name.startswith(".tmp-") and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def load_snapshot(snapshot_dir: str, fingerprint: str):
+    """
+    Loads a ground truth snapshot, memory-mapping its arrays.
+
+    Args:
+        snapshot_dir (str): Directory of the snapshots.
+        fingerprint (str): Expected fingerprint of the ground truth directory.
+
+    Returns:
+        tuple: (store, totals), or None if the snapshot is missing, stale or unreadable.
+    """
+    snapshot_dir = snapshot_path(snapshot_dir, fingerprint)
+    meta_path = os.path.join(snapshot_dir, META_FILE)
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, "r", encoding="utf-8") as file:
+            meta = json.load(file)
+        if meta.get("fingerprint") != fingerprint:
+            return None
+        files = _array_files(snapshot_dir)
+        numeric = {column: np.load(files[f"numeric.{column}"], mmap_mode="r") for column in NUMERIC_COLUMNS}
+        codes = {column: np.load(files[f"codes.{column}"], mmap_mode="r") for column in CATEGORICAL_COLUMNS}
+        offsets = np.load(files["offsets"])
+        times = np.load(files["times"])
+    except (OSError, ValueError, KeyError) as e:
+        logging.warning(f"Could not read ground truth snapshot {snapshot_dir}: {e}")
+        return None
+
+    categories = {column: np.array(meta["categories"][column], dtype=object) for column in CATEGORICAL_COLUMNS}
+    store = RowStore(numeric, codes, categories, offsets, meta["names"], times)
+    totals = dict(zip(meta["names"], meta["totals"]))
+    return store, totals
@@ -0,0 +1,117 @@
+import os
+import time
+
+
+def directory_snapshot(directory: str, extensions: tuple = None) -> dict:
+    """
+    Lists the files of a directory with their modification time and size.
+
+    Hidden files and temporary files ('.tmp' in the name) are skipped, so partial
+    writes that are renamed into place are only seen once complete.
+
+    Args:
+        directory (str): Directory to list.
+        extensions (tuple, optional): Only files with these extensions are listed.
+
+    Returns:
+        dict: Maps each file name to its (mtime_ns, size) signature.
+    """
+    snapshot = {}
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return snapshot
+    for entry in entries:
+        name = entry.name
+        if name.startswith(".") or ".tmp" in name:
+            continue
+        if extensions is not None and not name.lower().endswith(tuple(extensions)):
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        if entry.is_file():
+            snapshot[name] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+class DirectoryPoller:
+    """
+    Detects new, changed and removed files of a directory by polling.
+
+    A new or changed file is only reported once its signature (modification time and
+    size) has stayed the same for `debounce_sec`, so files still being written, or
+    rewritten several times in a row, are evaluated once.
+    """
+
+    def __init__(self, directory: str, extensions: tuple = None, debounce_sec: float = 2.0, clock=time.monotonic):
+        """
+        Initializes the poller.
+
+        Args:
+            directory (str): Directory to watch.
+            extensions (tuple, optional): Only files with these extensions are watched.
+            debounce_sec (float): Time a file must stay unchanged before it is reported.
+            clock (callable): Returns the current time in seconds.
+        """
+        self.directory = directory
+        self.extensions = extensions
+        self.debounce_sec = debounce_sec
+        self.clock = clock
+        self._known = {}
+        self._pending = {}
+
+    @property
+    def files(self) -> list:
+        """Sorted names of the files reported so far (or marked by `prime`) and not removed."""
+        return sorted(self._known)
+
+    def prime(self):
+        """Marks the current files as already handled, so only later changes are reported."""
+        self._known = directory_snapshot(self.directory, self.extensions)
+        self._pending = {}
+
+    def state(self) -> tuple:
+        """Returns a copy of the tracking state, to `restore` it when handling a poll fails."""
+        return dict(self._known), dict(self._pending)
+
+    def restore(self, state: tuple):
+        """
+        Restores a state returned by `state`, so the changes reported since are reported
+        again by the next poll.
+
+        Args:
+            state (tuple): State to restore; `({}, {})` forgets every file, as if never primed.
+        """
+        self._known, self._pending = dict(state[0]), dict(state[1])
+
+    def poll(self) -> tuple:
+        """
+        Scans the directory once.
+
+        Returns:
+            tuple: (changed, removed), sorted lists of the files that are new or changed
+                   and settled, and of the files removed since they were last reported.
+        """
+        now = self.clock()
+        snapshot = directory_snapshot(self.directory, self.extensions)
+        changed = []
+        for name, signature in snapshot.items():
+            if self._known.get(name) == signature:
+                self._pending.pop(name, None)
+                continue
+            pending = self._pending.get(name)
+            if pending is None or pending[0] != signature:
+                pending = self._pending[name] = (signature, now)
+            if now - pending[1] >= self.debounce_sec:
+                changed.append(name)
+                self._known[name] = signature
+                del self._pending[name]
+
+        removed = sorted(name for name in self._known if name not in snapshot)
+        for name in removed:
+            del self._known[name]
+        for name in [name for name in self._pending if name not in snapshot]:
+            del self._pending[name]
+        return sorted(changed), removed
@@ -1,10 +1,42 @@
+import os
+import sqlite3
+from contextlib import closing
 import streamlit as st
 import pandas as pd
 import numpy as np
 import json
+import pyarrow.feather as feather
+from matplotlib import colormaps
 
-REPORT_GLOBAL_PATH = "reports/20250214_evaluation_report_global.json"
-REPORT_BY_SECTION_PATH = "reports/20250214_evaluation_report_by_section.json"
+REPORT_FORMAT = os.getenv("REPORT_FORMAT", "json")
+REPORT_BASE_PATH = os.getenv("REPORT_BASE_PATH", "reports/20250214_evaluation_report")
+REPORT_GLOBAL_PATH = f"{REPORT_BASE_PATH}_global.{REPORT_FORMAT}"
+REPORT_BY_SECTION_PATH = f"{REPORT_BASE_PATH}_by_section.{REPORT_FORMAT}"
+REPORT_SIGNIFICANCE_PATH = f"{REPORT_BASE_PATH}_significance.{REPORT_FORMAT}"
+# No formato sqlite todos os relatórios são tabelas de um único banco.
+REPORT_DATABASE_PATH = f"{REPORT_BASE_PATH}.sqlite"
+PAGE_SIZE_OPTIONS = (25, 50, 100, 200)
+
+def load_report(path: str) -> pd.DataFrame:
+    """
+    Lê um relatório de avaliação de acordo com a extensão (json, csv, parquet ou arrow).
+    Colunas dictionary-encoded dos formatos colunares são convertidas para texto.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        with open(path, 'r') as f:
+            return pd.DataFrame(json.load(f))
+    if extension == ".csv":
+        return pd.read_csv(path)
+    if extension == ".parquet":
+        df = pd.read_parquet(path)
+    elif extension == ".arrow":
+        df = feather.read_table(path, memory_map=True).to_pandas()
+    else:
+        raise ValueError(f"Unsupported report format: {extension}")
+    for column in df.select_dtypes(include="category").columns:
+        df[column] = df[column].astype(object)
+    return df
 
 def reorder_columns_by_std_desc(df: pd.DataFrame) -> pd.DataFrame:
     """Reordena as colunas pelo desvio padrão (descendente)."""
@@ -42,74 +74,262 @@ def add_ranking(df: pd.DataFrame) -> pd.DataFrame:
     df = df.sort_values("ranking").reset_index(drop=True)
     return df
 
+def report_signature(path: str) -> tuple:
+    """
+    Retorna (mtime_ns, tamanho) do arquivo, usado como chave do cache dos relatórios:
+    o relatório só é relido quando o arquivo muda em disco.
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_reports(global_path: str, section_path: str, global_signature: tuple, section_signature: tuple) -> dict:
+    """
+    Lê os relatórios global e por seção e os separa por métrica.
+    As assinaturas fazem parte da chave do cache e invalidam a leitura quando os arquivos mudam.
+    Retorna {'global': {métrica: DataFrame}, 'section': {métrica: DataFrame}}.
+    """
+    reports = {}
+    for name, path in (("global", global_path), ("section", section_path)):
+        df = load_report(path)
+        reports[name] = {} if df.empty else {metric: group for metric, group in df.groupby("metric", sort=True)}
+    return reports
+
+def query_latest_run(database_path: str, table: str, metric: str = None) -> pd.DataFrame:
+    """
+    Lê do banco SQLite apenas as linhas da execução mais recente da tabela,
+    opcionalmente filtradas pela métrica (consultas atendidas pelo índice em run_timestamp).
+    Retorna um DataFrame vazio se a tabela não existir.
+    """
+    with closing(sqlite3.connect(f"file:{database_path}?mode=ro", uri=True)) as connection:
+        exists = connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                                    (table,)).fetchone()
+        if exists is None:
+            return pd.DataFrame()
+        query = (f'SELECT * FROM "{table}" '
+                 f'WHERE run_timestamp = (SELECT MAX(run_timestamp) FROM "{table}")')
+        parameters = []
+        if metric is not None:
+            query += " AND metric = ?"
+            parameters.append(metric)
+        df = pd.read_sql_query(query + " ORDER BY rowid", connection, params=parameters)
+    return df.drop(columns=["run_timestamp"])
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_sqlite_metrics(database_path: str, signature: tuple) -> list:
+    """
+    Lista as métricas da execução mais recente das tabelas 'global' e 'by_section'
+    sem carregar os resultados. A assinatura do banco invalida o cache quando ele muda.
+    """
+    metrics = set()
+    with closing(sqlite3.connect(f"file:{database_path}?mode=ro", uri=True)) as connection:
+        for table in ("global", "by_section"):
+            exists = connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                                        (table,)).fetchone()
+            if exists is not None:
+                metrics.update(row[0] for row in connection.execute(
+                    f'SELECT DISTINCT metric FROM "{table}" '
+                    f'WHERE run_timestamp = (SELECT MAX(run_timestamp) FROM "{table}")'))
+    return sorted(metric for metric in metrics if metric is not None)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def load_sqlite_metric(database_path: str, signature: tuple, metric: str) -> dict:
+    """
+    Lê do banco SQLite somente as linhas globais e por seção da métrica selecionada.
+    Retorna {'global': DataFrame ou None, 'section': DataFrame ou None}.
+    """
+    reports = {}
+    for name, table in (("global", "global"), ("section", "by_section")):
+        df = query_latest_run(database_path, table, metric)
+        reports[name] = None if df.empty else df
+    return reports
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def build_metric_view(global_signature: tuple, section_signature: tuple, metric: str,
+                      _df_global: pd.DataFrame, _df_section: pd.DataFrame) -> dict:
+    """
+    Pré-calcula as tabelas exibidas para uma métrica: ranking global, pivot por seção,
+    ordens de colunas (desvio padrão e média) e melhor modelo por seção.
+    Os DataFrames não entram na chave do cache; as assinaturas dos arquivos e a métrica a definem.
+    """
+    view = {"global": None, "pivot": None, "column_orders": {}, "best": None}
+    if _df_global is not None and not _df_global.empty:
+        view["global"] = add_ranking(_df_global).reset_index(drop=True)
+    if _df_section is not None and not _df_section.empty:
+        pivot = _df_section.pivot_table(
+            index='model_file',
+            columns='sectionName',
+            values='score',
+            aggfunc='first'
+        ).fillna(np.nan)
+        view["pivot"] = pivot
+        view["column_orders"] = {
+            "Standard Deviation (desc)": list(reorder_columns_by_std_desc(pivot).columns),
+            "Mean (desc)": list(reorder_columns_by_mean_desc(pivot).columns),
+        }
+        view["best"] = get_best_model_by_section(_df_section)
+    return view
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_significance(path: str, signature: tuple) -> dict:
+    """
+    Lê o relatório de significância (bootstrap) e monta, por métrica, a matriz
+    modelo x outro modelo com 'p_better' (fração das reamostragens em que o modelo da
+    linha tem score menor) e a matriz booleana 'significantly_better'.
+    Retorna {métrica: (p_better, significantly_better)}.
+    """
+    if REPORT_FORMAT == "sqlite":
+        df = query_latest_run(path, "significance")
+    else:
+        df = load_report(path)
+    matrices = {}
+    for metric, group in ({} if df.empty else df.groupby("metric", sort=True)):
+        p_better = group.pivot(index="model_file", columns="other_model_file", values="p_better")
+        better = group.pivot(index="model_file", columns="other_model_file", values="significantly_better")
+        matrices[metric] = (p_better, better.astype("boolean"))
+    return matrices
+
+def top_k_table(pivot: pd.DataFrame, k_models: int, k_sections: int) -> pd.DataFrame:
+    """
+    Mantém os k_models modelos com menor score médio (ordenados do melhor para o pior)
+    e as k_sections primeiras seções na ordem atual das colunas.
+    """
+    model_means = pivot.mean(axis=1, skipna=True).sort_values(ascending=True, na_position="last")
+    return pivot.loc[model_means.index[:k_models], pivot.columns[:k_sections]]
+
+def paginate(df: pd.DataFrame, page: int, page_size: int) -> pd.DataFrame:
+    """Retorna as linhas da página (começando em 1) de tamanho page_size."""
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
+
+def gradient_styles(df: pd.DataFrame, cmap: str = "Blues_r", text_color_threshold: float = 0.408) -> pd.DataFrame:
+    """
+    Calcula, de forma vetorizada, o CSS do gradiente de cores por linha (equivalente a
+    `Styler.background_gradient(axis=1)`) apenas para as células recebidas.
+    Retorna um DataFrame de strings CSS com o mesmo formato de df.
+    """
+    values = df.to_numpy(dtype=np.float64)
+    missing = np.isnan(values)
+    row_min = np.where(missing, np.inf, values).min(axis=1, keepdims=True)
+    row_max = np.where(missing, -np.inf, values).max(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        normalized = (values - row_min) / (row_max - row_min)
+    normalized = np.where(row_max == row_min, 0.0, normalized)
+    normalized[missing] = np.nan
+
+    rgba = colormaps[cmap](np.ma.masked_invalid(normalized))
+    linear = np.where(rgba[..., :3] <= 0.04045, rgba[..., :3] / 12.92, ((rgba[..., :3] + 0.055) / 1.055) ** 2.4)
+    luminance = linear @ np.array([0.2126, 0.7152, 0.0722])
+
+    rgb = np.round(rgba[..., :3] * 255).astype(np.int64)
+    hex_colors = np.char.mod("#%06x", (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2])
+    text_colors = np.where(luminance < text_color_threshold, "#f1f1f1", "#000000")
+    css = np.char.add(np.char.add(np.char.add("background-color: ", hex_colors), "; color: "), text_colors)
+    return pd.DataFrame(css, index=df.index, columns=df.columns)
+
+def render_section_page(pivot_by_section: pd.DataFrame):
+    """
+    Exibe a tabela por seção paginada: filtro top-K de modelos e seções no servidor e
+    gradiente calculado somente para a página visível.
+    """
+    n_models, n_sections = pivot_by_section.shape
+    col_models, col_sections, col_page_size = st.columns(3)
+    k_models = col_models.number_input("Top K models (best mean score):", min_value=1,
+                                       max_value=max(n_models, 1), value=n_models, step=1)
+    k_sections = col_sections.number_input("Top K sections:", min_value=1,
+                                           max_value=max(n_sections, 1), value=n_sections, step=1)
+    page_size = col_page_size.selectbox("Rows per page:", PAGE_SIZE_OPTIONS, index=0)
+
+    table = top_k_table(pivot_by_section, int(k_models), int(k_sections))
+    n_pages = max(1, -(-len(table) // page_size))
+    page = st.number_input(f"Page (1-{n_pages}):", min_value=1, max_value=n_pages, value=1, step=1)
+
+    page_df = paginate(table, int(page), page_size)
+    styles = gradient_styles(page_df)
+    st.dataframe(page_df.style.apply(lambda _: styles, axis=None), use_container_width=True)
+
 def main():
     st.title("Take home Raphael - Handoff")
 
-    with open(REPORT_GLOBAL_PATH, 'r') as f:
-        data_global = json.load(f)
-    with open(REPORT_BY_SECTION_PATH, 'r') as f:
-        data_section = json.load(f)
-
-    df_global = pd.DataFrame(data_global)
-    df_section = pd.DataFrame(data_section)
+    if REPORT_FORMAT == "sqlite":
+        global_signature = section_signature = report_signature(REPORT_DATABASE_PATH)
+        all_metrics = load_sqlite_metrics(REPORT_DATABASE_PATH, global_signature)
+        if not all_metrics:
+            st.error("The report database is empty or contains no data.")
+            return
+        selected_metric = st.selectbox("Select Metric:", all_metrics, index=0)
+        metric_reports = load_sqlite_metric(REPORT_DATABASE_PATH, global_signature, selected_metric)
+        significance_path = REPORT_DATABASE_PATH
+    else:
+        global_signature = report_signature(REPORT_GLOBAL_PATH)
+        section_signature = report_signature(REPORT_BY_SECTION_PATH)
+        reports = load_reports(REPORT_GLOBAL_PATH, REPORT_BY_SECTION_PATH, global_signature, section_signature)
 
-    if df_global.empty or df_section.empty:
-        st.error("The JSON files are empty or contain no data.")
-        return
+        if not reports["global"] or not reports["section"]:
+            st.error("The report files are empty or contain no data.")
+            return
 
-    metrics_global = df_global['metric'].unique()
-    metrics_section = df_section['metric'].unique()
-    all_metrics = sorted(set(metrics_global).union(set(metrics_section)))
+        all_metrics = sorted(set(reports["global"]).union(set(reports["section"])))
 
-    selected_metric = st.selectbox("Select Metric:", all_metrics, index=0)
+        selected_metric = st.selectbox("Select Metric:", all_metrics, index=0)
+        metric_reports = {"global": reports["global"].get(selected_metric),
+                          "section": reports["section"].get(selected_metric)}
+        significance_path = REPORT_SIGNIFICANCE_PATH
 
-    df_global_filtered = df_global[df_global["metric"] == selected_metric]
-    df_section_filtered = df_section[df_section["metric"] == selected_metric]
+    view = build_metric_view(global_signature, section_signature, selected_metric,
+                             metric_reports["global"], metric_reports["section"])
 
     st.subheader(f"Global Table - Metric '{selected_metric}'")
-    if df_global_filtered.empty:
+    if view["global"] is None:
         st.warning(f"No data found for metric '{selected_metric}' in evaluation_report_global.json.")
     else:
-        df_global_filtered = add_ranking(df_global_filtered)
-        st.dataframe(df_global_filtered.reset_index(drop=True))
+        st.dataframe(view["global"])
 
     st.subheader(f"Table by Section - Metric '{selected_metric}'")
-    if df_section_filtered.empty:
+    if view["pivot"] is None:
         st.warning(f"No data found for metric '{selected_metric}' in evaluation_report_by_section.json.")
     else:
-        pivot_by_section = df_section_filtered.pivot_table(
-            index='model_file',
-            columns='sectionName',
-            values='score',
-            aggfunc='first'
-        ).fillna(np.nan)
-
         order_choice = st.radio(
             "Order columns by:",
-            ("Standard Deviation (desc)", "Mean (desc)"),
+            tuple(view["column_orders"]),
             index=0
         )
 
-        if order_choice == "Standard Deviation (desc)":
-            pivot_by_section = reorder_columns_by_std_desc(pivot_by_section)
-        elif order_choice == "Mean (desc)":
-            pivot_by_section = reorder_columns_by_mean_desc(pivot_by_section)
+        pivot_by_section = view["pivot"][view["column_orders"][order_choice]]
 
-        df_styled = pivot_by_section.style.background_gradient(
-            cmap='Blues_r',
-            axis=1
+        table_mode = st.radio(
+            "Table mode:",
+            ("Paginated", "Full table (HTML)"),
+            index=0,
+            horizontal=True
         )
 
-        html_table = df_styled.to_html()
-        html_container = f"<div style='overflow-x: auto; max-width: 100%; border: 1px solid #333; padding: 10px;'>{html_table}</div>"
-        st.markdown(html_container, unsafe_allow_html=True)
+        if table_mode == "Paginated":
+            render_section_page(pivot_by_section)
+        else:
+            df_styled = pivot_by_section.style.background_gradient(
+                cmap='Blues_r',
+                axis=1
+            )
+
+            html_table = df_styled.to_html()
+            html_container = f"<div style='overflow-x: auto; max-width: 100%; border: 1px solid #333; padding: 10px;'>{html_table}</div>"
+            st.markdown(html_container, unsafe_allow_html=True)
 
         st.subheader(f"Best Model by Section - Metric '{selected_metric}'")
-        if df_section_filtered.empty:
-            st.warning(f"No data found for metric '{selected_metric}' in evaluation_report_by_section.json.")
-        else:
-            best_models_df = get_best_model_by_section(df_section_filtered)
-            st.dataframe(best_models_df)
+        st.dataframe(view["best"])
+
+    if os.path.exists(significance_path):
+        significance = load_significance(significance_path, report_signature(significance_path))
+        if selected_metric in significance:
+            p_better, better = significance[selected_metric]
+            st.subheader(f"Pairwise Significance - Metric '{selected_metric}'")
+            st.caption("P(row model scores lower than column model) over the bootstrap resamples; "
+                       "highlighted cells are significantly better.")
+            highlight = better.reindex(index=p_better.index, columns=p_better.columns).fillna(False)
+            st.dataframe(p_better.style.apply(
+                lambda _: np.where(highlight.to_numpy(dtype=bool), "background-color: #c6efce", ""), axis=None
+            ).format("{:.3f}", na_rep=""), use_container_width=True)
 
 if __name__ == "__main__":
     main()